@@ -1,20 +1,88 @@
 # app.py
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-from src.db import init_db
+from src.db import create_client, init_db, warm_up_pool, check_query_plans
 from src.api.health import router as health_router
 from src.api.auth import router as auth_router
 from src.api.games import router as games_router
 from src.api.matchups import router as matchups_router
 from src.constants.fastapi import FASTAPI_TITLE, FASTAPI_VERSION, VALID_ORIGINS
+from src.config import (
+    AI_MOVE_TABLE_PATH,
+    GAME_BOARD_STORAGE,
+    JWT_DENYLIST_PATH,
+    MONGO_CHECK_QUERY_PLANS,
+    MONGO_MIN_POOL_SIZE,
+)
+from src.constants.security import TOKEN_DENYLIST_SAVE_SECONDS
+from src.dependencies import get_game_storage_migration, get_game_sessions, get_pool_metrics, get_password_hasher, get_token_denylist
+from src.services.game_sessions import GameSessionRegistry
+from src.security.denylist import TokenDenylist
+from src.utils.ai_solver import solve_all_positions
+from src.utils.move_table import load_move_table
 from src.utils.logger import logger
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    logger.info('Starting application...')
+    try:
+        app.state.mongo_client = await init_db(create_client(pool_listeners=[get_pool_metrics()]))
+        await warm_up_pool(app.state.mongo_client)
+        logger.info(f'Database initialized successfully: warm_connections={MONGO_MIN_POOL_SIZE}')
+    except Exception as e:
+        logger.critical('Failed to initialize database', exception=e)
+        raise
+    if MONGO_CHECK_QUERY_PLANS:
+        problems: List[str] = await check_query_plans()
+        if problems:
+            logger.critical(f'Unindexed query plans: {problems}')
+            raise RuntimeError(f'Unindexed query plans: {problems}')
+        logger.info('Query plans verified')
+    game_storage_migration_task: asyncio.Task[int] | None = None
+    if GAME_BOARD_STORAGE == 'compact':
+        game_storage_migration_task = asyncio.create_task(get_game_storage_migration().run())
+    game_sessions: GameSessionRegistry | None = get_game_sessions()
+    if game_sessions is not None:
+        game_sessions.start()
+        logger.info('In-memory game sessions enabled')
+    token_denylist: TokenDenylist = get_token_denylist()
+    token_denylist_task: asyncio.Task[None] = asyncio.create_task(
+        token_denylist.run_persistence(JWT_DENYLIST_PATH, TOKEN_DENYLIST_SAVE_SECONDS)
+    )
+    logger.info(f'Token denylist loaded: revoked={len(token_denylist)}, revocations are shared between workers every {TOKEN_DENYLIST_SAVE_SECONDS}s')
+    if load_move_table(AI_MOVE_TABLE_PATH):
+        logger.info(f'AI move table mapped: path={AI_MOVE_TABLE_PATH}')
+    else:
+        solved_positions: int = solve_all_positions()
+        logger.info(f'AI solver ready: positions={solved_positions}')
+    logger.info(f'Application started: {FASTAPI_TITLE} v{FASTAPI_VERSION}')
+
+    yield
+
+    logger.info('Stopping application...')
+    if game_sessions is not None:
+        await game_sessions.close()
+        logger.info('Game sessions flushed')
+    if game_storage_migration_task is not None:
+        game_storage_migration_task.cancel()
+    token_denylist_task.cancel()
+    if token_denylist.dirty:
+        token_denylist.save(JWT_DENYLIST_PATH)
+    get_password_hasher().shutdown()
+    app.state.mongo_client.close()
+    logger.info('Database connections closed')
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title=FASTAPI_TITLE, version=FASTAPI_VERSION)
+    app = FastAPI(title=FASTAPI_TITLE, version=FASTAPI_VERSION, lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -24,17 +92,6 @@ def create_app() -> FastAPI:
         allow_headers=['*'],
     )
 
-    @app.on_event('startup')
-    async def on_startup():
-        logger.info('Starting application...')
-        try:
-            await init_db()
-            logger.info('Database initialized successfully')
-        except Exception as e:
-            logger.critical('Failed to initialize database', exception=e)
-            raise
-        logger.info(f'Application started: {FASTAPI_TITLE} v{FASTAPI_VERSION}')
-
     app.include_router(health_router, prefix='/api')
     app.include_router(auth_router, prefix='/api')
     app.include_router(games_router, prefix='/api')
@@ -0,0 +1,17 @@
+import asyncio
+
+from src.db import init_db
+from src.services.active_game_backfill import ActiveGameBackfill
+
+
+async def main_async() -> None:
+    print('🔗 Connecting DB and initializing Beanie...')
+    await init_db()
+    print('🎯 Pointing existing matchups at their newest game...')
+    backfill: ActiveGameBackfill = ActiveGameBackfill()
+    backfilled: int = await backfill.run()
+    print(f'✔ Backfilled {backfilled} matchups in {backfill.batches} batches')
+
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
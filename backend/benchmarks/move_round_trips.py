@@ -0,0 +1,104 @@
+"""
+Counts MongoDB round trips per move for the legacy read/read/save flow and the
+conditional find_one_and_update flow, plus the cost of a game-winning move.
+
+Usage (from backend/, against a disposable database):
+    MONGO_DB_NAME=tictactoe_bench python -m benchmarks.move_round_trips
+"""
+import asyncio
+from typing import List
+
+from beanie import PydanticObjectId, init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from src.config import MONGO_URI, MONGO_DB_NAME
+from src.dal.games import GamesDAL
+from src.dal.matchups import MatchupsDAL
+from src.models.games import GameDocument
+from src.models.matchups import MatchupDocument, MatchMode
+from src.models.moves import MoveDocument
+from src.models.users import UserDocument
+from src.services.ai import AIService
+from src.services.game import GameService
+
+
+MOVES: List[int] = [4, 0, 8, 2, 1, 7, 6, 3, 5]
+WINNING_MOVES: List[int] = [0, 3, 1, 4, 2]
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in ('endSessions', 'hello', 'isMaster', 'ping'):
+            self.count += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+async def legacy_move(games_dal: GamesDAL, game_id: str, player_id: int, cell_index: int) -> None:
+    game: GameDocument = await games_dal.get_game_by_id(game_id)
+    board = game.board.copy()
+    board[cell_index] = player_id
+    stored: GameDocument = await games_dal.model.get(game_id)
+    stored.board = board
+    stored.current_turn = 1 if player_id == 2 else 2
+    await stored.save()
+
+
+async def main_async() -> None:
+    counter: CommandCounter = CommandCounter()
+    client: AsyncIOMotorClient = AsyncIOMotorClient(MONGO_URI, event_listeners=[counter])
+    await init_beanie(
+        database=client[MONGO_DB_NAME],
+        document_models=[UserDocument, GameDocument, MatchupDocument, MoveDocument]
+    )
+
+    matchups_dal: MatchupsDAL = MatchupsDAL()
+    games_dal: GamesDAL = GamesDAL()
+    game_service: GameService = GameService(matchups_dal=matchups_dal, games_dal=games_dal, ai_service=AIService())
+    matchup: MatchupDocument = await matchups_dal.create_matchup(
+        user_id=PydanticObjectId(),
+        player1_name='X',
+        player2_name='O',
+        mode=MatchMode.friend,
+    )
+
+    legacy_game: GameDocument = await games_dal.create_game(matchup.id, starting_player=1)
+    counter.count = 0
+    for ply, cell_index in enumerate(MOVES[:7]):
+        await legacy_move(games_dal, str(legacy_game.id), 1 if ply % 2 == 0 else 2, cell_index)
+    legacy_round_trips: float = counter.count / 7
+
+    game: GameDocument = await games_dal.create_game(matchup.id, starting_player=1)
+    counter.count = 0
+    for ply, cell_index in enumerate(MOVES[:7]):
+        await game_service.player_move(str(game.id), 1 if ply % 2 == 0 else 2, cell_index)
+    atomic_round_trips: float = counter.count / 7
+
+    winning_game: GameDocument = await games_dal.create_game(matchup.id, starting_player=1)
+    for ply, cell_index in enumerate(WINNING_MOVES[:-1]):
+        await game_service.player_move(str(winning_game.id), 1 if ply % 2 == 0 else 2, cell_index)
+    counter.count = 0
+    await game_service.player_move(str(winning_game.id), 1, WINNING_MOVES[-1])
+    winning_round_trips: int = counter.count
+
+    print(f'legacy read/read/save:           {legacy_round_trips:.1f} round trips per move')
+    print(f'conditional find_one_and_update: {atomic_round_trips:.1f} round trips per move')
+    print(f'winning move with $inc score:    {winning_round_trips} round trips')
+
+    await MatchupDocument.find(MatchupDocument.id == matchup.id).delete()
+    game_ids: List[PydanticObjectId] = [legacy_game.id, game.id, winning_game.id]
+    await MoveDocument.find({'game_id': {'$in': game_ids}}).delete()
+    await GameDocument.find(GameDocument.matchup_id == matchup.id).delete()
+    client.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
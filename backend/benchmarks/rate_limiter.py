@@ -0,0 +1,91 @@
+"""
+Measures memory and per-check latency of the sliding-window counter against the per-key
+timestamp deques it replaced, with one million distinct clients hitting one route, plus the
+latency of the shared-memory table used with RATE_LIMIT_BACKEND=shared.
+
+Usage (from backend/):
+    python -m benchmarks.rate_limiter
+"""
+from collections import deque
+from time import monotonic, perf_counter
+from typing import Callable, Deque, Dict, List
+import os
+import tempfile
+import tracemalloc
+
+from src.constants.fastapi import RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS
+from src.utils.sliding_window import SlidingWindowCounter
+from src.utils.shared_window import SharedWindowCounter, SharedWindowTable
+
+
+CLIENTS: int = 1_000_000
+REQUESTS_PER_CLIENT: int = 3
+ROUTE_PATH: str = '/games/{game_id}/move'
+# Two slots per client, so the shared table measures lookups rather than evictions
+SHARED_TABLE_SLOTS: int = 2 * CLIENTS
+
+
+class LegacyLimiter:
+    """The previous limiter: one deque of request timestamps per key, never removed."""
+
+    def __init__(self) -> None:
+        self.requests_log: Dict[str, Deque[float]] = {}
+
+    def hit(self, key: str) -> float | None:
+        now: float = monotonic()
+        bucket: Deque[float] = self.requests_log.setdefault(key, deque())
+        while bucket and now - bucket[0] > RATE_LIMIT_WINDOW_SECONDS:
+            bucket.popleft()
+        if len(bucket) >= RATE_LIMIT_MAX_REQUESTS:
+            return RATE_LIMIT_WINDOW_SECONDS
+        bucket.append(now)
+        return None
+
+
+def run(hit: Callable[[str], float | None], keys: List[str]) -> None:
+    for _ in range(REQUESTS_PER_CLIENT):
+        for key in keys:
+            hit(key)
+
+
+def measure(name: str, factory: Callable[[], Callable[[str], float | None]], keys: List[str]) -> None:
+    """Times one run untraced, then traces allocations of a second, fresh run."""
+    started: float = perf_counter()
+    run(factory(), keys)
+    elapsed: float = perf_counter() - started
+
+    tracemalloc.start()
+    hit: Callable[[str], float | None] = factory()
+    run(hit, keys)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hit
+
+    checks: int = len(keys) * REQUESTS_PER_CLIENT
+    print(f'{name:<24} {memory / 1024 / 1024:8.1f} MiB {memory / len(keys):8.1f} B/client {elapsed / checks * 1e9:8.0f} ns/check')
+
+
+def main() -> None:
+    keys: List[str] = [f'10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}:{ROUTE_PATH}' for i in range(CLIENTS)]
+    print(f'{CLIENTS} clients, {REQUESTS_PER_CLIENT} requests each (key strings excluded from memory)')
+
+    measure('timestamp deques', lambda: LegacyLimiter().hit, keys)
+    measure(
+        'sliding window counter',
+        lambda: SlidingWindowCounter(RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS).hit,
+        keys
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        table: SharedWindowTable = SharedWindowTable(f'{directory}/rate_limit.bin', SHARED_TABLE_SLOTS)
+        measure(
+            'shared table (mapped)',
+            lambda: SharedWindowCounter(table, 'default', RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS).hit,
+            keys
+        )
+        print(f'shared table file: {os.path.getsize(table.path) / 1024 / 1024:.1f} MiB, fixed')
+        table.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import sys
+
+from src.config import AI_MOVE_TABLE_PATH
+from src.utils.ai_solver import solve_best_move
+from src.utils.bitboard import BASE3_STATES, from_base3
+from src.utils.move_table import (
+    encode_move_table,
+    write_move_table,
+    load_move_table,
+    lookup_move,
+    unload_move_table,
+)
+
+
+def build(path: str) -> None:
+    print('🧠 Solving all positions...')
+    table: bytes = encode_move_table(solve_best_move)
+    write_move_table(path, table)
+    print(f'✔ Wrote {len(table)} entries to {path}')
+
+
+def verify(path: str) -> bool:
+    print(f'🔍 Verifying {path} against the live solver...')
+    if not load_move_table(path):
+        print('✖ Move table is missing or malformed')
+        return False
+
+    mismatches: int = 0
+    for code in range(BASE3_STATES):
+        bitboard = from_base3(code)
+        for player_id in (1, 2):
+            if lookup_move(bitboard, player_id) != solve_best_move(bitboard, player_id):
+                mismatches += 1
+    unload_move_table()
+
+    if mismatches:
+        print(f'✖ {mismatches} entries differ from the solver')
+        return False
+    print(f'✔ All {BASE3_STATES * 2} entries match the solver')
+    return True
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Build or verify the precomputed AI move table')
+    parser.add_argument('command', choices=['build', 'verify'])
+    parser.add_argument('--path', default=AI_MOVE_TABLE_PATH)
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.command == 'build':
+        build(args.path)
+    elif not verify(args.path):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+import asyncio
+import sys
+from typing import List
+
+from src.db import init_db, check_query_plans
+
+
+async def main_async() -> bool:
+    print('🔗 Connecting DB and initializing Beanie...')
+    await init_db()
+    print('🔍 Explaining DAL queries...')
+    problems: List[str] = await check_query_plans()
+    if problems:
+        for problem in problems:
+            print(f'✖ {problem}')
+        return False
+    print('✔ All DAL queries are index-backed')
+    return True
+
+
+if __name__ == '__main__':
+    if not asyncio.run(main_async()):
+        sys.exit(1)
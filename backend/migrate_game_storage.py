@@ -0,0 +1,17 @@
+import asyncio
+
+from src.db import init_db
+from src.services.game_storage_migration import GameStorageMigration
+
+
+async def main_async() -> None:
+    print('🔗 Connecting DB and initializing Beanie...')
+    await init_db()
+    print('📦 Rewriting array-format games into the compact format...')
+    migration: GameStorageMigration = GameStorageMigration()
+    migrated: int = await migration.run()
+    print(f'✔ Migrated {migrated} games in {migration.batches} batches')
+
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
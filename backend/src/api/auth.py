@@ -1,29 +1,52 @@
+from typing import Any, Dict
+
 from fastapi import APIRouter, HTTPException, Depends
 from pymongo.errors import DuplicateKeyError
 
-from src.models.auth import LoginRequest, LoginResponse, LogoutResponse
+from src.models.auth import (
+    LoginRequest,
+    LoginResponse,
+    LogoutRequest,
+    LogoutResponse,
+    RefreshRequest,
+    RefreshResponse,
+)
 from src.models.users import UserDocument
 from src.dal.users import UsersDAL
-from src.dependencies import get_users_dal
-from src.security.password import hash_password, verify_password
-from src.security.auth import create_access_token, get_current_user
-from src.utils.rate_limit import rate_limiter
+from src.dependencies import get_users_dal, get_password_hasher
+from src.exceptions import PasswordHasherOverloadedError
+from src.security.password import PasswordHasher
+from src.constants.security import REFRESH_TOKEN_TYPE
+from src.security.auth import (
+    create_access_token,
+    create_refresh_token,
+    consume_token,
+    decode_token,
+    get_current_user,
+    oauth2_scheme,
+    revoke_token,
+)
+from src.utils.rate_limit import auth_rate_limiter, rate_limiter
 from src.utils.logger import logger
 
 
 router: APIRouter = APIRouter(prefix='/auth', dependencies=[Depends(rate_limiter)])
 
 
-@router.post('/register', response_model=LoginResponse)
+@router.post('/register', response_model=LoginResponse, dependencies=[Depends(auth_rate_limiter)])
 async def register(
     payload: LoginRequest,
-    users_dal: UsersDAL = Depends(get_users_dal)
+    users_dal: UsersDAL = Depends(get_users_dal),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ):
     logger.info(f'Registration attempt: email={payload.email}')
     try:
-        password_hash: str = hash_password(payload.password)
+        password_hash: str = await password_hasher.hash(payload.password)
         user: UserDocument = await users_dal.create_user(payload.email, password_hash)
         logger.info(f'User registered successfully: user_id={user.id}, email={payload.email}')
+    except PasswordHasherOverloadedError as e:
+        logger.warning(f'Registration rejected: {str(e)}')
+        raise HTTPException(status_code=503, detail='Too many sign-in attempts, try again shortly', headers={'Retry-After': '1'})
     except DuplicateKeyError:
         logger.warning(f'Registration failed: email already exists: {payload.email}')
         raise HTTPException(
@@ -32,24 +55,33 @@ async def register(
         )
     
     access_token: str = create_access_token(subject=str(user.id))
+    refresh_token: str = create_refresh_token(subject=str(user.id))
 
     return LoginResponse(
         ok=True,
         user=user,
         accessToken=access_token,
+        refreshToken=refresh_token,
         tokenType='bearer'
     )
 
 
-@router.post('/login', response_model=LoginResponse)
+@router.post('/login', response_model=LoginResponse, dependencies=[Depends(auth_rate_limiter)])
 async def login(
     payload: LoginRequest,
-    users_dal: UsersDAL = Depends(get_users_dal)
+    users_dal: UsersDAL = Depends(get_users_dal),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ):
     logger.info(f'Login attempt: email={payload.email}')
     user: UserDocument | None = await users_dal.get_user_by_email(payload.email)
 
-    if not user or not verify_password(payload.password, user.password):
+    try:
+        password_ok: bool = user is not None and await password_hasher.verify(payload.password, user.password)
+    except PasswordHasherOverloadedError as e:
+        logger.warning(f'Login rejected: {str(e)}')
+        raise HTTPException(status_code=503, detail='Too many sign-in attempts, try again shortly', headers={'Retry-After': '1'})
+
+    if not password_ok:
         logger.warning(f'Login failed: invalid credentials for email={payload.email}')
         raise HTTPException(
             status_code=401,
@@ -57,19 +89,61 @@ async def login(
         )
 
     access_token: str = create_access_token(subject=str(user.id))
+    refresh_token: str = create_refresh_token(subject=str(user.id))
     logger.info(f'User logged in successfully: user_id={user.id}, email={payload.email}')
 
     return LoginResponse(
         ok=True,
         user=user,
         accessToken=access_token,
+        refreshToken=refresh_token,
+        tokenType='bearer'
+    )
+
+
+@router.post('/refresh', response_model=RefreshResponse)
+async def refresh(payload: RefreshRequest, users_dal: UsersDAL = Depends(get_users_dal)):
+    # Trusts the signed refresh token instead of the password, so no bcrypt; the user usually comes from the cache
+    claims: Dict[str, Any] = decode_token(payload.refreshToken, REFRESH_TOKEN_TYPE)
+    # Consumed before the first await, so a refresh token is exchanged at most once
+    if not consume_token(claims):
+        logger.warning(f'Refresh failed: token already used: user_id={claims["sub"]}')
+        raise HTTPException(
+            status_code=401,
+            detail='Could not validate credentials',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+    user: UserDocument | None = await users_dal.get_user_by_id(claims['sub'])
+    if user is None:
+        logger.warning(f'Refresh failed: user not found: user_id={claims["sub"]}')
+        raise HTTPException(
+            status_code=401,
+            detail='Could not validate credentials',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+    logger.info(f'Tokens refreshed: user_id={claims["sub"]}')
+
+    return RefreshResponse(
+        ok=True,
+        accessToken=create_access_token(subject=claims['sub']),
+        refreshToken=create_refresh_token(subject=claims['sub']),
         tokenType='bearer'
     )
 
 @router.post('/logout', response_model=LogoutResponse)
 async def logout(
+    payload: LogoutRequest | None = None,
+    token: str = Depends(oauth2_scheme),
     current_user: UserDocument = Depends(get_current_user)
 ):
+    revoke_token(decode_token(token))
+    if payload is not None and payload.refreshToken is not None:
+        try:
+            refresh_claims: Dict[str, Any] = decode_token(payload.refreshToken, REFRESH_TOKEN_TYPE)
+            if refresh_claims['sub'] == str(current_user.id):
+                revoke_token(refresh_claims)
+        except HTTPException:
+            logger.warning(f'Logout with an invalid refresh token: user_id={current_user.id}')
     logger.info(f'User logged out: user_id={current_user.id}, email={current_user.email}')
     return LogoutResponse(
         ok=True,
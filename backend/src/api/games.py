@@ -1,15 +1,18 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException
-from src.security.auth import get_current_user
-from src.models.users import UserDocument
+from src.security.auth import get_current_user_id
 from src.dependencies import get_game_service
 from src.services.game import GameService
 from src.models.responses import UpdateResponse
 from src.models.games import GameDocument
+from src.models.moves import GameReplay, MoveEntry
 from src.exceptions import (
     GameNotFoundError,
     MatchupNotFoundError,
     InvalidMoveError,
-    GameFinishedError
+    GameFinishedError,
+    MoveConflictError
 )
 from beanie import PydanticObjectId
 from src.utils.rate_limit import rate_limiter
@@ -23,7 +26,7 @@ async def create_new_game(
     matchup_id: str,
     starting_player: int,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user)
+    current_user_id: PydanticObjectId = Depends(get_current_user_id)
 ):
     logger.info(f'Create new game: matchup_id={matchup_id}, starting_player={starting_player}')
     return await game_service.create_independent_new_game(matchup_id, starting_player)
@@ -35,15 +38,16 @@ async def player_move(
     player_id: int,
     cell_index: int | None = None,
     is_ai_move: bool = False,
+    with_ai_reply: bool = False,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user)
+    current_user_id: PydanticObjectId = Depends(get_current_user_id)
 ):
-    logger.info(f'Player move request: game_id={game_id}, player_id={player_id}, cell_index={cell_index}, is_ai_move={is_ai_move}')
+    logger.info(f'Player move request: game_id={game_id}, player_id={player_id}, cell_index={cell_index}, is_ai_move={is_ai_move}, with_ai_reply={with_ai_reply}')
     try:
         if is_ai_move:
             return await game_service.ai_move(game_id, player_id)
         elif cell_index is not None:
-            return await game_service.player_move(game_id, player_id, cell_index)
+            return await game_service.player_move(game_id, player_id, cell_index, with_ai_reply)
         else:
             raise InvalidMoveError('Cell index is required')
     except (GameNotFoundError, MatchupNotFoundError) as e:
@@ -52,6 +56,9 @@ async def player_move(
     except (InvalidMoveError, GameFinishedError) as e:
         logger.warning(f'Invalid move or game finished: {str(e)}')
         raise HTTPException(status_code=400, detail=str(e))
+    except MoveConflictError as e:
+        logger.warning(f'Move conflict: {str(e)}')
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         logger.error(f'Unexpected error in player_move: {str(e)}', exception=e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -61,7 +68,7 @@ async def player_move(
 async def get_last_game_for_matchup(
     matchup_id: PydanticObjectId,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user)
+    current_user_id: PydanticObjectId = Depends(get_current_user_id)
 ):
     logger.info(f'Get last game for matchup: matchup_id={matchup_id}')
     try:
@@ -78,3 +85,34 @@ async def get_last_game_for_matchup(
         logger.error(f'Unexpected error in get_last_game_for_matchup: {str(e)}', exception=e)
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get('/{game_id}/moves', response_model=List[MoveEntry])
+async def get_game_moves(
+    game_id: str,
+    game_service: GameService = Depends(get_game_service),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id)
+):
+    logger.info(f'Get game moves: game_id={game_id}')
+    try:
+        return await game_service.get_game_moves(game_id)
+    except GameNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get('/{game_id}/replay', response_model=GameReplay)
+async def replay_game(
+    game_id: str,
+    ply: int | None = None,
+    game_service: GameService = Depends(get_game_service),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id)
+):
+    logger.info(f'Replay game: game_id={game_id}, ply={ply}')
+    try:
+        return await game_service.replay_game(game_id, ply)
+    except GameNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidMoveError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ValueError as e:
+        logger.error(f'Move log cannot be replayed: game_id={game_id}, ply={ply}', exception=e)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,5 +1,19 @@
-from fastapi import APIRouter
-from typing import Dict
+from fastapi import APIRouter, Depends
+from typing import Any, Dict
+
+from src.dependencies import get_ai_service, get_ai_prefetcher, get_game_storage_migration, get_game_sessions, get_games_cache, get_users_cache, get_pool_metrics, get_password_hasher, get_token_denylist
+from src.dal.games import GamesCache
+from src.models.users import UserDocument
+from src.utils.lru_cache import LRUCache
+from src.services.ai import AIService
+from src.services.ai_prefetch import AIMovePrefetcher
+from src.services.game_storage_migration import GameStorageMigration
+from src.services.game_sessions import GameSessionRegistry
+from src.utils.pool_metrics import PoolMetrics
+from src.security.password import PasswordHasher
+from src.security.denylist import TokenDenylist
+from src.utils.rate_limit import rate_limiters
+from src.config import MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE
 
 router = APIRouter(prefix='/health')
 
@@ -7,3 +21,64 @@ router = APIRouter(prefix='/health')
 @router.get('')
 async def health() -> Dict[str, str]:
     return {'status': 'ok'}
+
+
+@router.get('/ai')
+async def ai_health(
+    ai_service: AIService = Depends(get_ai_service),
+    ai_prefetcher: AIMovePrefetcher = Depends(get_ai_prefetcher)
+) -> Dict[str, Dict[str, Any]]:
+    return {
+        'move_cache': ai_service.cache_stats(),
+        'circuit_breaker': ai_service.circuit_breaker_stats(),
+        'single_flight': ai_service.single_flight_stats(),
+        'prefetch': ai_prefetcher.stats(),
+    }
+
+
+@router.get('/storage')
+async def storage_health(
+    game_storage_migration: GameStorageMigration = Depends(get_game_storage_migration)
+) -> Dict[str, Dict[str, Any]]:
+    return {'game_storage_migration': game_storage_migration.stats()}
+
+
+@router.get('/cache')
+async def cache_health(
+    games_cache: GamesCache = Depends(get_games_cache),
+    users_cache: LRUCache[str, UserDocument] = Depends(get_users_cache)
+) -> Dict[str, Dict[str, Any]]:
+    return {'games': games_cache.stats(), 'users': users_cache.stats()}
+
+
+@router.get('/sessions')
+async def sessions_health(
+    game_sessions: GameSessionRegistry | None = Depends(get_game_sessions)
+) -> Dict[str, Dict[str, Any] | None]:
+    return {'game_sessions': game_sessions.stats() if game_sessions is not None else None}
+
+
+@router.get('/db')
+async def db_health(
+    pool_metrics: PoolMetrics = Depends(get_pool_metrics)
+) -> Dict[str, Dict[str, Any]]:
+    return {
+        'pool': {
+            'max_size': MONGO_MAX_POOL_SIZE,
+            'min_size': MONGO_MIN_POOL_SIZE,
+            **pool_metrics.stats(),
+        },
+    }
+
+
+@router.get('/auth')
+async def auth_health(
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    token_denylist: TokenDenylist = Depends(get_token_denylist)
+) -> Dict[str, Dict[str, int]]:
+    return {'password_hasher': password_hasher.stats(), 'token_denylist': token_denylist.stats()}
+
+
+@router.get('/rate_limit')
+async def rate_limit_health() -> Dict[str, Dict[str, int | float]]:
+    return {limiter.name: limiter.stats() for limiter in rate_limiters}
@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
-from src.security.auth import get_current_user
-from src.models.users import UserDocument
+from fastapi import APIRouter, Depends, HTTPException, Query
+from src.security.auth import get_current_user_id
 from src.dependencies import get_game_service
 from src.services.game import GameService
 from src.models.responses import UpdateResponse
-from src.exceptions import MatchupNotFoundError
-from src.models.matchups import MatchupDocument
-from typing import List
+from src.exceptions import MatchupNotFoundError, InvalidMatchupError, InvalidCursorError
+from beanie import PydanticObjectId
+from src.models.matchups import MatchupsPage
+from src.models.games import GamesPage
+from src.constants.pagination import (
+    MATCHUPS_PAGE_SIZE_DEFAULT,
+    MATCHUPS_PAGE_SIZE_MAX,
+    GAMES_PAGE_SIZE_DEFAULT,
+    GAMES_PAGE_SIZE_MAX,
+)
 from src.utils.rate_limit import rate_limiter
 from src.utils.logger import logger
 
@@ -19,36 +25,67 @@ async def create_new_matchup(
     player2_name: str,
     mode: str,
     starting_player: int,
+    ai_engine: str | None = None,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id),
 ):
-    logger.info(f'Create new matchup request: user_id={current_user.id}, player1={player1_name}, player2={player2_name}, mode={mode}')
-    return await game_service.create_new_matchup(
-        current_user.id,
-        player1_name,
-        player2_name,
-        mode,
-        starting_player,
-    )
+    logger.info(f'Create new matchup request: user_id={current_user_id}, player1={player1_name}, player2={player2_name}, mode={mode}, ai_engine={ai_engine}')
+    try:
+        return await game_service.create_new_matchup(
+            current_user_id,
+            player1_name,
+            player2_name,
+            mode,
+            starting_player,
+            ai_engine,
+        )
+    except InvalidMatchupError as e:
+        logger.warning(f'Invalid matchup request: {str(e)}')
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get('/list', response_model=List[MatchupDocument])
+@router.get('/list', response_model=MatchupsPage)
 async def get_matchups_list(
+    limit: int = Query(MATCHUPS_PAGE_SIZE_DEFAULT, ge=1, le=MATCHUPS_PAGE_SIZE_MAX),
+    cursor: str | None = None,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id),
 ):
-    logger.info(f'Get matchups list request: user_id={current_user.id}')
-    return await game_service.get_matchups_list_for_user(current_user.id)
+    logger.info(f'Get matchups list request: user_id={current_user_id}, limit={limit}, cursor={cursor}')
+    try:
+        return await game_service.get_matchups_page_for_user(current_user_id, limit, cursor)
+    except InvalidCursorError as e:
+        logger.warning(f'Invalid matchups list cursor: {str(e)}')
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get('/{matchup_id}', response_model=UpdateResponse)
 async def get_matchup(
-    matchup_id: str,
+    matchup_id: PydanticObjectId,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id),
 ):
-    logger.info(f'Get matchup request: matchup_id={matchup_id}, user_id={current_user.id}')
-    return await game_service.get_matchup_active_game(matchup_id)
+    logger.info(f'Get matchup request: matchup_id={matchup_id}, user_id={current_user_id}')
+    try:
+        return await game_service.get_matchup_active_game(matchup_id)
+    except MatchupNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get('/{matchup_id}/games', response_model=GamesPage)
+async def get_matchup_games(
+    matchup_id: PydanticObjectId,
+    limit: int = Query(GAMES_PAGE_SIZE_DEFAULT, ge=1, le=GAMES_PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    game_service: GameService = Depends(get_game_service),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id),
+):
+    logger.info(f'Get matchup games request: matchup_id={matchup_id}, limit={limit}, cursor={cursor}')
+    try:
+        return await game_service.get_games_page_for_matchup(matchup_id, limit, cursor)
+    except InvalidCursorError as e:
+        logger.warning(f'Invalid matchup games cursor: {str(e)}')
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.put('/{matchup_id}/update_player_name', response_model=UpdateResponse)
@@ -57,7 +94,7 @@ async def update_player_name(
     player_id: int,
     name: str,
     game_service: GameService = Depends(get_game_service),
-    current_user: UserDocument = Depends(get_current_user),
+    current_user_id: PydanticObjectId = Depends(get_current_user_id),
 ):
     logger.info(f'Update player name request: matchup_id={matchup_id}, player_id={player_id}, new_name={name}')
     try:
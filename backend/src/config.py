@@ -6,9 +6,27 @@ load_dotenv()
 
 MONGO_URI: Final[str] = os.getenv('MONGO_URI')
 MONGO_DB_NAME: Final[str] = os.getenv('MONGO_DB_NAME', 'tic_tac_toe')
+MONGO_CHECK_QUERY_PLANS: Final[bool] = os.getenv('MONGO_CHECK_QUERY_PLANS', 'false').lower() == 'true'
+MONGO_MAX_POOL_SIZE: Final[int] = int(os.getenv('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE: Final[int] = int(os.getenv('MONGO_MIN_POOL_SIZE', '10'))
+MONGO_MAX_IDLE_TIME_MS: Final[int] = int(os.getenv('MONGO_MAX_IDLE_TIME_MS', '300000'))
+MONGO_WAIT_QUEUE_TIMEOUT_MS: Final[int] = int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', '5000'))
+MONGO_COMPRESSORS: Final[str] = os.getenv('MONGO_COMPRESSORS', 'zlib')
+GAME_BOARD_STORAGE: Final[str] = os.getenv('GAME_BOARD_STORAGE', 'array')
+GAME_SESSIONS_ENABLED: Final[bool] = os.getenv('GAME_SESSIONS_ENABLED', 'false').lower() == 'true'
+RATE_LIMIT_BACKEND: Final[str] = os.getenv('RATE_LIMIT_BACKEND', 'memory')
+RATE_LIMIT_SHARED_PATH: Final[str] = os.getenv('RATE_LIMIT_SHARED_PATH', '/dev/shm/tic_tac_toe_rate_limit.bin')
+RATE_LIMIT_SHARED_SLOTS: Final[int] = int(os.getenv('RATE_LIMIT_SHARED_SLOTS', '65536'))
 
 JWT_SECRET_KEY: Final[str] = os.getenv('JWT_SECRET_KEY')
 JWT_ALGORITHM: Final[str] = os.getenv('JWT_ALGORITHM', 'HS256')
 JWT_EXPIRES_MINUTES: Final[int] = int(os.getenv('JWT_EXPIRES_MINUTES', '60'))
+JWT_REFRESH_EXPIRES_DAYS: Final[int] = int(os.getenv('JWT_REFRESH_EXPIRES_DAYS', '7'))
+JWT_DENYLIST_PATH: Final[str] = os.getenv('JWT_DENYLIST_PATH', 'data/token_denylist.bin')
+PASSWORD_HASH_WORKERS: Final[int] = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_PENDING: Final[int] = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '32'))
 
-GEMINI_API_KEY: Final[str] = os.getenv('GEMINI_API_KEY')
\ No newline at end of file
+GEMINI_API_KEY: Final[str] = os.getenv('GEMINI_API_KEY')
+AI_ENGINE: Final[str] = os.getenv('AI_ENGINE', 'solver')
+AI_MOVE_BUDGET_SECONDS: Final[float] = float(os.getenv('AI_MOVE_BUDGET_SECONDS', '1.5'))
+AI_MOVE_TABLE_PATH: Final[str] = os.getenv('AI_MOVE_TABLE_PATH', 'data/move_table.bin')
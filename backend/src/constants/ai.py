@@ -3,4 +3,19 @@ from typing import Final
 
 GEMINI_MODEL: Final[str] = 'gemini-2.5-flash'
 AI_RESPONSE_REGEX: Final[str] = r'^[0-8]$'
-AI_TIMEOUT_SECONDS: Final[int] = 12000
+AI_TIMEOUT_MILLISECONDS: Final[int] = 5000
+AI_MOVE_CACHE_MAX_SIZE: Final[int] = 4096
+AI_BREAKER_FAILURE_RATE_THRESHOLD: Final[float] = 0.5
+AI_BREAKER_MINIMUM_CALLS: Final[int] = 5
+AI_BREAKER_WINDOW_SIZE: Final[int] = 20
+AI_BREAKER_OPEN_SECONDS: Final[float] = 30.0
+AI_BREAKER_HALF_OPEN_MAX_CALLS: Final[int] = 1
+AI_PREFETCH_MAX_PENDING: Final[int] = 1024
+AI_PREFETCH_TTL_SECONDS: Final[float] = 60.0
+
+# Sent once per call as the system instruction; kept short, since it is resent with every move
+AI_RULES_PROMPT: Final[str] = (
+    'You are a Tic-Tac-Toe engine. The board lists cells 0-8 row by row: 0 is empty, 1 and 2 are the players. '
+    'Win if you can, else block the opponent, else play the best move. '
+    'Reply with only the index of an empty cell, one digit.'
+)
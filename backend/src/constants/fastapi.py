@@ -6,4 +6,8 @@ FASTAPI_VERSION: Final[str] = '0.1.0'
 VALID_ORIGINS: Final[List[str]] = ['http://localhost:5173', 'http://127.0.0.1:5173']
 
 RATE_LIMIT_MAX_REQUESTS: Final[int] = 100
-RATE_LIMIT_WINDOW_SECONDS: Final[float] = 60.0
\ No newline at end of file
+RATE_LIMIT_WINDOW_SECONDS: Final[float] = 60.0
+AUTH_RATE_LIMIT_MAX_REQUESTS: Final[int] = 20
+AUTH_RATE_LIMIT_WINDOW_SECONDS: Final[float] = 60.0
+# Slots a key can be stored in within the shared rate limit table
+RATE_LIMIT_BUCKET_SLOTS: Final[int] = 8
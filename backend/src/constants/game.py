@@ -13,3 +13,26 @@ WINNING_LINES: Final[List[List[CellIndex]]] = [
 ]
 
 BASE_CELLS_PRIORITY: Final[List[CellIndex]] = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+BOARD_SIZE: Final[int] = 9
+FULL_BOARD_MASK: Final[int] = (1 << BOARD_SIZE) - 1
+WINNING_LINE_MASKS: Final[List[int]] = [sum(1 << i for i in line) for line in WINNING_LINES]
+CELL_WINNING_LINES: Final[List[List[int]]] = [
+    [line_index for line_index, line in enumerate(WINNING_LINES) if cell_index in line]
+    for cell_index in range(BOARD_SIZE)
+]
+
+# BOARD_SYMMETRIES[t][i] is the cell that cell i moves to under transform t.
+BOARD_SYMMETRIES: Final[List[List[CellIndex]]] = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8],  # Identity
+    [2, 5, 8, 1, 4, 7, 0, 3, 6],  # Rotate 90
+    [8, 7, 6, 5, 4, 3, 2, 1, 0],  # Rotate 180
+    [6, 3, 0, 7, 4, 1, 8, 5, 2],  # Rotate 270
+    [2, 1, 0, 5, 4, 3, 8, 7, 6],  # Mirror left-right
+    [6, 7, 8, 3, 4, 5, 0, 1, 2],  # Mirror top-bottom
+    [0, 3, 6, 1, 4, 7, 2, 5, 8],  # Mirror TL-BR diagonal
+    [8, 5, 2, 7, 4, 1, 6, 3, 0],  # Mirror TR-BL diagonal
+]
+
+# Every this many plies the move log stores the full board, so replays start from the nearest snapshot
+MOVE_SNAPSHOT_INTERVAL: Final[int] = 3
@@ -0,0 +1,6 @@
+from typing import Final
+
+
+GAME_SESSION_FLUSH_SECONDS: Final[float] = 1.0
+GAME_SESSION_IDLE_SECONDS: Final[float] = 300.0
+GAME_SESSION_MAX_ACTIVE: Final[int] = 10000
@@ -0,0 +1,8 @@
+from typing import Final
+
+
+# Finished games never change, so they stay cached until evicted
+FINISHED_GAMES_CACHE_MAX_SIZE: Final[int] = 10000
+# Bounds how long another process's new game can stay hidden behind a cached pointer
+LAST_GAME_CACHE_MAX_SIZE: Final[int] = 10000
+LAST_GAME_CACHE_TTL_SECONDS: Final[float] = 5.0
@@ -0,0 +1,7 @@
+from typing import Final
+
+
+GAME_STORAGE_MIGRATION_BATCH_SIZE: Final[int] = 500
+GAME_STORAGE_MIGRATION_PAUSE_SECONDS: Final[float] = 0.05
+ACTIVE_GAME_BACKFILL_BATCH_SIZE: Final[int] = 500
+ACTIVE_GAME_BACKFILL_PAUSE_SECONDS: Final[float] = 0.05
@@ -0,0 +1,8 @@
+from typing import Final
+
+
+MATCHUPS_PAGE_SIZE_DEFAULT: Final[int] = 20
+MATCHUPS_PAGE_SIZE_MAX: Final[int] = 100
+
+GAMES_PAGE_SIZE_DEFAULT: Final[int] = 50
+GAMES_PAGE_SIZE_MAX: Final[int] = 500
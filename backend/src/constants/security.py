@@ -0,0 +1,8 @@
+from typing import Final
+
+
+ACCESS_TOKEN_TYPE: Final[str] = 'access'
+REFRESH_TOKEN_TYPE: Final[str] = 'refresh'
+# Revoked token ids are grouped by expiry into buckets this wide and dropped a bucket at a time
+TOKEN_DENYLIST_BUCKET_SECONDS: Final[int] = 60
+TOKEN_DENYLIST_SAVE_SECONDS: Final[float] = 5.0
@@ -0,0 +1,6 @@
+from typing import Final
+
+
+USER_CACHE_MAX_SIZE: Final[int] = 10000
+# Bounds how long a change made by another process can go unseen
+USER_CACHE_TTL_SECONDS: Final[float] = 60.0
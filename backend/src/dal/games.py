@@ -1,28 +1,132 @@
-from typing import List, Type
+from typing import Any, Dict, List, Type
+from datetime import datetime, timezone
 
-from beanie import PydanticObjectId
+from beanie import PydanticObjectId, UpdateResponse
+from beanie.operators import Or, Set, Unset
+from beanie.odm.queries.find import FindMany
+from beanie.odm.utils.dump import get_dict
+from pymongo.results import InsertOneResult
 
+from src.config import GAME_BOARD_STORAGE
+from src.constants.games_cache import (
+    FINISHED_GAMES_CACHE_MAX_SIZE,
+    LAST_GAME_CACHE_MAX_SIZE,
+    LAST_GAME_CACHE_TTL_SECONDS,
+)
 from src.dal.base_dal import BaseDAL
 from src.models.games import (
     GameDocument,
     GameCreate,
-    GameUpdate,
+    GameSummary,
+    GameCoveredSummary,
     PlayerIndex,
     BoardCell,
     CellIndex,
 )
+from src.utils.lru_cache import LRUCache
+from src.utils.pagination import Cursor
+from src.utils.game_storage import (
+    ARRAY_BOARD_FIELDS,
+    encode_board_fields,
+    stale_board_fields,
+    to_board_code,
+)
+
+
+class GamesCache:
+    """Read-through cache shared by GamesDAL instances: finished games, and each matchup's last game id."""
+
+    def __init__(
+        self,
+        finished_max_size: int = FINISHED_GAMES_CACHE_MAX_SIZE,
+        last_game_max_size: int = LAST_GAME_CACHE_MAX_SIZE,
+        last_game_ttl_seconds: float = LAST_GAME_CACHE_TTL_SECONDS
+    ) -> None:
+        self.finished_games: LRUCache[str, GameDocument] = LRUCache(finished_max_size)
+        self.last_game_ids: LRUCache[PydanticObjectId, str] = LRUCache(last_game_max_size, last_game_ttl_seconds)
+
+    def stats(self) -> Dict[str, Dict[str, int | float | None]]:
+        return {
+            'finished_games': self.finished_games.stats(),
+            'last_game_ids': self.last_game_ids.stats(),
+        }
 
 
 class GamesDAL(BaseDAL):
-    def __init__(self, model: Type[GameDocument] = GameDocument) -> None:
+    def __init__(
+        self,
+        model: Type[GameDocument] = GameDocument,
+        compact_board: bool = GAME_BOARD_STORAGE == 'compact',
+        covered_history: bool = False,
+        cache: GamesCache | None = None
+    ) -> None:
+        """
+        `compact_board` selects the format new writes use; reads accept both.
+        `covered_history` may only be set once no array-format game is left, since the covered
+        history projection does not fetch the array fields.
+        """
         super().__init__(model)
+        self.compact_board: bool = compact_board
+        self.covered_history: bool = covered_history
+        self.cache: GamesCache | None = cache
 
     async def get_game_by_id(self, game_id: str) -> GameDocument | None:
-        return await self.model.get(game_id)
-    
+        if self.cache is not None:
+            cached_game: GameDocument | None = self.cache.finished_games.get(str(game_id))
+            if cached_game is not None:
+                return cached_game
+
+        game: GameDocument | None = await self.model.get(game_id)
+        self._remember(game)
+        return game
+
+    def _remember(self, game: GameDocument | None) -> None:
+        if self.cache is not None and game is not None and game.is_finished:
+            self.cache.finished_games.put(str(game.id), game)
+
+    def last_game_query(self, matchup_id: PydanticObjectId) -> FindMany[GameDocument]:
+        return self.model.find(self.model.matchup_id == matchup_id).sort('-created_at').limit(1)
+
     async def get_last_game_for_matchup(self, matchup_id: PydanticObjectId) -> GameDocument | None:
-        games: List[GameDocument] = await self.model.find(self.model.matchup_id == matchup_id).sort('-created_at').to_list()
-        return games[0] if games else None
+        if self.cache is None:
+            return await self.last_game_query(matchup_id).first_or_none()
+
+        last_game_id: str | None = self.cache.last_game_ids.get(matchup_id)
+        if last_game_id is not None:
+            game: GameDocument | None = await self.get_game_by_id(last_game_id)
+            if game is not None:
+                return game
+
+        game = await self.last_game_query(matchup_id).first_or_none()
+        if game is not None:
+            self.cache.last_game_ids.put(matchup_id, str(game.id))
+            self._remember(game)
+        return game
+
+    def games_page_query(
+        self,
+        matchup_id: PydanticObjectId,
+        limit: int,
+        after: Cursor | None = None
+    ) -> FindMany[GameSummary]:
+        """Newest-first page of a matchup's games, keyed on (created_at, _id)."""
+        query: FindMany[GameDocument] = self.model.find(self.model.matchup_id == matchup_id)
+        if after is not None:
+            created_at, game_id = after
+            query = query.find(
+                self.model.created_at <= created_at,
+                Or(self.model.created_at < created_at, self.model.id < game_id),
+            )
+        projection: Type[GameSummary] = GameCoveredSummary if self.covered_history else GameSummary
+        return query.sort(-self.model.created_at, -self.model.id).limit(limit).project(projection)
+
+    async def list_games_page_for_matchup(
+        self,
+        matchup_id: PydanticObjectId,
+        limit: int,
+        after: Cursor | None = None
+    ) -> List[GameSummary]:
+        return await self.games_page_query(matchup_id, limit, after).to_list()
 
     async def create_game(self, matchup_id: PydanticObjectId, starting_player: PlayerIndex) -> GameDocument:
         data: GameCreate = GameCreate(
@@ -34,27 +138,50 @@ class GamesDAL(BaseDAL):
             winning_triplet=None,
         )
 
-        return await self.create(data)
+        game: GameDocument
+        if not self.compact_board:
+            game = await self.create(data)
+        else:
+            now: datetime = datetime.now(timezone.utc)
+            game = self.model(**data.model_dump(), created_at=now, updated_at=now)
+            document: Dict[str, Any] = get_dict(game, to_db=True, exclude=set(ARRAY_BOARD_FIELDS))
+            document.update(encode_board_fields(game.board, game.winning_triplet, compact=True))
+            result: InsertOneResult = await self.model.get_motor_collection().insert_one(document)
+            game.id = result.inserted_id
+
+        if self.cache is not None:
+            self.cache.last_game_ids.invalidate(matchup_id)
+        return game
 
-    async def update_game_state(
+    async def apply_move(
         self,
-        game_id: PydanticObjectId,
+        game: GameDocument,
         board: List[BoardCell],
         current_turn: PlayerIndex,
         is_finished: bool,
         winner: PlayerIndex | None = None,
         winning_triplet: List[CellIndex] | None = None
     ) -> GameDocument | None:
-        game: GameDocument | None = await self.model.get(game_id)
-        if game is None:
-            return None
-
-        data: GameUpdate = GameUpdate(
-            board=board,
-            current_turn=current_turn,
-            is_finished=is_finished,
-            winner=winner,
-            winning_triplet=winning_triplet,
+        """
+        Writes the new state only if the stored game still matches the `game` it was computed from.
+        The board guard matches either storage format, and the write converts the game to the current one.
+        Returns the updated document, or None if another move got there first.
+        """
+        updated_game: GameDocument | None = await self.model.find_one(
+            self.model.id == game.id,
+            Or({'board': game.board}, {'board_code': to_board_code(game.board)}),
+            self.model.current_turn == game.current_turn,
+            self.model.is_finished == False,
+        ).update(
+            Set({
+                **encode_board_fields(board, winning_triplet, compact=self.compact_board),
+                self.model.current_turn: current_turn,
+                self.model.is_finished: is_finished,
+                self.model.winner: winner,
+                self.model.updated_at: datetime.now(timezone.utc),
+            }),
+            Unset(stale_board_fields(compact=self.compact_board)),
+            response_type=UpdateResponse.NEW_DOCUMENT,
         )
-
-        return await self.update(game, data.model_dump(exclude_none=True))
+        self._remember(updated_game)
+        return updated_game
@@ -1,11 +1,16 @@
-from typing import List, Type
+from typing import Any, Dict, List, Tuple, Type
+from datetime import datetime, timezone
 
-from beanie import PydanticObjectId
+from beanie import PydanticObjectId, UpdateResponse
+from beanie.operators import Inc, Or, Set
+from beanie.odm.queries.aggregation import AggregationQuery
+from beanie.odm.queries.find import FindMany
 
 from src.dal.base_dal import BaseDAL
-from src.models.matchups import MatchMode, MatchupCreate, MatchupUpdateName, MatchupUpdateScore, MatchupDocument
-from src.models.games import PlayerIndex
+from src.models.matchups import AIEngine, MatchMode, MatchupCreate, MatchupUpdateName, MatchupDocument, MatchupSummary
+from src.models.games import GameDocument, PlayerIndex
 from src.exceptions import MatchupNotFoundError
+from src.utils.pagination import Cursor
 
 class MatchupsDAL(BaseDAL):
     def __init__(self, model: Type[MatchupDocument] = MatchupDocument) -> None:
@@ -16,7 +21,8 @@ class MatchupsDAL(BaseDAL):
         user_id: PydanticObjectId,
         player1_name: str,
         player2_name: str,
-        mode: MatchMode
+        mode: MatchMode,
+        ai_engine: AIEngine | None = None
     ) -> MatchupDocument:
         data: MatchupCreate = MatchupCreate(
             user_id=user_id,
@@ -24,18 +30,73 @@ class MatchupsDAL(BaseDAL):
             player1_score=0,
             player2_name=player2_name,
             player2_score=0,
-            mode=mode
+            mode=mode,
+            ai_engine=ai_engine
         )
         return await self.create(data)
 
     async def get_matchup_by_id(self, matchup_id: str) -> MatchupDocument | None:
         return await self.model.get(matchup_id)
 
-    async def list_matchups_for_user(
+    def matchup_with_active_game_query(self, matchup_id: PydanticObjectId) -> AggregationQuery[Dict[str, Any]]:
+        """Fetches the matchup by _id and joins its active game on games._id, in one round trip."""
+        return self.model.find(self.model.id == matchup_id).aggregate([
+            {'$limit': 1},
+            {'$lookup': {
+                'from': GameDocument.get_collection_name(),
+                'localField': 'active_game_id',
+                'foreignField': '_id',
+                'as': 'active_game',
+            }},
+        ])
+
+    async def get_matchup_with_active_game(
+        self,
+        matchup_id: PydanticObjectId
+    ) -> Tuple[MatchupDocument | None, GameDocument | None]:
+        results: List[Dict[str, Any]] = await self.matchup_with_active_game_query(matchup_id).to_list()
+        if not results:
+            return None, None
+
+        active_games: List[Dict[str, Any]] = results[0].pop('active_game')
+        matchup: MatchupDocument = self.model.model_validate(results[0])
+        game: GameDocument | None = GameDocument.model_validate(active_games[0]) if active_games else None
+        return matchup, game
+
+    async def set_active_game(self, matchup_id: PydanticObjectId, game_id: PydanticObjectId) -> None:
+        """Points the matchup at `game_id`, unless a concurrent create already pointed it at a newer game."""
+        await self.model.find_one(
+            self.model.id == matchup_id,
+            Or(self.model.active_game_id == None, self.model.active_game_id < game_id),
+        ).update(Set({self.model.active_game_id: game_id}))
+
+    def matchups_page_query(
+        self,
+        user_id: PydanticObjectId,
+        limit: int,
+        after: Cursor | None = None
+    ) -> FindMany[MatchupSummary]:
+        """
+        Newest-first page of a user's matchups, keyed on (updated_at, _id).
+        The `updated_at <= cursor` bound keeps the scan on the (user_id, updated_at, _id) index;
+        the $or only drops ties that were already returned.
+        """
+        query: FindMany[MatchupDocument] = self.model.find(self.model.user_id == user_id)
+        if after is not None:
+            updated_at, matchup_id = after
+            query = query.find(
+                self.model.updated_at <= updated_at,
+                Or(self.model.updated_at < updated_at, self.model.id < matchup_id),
+            )
+        return query.sort(-self.model.updated_at, -self.model.id).limit(limit).project(MatchupSummary)
+
+    async def list_matchups_page_for_user(
         self,
-        user_id: PydanticObjectId
-    ) -> List[MatchupDocument]:
-        return await self.model.find(self.model.user_id == user_id).sort('-updated_at').to_list()
+        user_id: PydanticObjectId,
+        limit: int,
+        after: Cursor | None = None
+    ) -> List[MatchupSummary]:
+        return await self.matchups_page_query(user_id, limit, after).to_list()
 
     async def update_player_name(
         self,
@@ -58,14 +119,17 @@ class MatchupsDAL(BaseDAL):
         self,
         matchup_id: str,
         player_id: PlayerIndex
-    ) -> MatchupDocument | None:
-        matchup: MatchupDocument | None = await self.model.get(matchup_id)
+    ) -> MatchupDocument:
+        """Increments the score server-side with $inc, so concurrent finishes are never lost."""
+        score_field = self.model.player1_score if player_id == 1 else self.model.player2_score
+        matchup: MatchupDocument | None = await self.model.find_one(
+            self.model.id == PydanticObjectId(matchup_id)
+        ).update(
+            Inc({score_field: 1}),
+            Set({self.model.updated_at: datetime.now(timezone.utc)}),
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
         if not matchup:
             raise MatchupNotFoundError(f'Matchup with id {matchup_id} not found')
 
-        data: MatchupUpdateScore = MatchupUpdateScore(
-            player1_score=matchup.player1_score + 1 if player_id == 1 else None,
-            player2_score=matchup.player2_score + 1 if player_id == 2 else None
-        )
-
-        return await self.update(matchup, data.model_dump(exclude_none=True))
+        return matchup
@@ -0,0 +1,42 @@
+from typing import List, Type
+from datetime import datetime, timezone
+
+from beanie import PydanticObjectId
+from beanie.odm.queries.find import FindMany
+
+from src.models.moves import MoveCreate, MoveDocument
+
+
+class MovesDAL:
+    def __init__(self, model: Type[MoveDocument] = MoveDocument) -> None:
+        self.model: Type[MoveDocument] = model
+
+    async def append_move(self, data: MoveCreate) -> MoveDocument:
+        move: MoveDocument = self.model(**data.model_dump(), created_at=datetime.now(timezone.utc))
+        await move.insert()
+        return move
+
+    async def append_moves(self, moves: List[MoveCreate]) -> None:
+        if not moves:
+            return
+        now: datetime = datetime.now(timezone.utc)
+        await self.model.insert_many([self.model(**move.model_dump(), created_at=now) for move in moves])
+
+    def moves_query(self, game_id: PydanticObjectId) -> FindMany[MoveDocument]:
+        return self.model.find(self.model.game_id == game_id).sort(+self.model.ply)
+
+    async def list_moves_for_game(self, game_id: PydanticObjectId) -> List[MoveDocument]:
+        return await self.moves_query(game_id).to_list()
+
+    def replay_query(self, game_id: PydanticObjectId, up_to_ply: int) -> FindMany[MoveDocument]:
+        return self.model.find(self.model.game_id == game_id, self.model.ply <= up_to_ply).sort(-self.model.ply)
+
+    async def list_moves_since_snapshot(self, game_id: PydanticObjectId, up_to_ply: int) -> List[MoveDocument]:
+        """Moves up to `up_to_ply` in ply order, starting at the latest snapshot (or ply 1 if there is none)."""
+        moves: List[MoveDocument] = []
+        async for move in self.replay_query(game_id, up_to_ply):
+            moves.append(move)
+            if move.snapshot is not None:
+                break
+        moves.reverse()
+        return moves
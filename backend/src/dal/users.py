@@ -1,18 +1,38 @@
-from typing import Type
+from typing import Any, Dict, Type
 from datetime import datetime, timezone
 
+from beanie.odm.queries.find import FindMany
+
 from src.models.users import UserDocument
+from src.utils.lru_cache import LRUCache
 
 
 class UsersDAL:
-    def __init__(self, model: Type[UserDocument] = UserDocument) -> None:
+    def __init__(
+        self,
+        model: Type[UserDocument] = UserDocument,
+        cache: LRUCache[str, UserDocument] | None = None
+    ) -> None:
+        """`cache` holds users resolved by id; updates made through this DAL invalidate it."""
         self.model: Type[UserDocument] = model
+        self.cache: LRUCache[str, UserDocument] | None = cache
 
     async def get_user_by_id(self, user_id: str) -> UserDocument | None:
-        return await self.model.get(user_id)
+        if self.cache is not None:
+            cached_user: UserDocument | None = self.cache.get(user_id)
+            if cached_user is not None:
+                return cached_user
+
+        user: UserDocument | None = await self.model.get(user_id)
+        if self.cache is not None and user is not None:
+            self.cache.put(user_id, user)
+        return user
+
+    def email_query(self, email: str) -> FindMany[UserDocument]:
+        return self.model.find(self.model.email == email).limit(1)
 
     async def get_user_by_email(self, email: str) -> UserDocument | None:
-        return await self.model.find_one(self.model.email == email)
+        return await self.email_query(email).first_or_none()
 
     async def create_user(self, email: str, password_hash: str) -> UserDocument:
         now: datetime = datetime.now(timezone.utc)
@@ -24,3 +44,19 @@ class UsersDAL:
         )
         await user.insert()
         return user
+
+    async def update_user(self, user: UserDocument, data: Dict[str, Any]) -> UserDocument:
+        for key, value in data.items():
+            setattr(user, key, value)
+        user.updated_at = datetime.now(timezone.utc)
+
+        await user.save()
+        self.invalidate_user(str(user.id))
+        return user
+
+    async def touch_user(self, user: UserDocument) -> UserDocument:
+        return await self.update_user(user, {})
+
+    def invalidate_user(self, user_id: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(user_id)
@@ -1,18 +1,60 @@
+from typing import Any, Dict, List, Sequence, Tuple
+from datetime import datetime, timezone
+import asyncio
+
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from beanie import init_beanie
+from beanie import PydanticObjectId, init_beanie
+from beanie.odm.queries.find import FindMany
+from pymongo.monitoring import ConnectionPoolListener
 
-from src.config import MONGO_URI, MONGO_DB_NAME
+from src.config import (
+    MONGO_URI,
+    MONGO_DB_NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    MONGO_COMPRESSORS,
+)
 from src.models.users import UserDocument
 from src.models.games import GameDocument
 from src.models.matchups import MatchupDocument
+from src.models.moves import MoveDocument
+from src.dal.games import GamesDAL
+from src.dal.matchups import MatchupsDAL
+from src.dal.moves import MovesDAL
+from src.dal.users import UsersDAL
+from src.constants.pagination import GAMES_PAGE_SIZE_DEFAULT, MATCHUPS_PAGE_SIZE_DEFAULT
+from src.utils.query_plans import find_plan_problems
 from src.utils.logger import logger
 
 
-async def init_db() -> None:
+def create_client(pool_listeners: Sequence[ConnectionPoolListener] = ()) -> AsyncIOMotorClient:
+    """Builds the Motor client with the configured pool bounds and wire compression."""
+    return AsyncIOMotorClient(
+        MONGO_URI,
+        serverSelectionTimeoutMS=30000,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        compressors=MONGO_COMPRESSORS or None,
+        event_listeners=list(pool_listeners),
+    )
+
+
+async def warm_up_pool(client: AsyncIOMotorClient, connections: int = MONGO_MIN_POOL_SIZE) -> None:
+    """Opens `connections` sockets up front by running that many pings at once, so early requests skip the handshake."""
+    await asyncio.gather(*(client.admin.command('ping') for _ in range(connections)))
+
+
+async def init_db(client: AsyncIOMotorClient | None = None) -> AsyncIOMotorClient:
+    """Initializes Beanie on `client`, or on a new client when none is given, and returns the client."""
     logger.info(f'Initializing database connection: database={MONGO_DB_NAME}')
     try:
-        client: AsyncIOMotorClient = AsyncIOMotorClient(MONGO_URI, serverSelectionTimeoutMS=30000)
+        if client is None:
+            client = create_client()
         database: AsyncIOMotorDatabase = client[MONGO_DB_NAME]
 
         await init_beanie(
@@ -20,10 +62,45 @@ async def init_db() -> None:
             document_models=[
                 UserDocument,
                 GameDocument,
-                MatchupDocument
+                MatchupDocument,
+                MoveDocument
             ]
         )
         logger.info('Database connection established and Beanie initialized successfully')
+        return client
     except Exception as e:
         logger.error(f'Failed to initialize database: {str(e)}', exception=e)
         raise
+
+
+async def check_query_plans() -> List[str]:
+    """Explains every list/latest query the DALs issue and returns the ones that are not index-backed."""
+    sample_id: PydanticObjectId = PydanticObjectId()
+    sample_cursor: Tuple[datetime, PydanticObjectId] = (datetime.now(timezone.utc), sample_id)
+    # name -> (query, whether it must be covered by its index)
+    queries: Dict[str, Tuple[FindMany[Any], bool]] = {
+        'games.last_game_for_matchup': (GamesDAL().last_game_query(sample_id), False),
+        'games.history_page_for_matchup': (
+            GamesDAL().games_page_query(sample_id, GAMES_PAGE_SIZE_DEFAULT, sample_cursor),
+            False,
+        ),
+        'games.covered_history_page_for_matchup': (
+            GamesDAL(covered_history=True).games_page_query(sample_id, GAMES_PAGE_SIZE_DEFAULT, sample_cursor),
+            True,
+        ),
+        'moves.moves_for_game': (MovesDAL().moves_query(sample_id), False),
+        'moves.replay_for_game': (MovesDAL().replay_query(sample_id, 5), False),
+        # Runs on every login; its unique index also keeps emails unique
+        'users.by_email': (UsersDAL().email_query('plan-check@example.com'), False),
+        'matchups.first_page_for_user': (MatchupsDAL().matchups_page_query(sample_id, MATCHUPS_PAGE_SIZE_DEFAULT), False),
+        'matchups.next_page_for_user': (
+            MatchupsDAL().matchups_page_query(sample_id, MATCHUPS_PAGE_SIZE_DEFAULT, sample_cursor),
+            False,
+        ),
+    }
+
+    problems: List[str] = []
+    for name, (query, covered) in queries.items():
+        explain: Dict[str, Any] = await query.motor_cursor.explain()
+        problems.extend(find_plan_problems(name, explain, covered))
+    return problems
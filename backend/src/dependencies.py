@@ -1,12 +1,31 @@
 from fastapi import Depends
+from src.config import GAME_SESSIONS_ENABLED, JWT_DENYLIST_PATH, JWT_REFRESH_EXPIRES_DAYS
 from src.dal.users import UsersDAL
 from src.dal.matchups import MatchupsDAL
-from src.dal.games import GamesDAL
+from src.dal.games import GamesDAL, GamesCache
+from src.dal.moves import MovesDAL
 from src.services.game import GameService
 from src.services.ai import AIService
+from src.services.ai_prefetch import AIMovePrefetcher
+from src.services.game_storage_migration import GameStorageMigration
+from src.services.game_sessions import GameSessionRegistry
+from src.utils.pool_metrics import PoolMetrics
+from src.security.password import PasswordHasher
+from src.security.denylist import TokenDenylist
+from src.models.users import UserDocument
+from src.utils.lru_cache import LRUCache
+from src.constants.users import USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS
 
 
 _ai_service_instance: AIService | None = None
+_ai_prefetcher_instance: AIMovePrefetcher | None = None
+_game_storage_migration_instance: GameStorageMigration | None = None
+_game_sessions_instance: GameSessionRegistry | None = None
+_games_cache_instance: GamesCache | None = None
+_pool_metrics_instance: PoolMetrics | None = None
+_password_hasher_instance: PasswordHasher | None = None
+_users_cache_instance: LRUCache[str, UserDocument] | None = None
+_token_denylist_instance: TokenDenylist | None = None
 
 
 def get_ai_service() -> AIService:
@@ -17,21 +36,95 @@ def get_ai_service() -> AIService:
     return _ai_service_instance
 
 
-def get_users_dal() -> UsersDAL:
-    return UsersDAL()
+def get_ai_prefetcher() -> AIMovePrefetcher:
+    global _ai_prefetcher_instance
+    if _ai_prefetcher_instance is None:
+        _ai_prefetcher_instance = AIMovePrefetcher()
+    return _ai_prefetcher_instance
+
+
+def get_game_storage_migration() -> GameStorageMigration:
+    global _game_storage_migration_instance
+    if _game_storage_migration_instance is None:
+        _game_storage_migration_instance = GameStorageMigration()
+    return _game_storage_migration_instance
+
+
+def get_pool_metrics() -> PoolMetrics:
+    global _pool_metrics_instance
+    if _pool_metrics_instance is None:
+        _pool_metrics_instance = PoolMetrics()
+    return _pool_metrics_instance
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _password_hasher_instance
+    if _password_hasher_instance is None:
+        _password_hasher_instance = PasswordHasher()
+    return _password_hasher_instance
+
+
+def get_token_denylist() -> TokenDenylist:
+    global _token_denylist_instance
+    if _token_denylist_instance is None:
+        # A saved file untouched for the longest token lifetime only holds expired tokens
+        _token_denylist_instance = TokenDenylist.load(JWT_DENYLIST_PATH, max_age_seconds=JWT_REFRESH_EXPIRES_DAYS * 86400)
+    return _token_denylist_instance
+
+
+def get_users_cache() -> LRUCache[str, UserDocument]:
+    global _users_cache_instance
+    if _users_cache_instance is None:
+        _users_cache_instance = LRUCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS)
+    return _users_cache_instance
+
+
+def get_games_cache() -> GamesCache:
+    global _games_cache_instance
+    if _games_cache_instance is None:
+        _games_cache_instance = GamesCache()
+    return _games_cache_instance
+
+
+def get_game_sessions() -> GameSessionRegistry | None:
+    global _game_sessions_instance
+    if _game_sessions_instance is None and GAME_SESSIONS_ENABLED:
+        _game_sessions_instance = GameSessionRegistry(GamesDAL(cache=get_games_cache()), MovesDAL(), MatchupsDAL())
+    return _game_sessions_instance
+
+
+def get_users_dal(users_cache: LRUCache[str, UserDocument] = Depends(get_users_cache)) -> UsersDAL:
+    return UsersDAL(cache=users_cache)
 
 
 def get_matchups_dal() -> MatchupsDAL:
     return MatchupsDAL()
 
 
-def get_games_dal() -> GamesDAL:
-    return GamesDAL()
+def get_games_dal(
+    game_storage_migration: GameStorageMigration = Depends(get_game_storage_migration),
+    games_cache: GamesCache = Depends(get_games_cache)
+) -> GamesDAL:
+    return GamesDAL(covered_history=game_storage_migration.completed, cache=games_cache)
+
+
+def get_moves_dal() -> MovesDAL:
+    return MovesDAL()
 
 
 def get_game_service(
     matchups_dal: MatchupsDAL = Depends(get_matchups_dal),
     games_dal: GamesDAL = Depends(get_games_dal),
-    ai_service: AIService = Depends(get_ai_service)
+    ai_service: AIService = Depends(get_ai_service),
+    ai_prefetcher: AIMovePrefetcher = Depends(get_ai_prefetcher),
+    moves_dal: MovesDAL = Depends(get_moves_dal),
+    game_sessions: GameSessionRegistry | None = Depends(get_game_sessions)
 ) -> GameService:
-    return GameService(matchups_dal=matchups_dal, games_dal=games_dal, ai_service=ai_service)
+    return GameService(
+        matchups_dal=matchups_dal,
+        games_dal=games_dal,
+        ai_service=ai_service,
+        ai_prefetcher=ai_prefetcher,
+        moves_dal=moves_dal,
+        game_sessions=game_sessions
+    )
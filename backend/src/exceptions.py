@@ -10,10 +10,25 @@ class InvalidMoveError(Exception):
     pass
 
 
+class InvalidMatchupError(Exception):
+    pass
+
+
 class GameFinishedError(Exception):
     pass
 
 
+class MoveConflictError(Exception):
+    pass
+
+
 class AIServiceError(Exception):
     pass
 
+
+class InvalidCursorError(Exception):
+    pass
+
+
+class PasswordHasherOverloadedError(Exception):
+    pass
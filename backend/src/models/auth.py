@@ -10,8 +10,24 @@ class LoginResponse(BaseModel):
     ok: bool
     user: UserDocument
     accessToken: str
+    refreshToken: str
     tokenType: str = 'bearer'
-    
+
+
+class RefreshRequest(BaseModel):
+    refreshToken: str
+
+
+class RefreshResponse(BaseModel):
+    ok: bool
+    accessToken: str
+    refreshToken: str
+    tokenType: str = 'bearer'
+
+
+class LogoutRequest(BaseModel):
+    refreshToken: str | None = None
+
 
 class LogoutResponse(BaseModel):
     ok: bool
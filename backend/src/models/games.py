@@ -1,7 +1,8 @@
-from typing import List, Literal
+from typing import Any, Dict, List, Literal
 
 from beanie import Document, PydanticObjectId
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from datetime import datetime
 
@@ -19,6 +20,13 @@ class GameBase(BaseModel):
     winner: PlayerIndex | None
     winning_triplet: List[CellIndex] | None
 
+    @model_validator(mode='before')
+    @classmethod
+    def accept_compact_board(cls, data: Any) -> Any:
+        # Imported here because src.utils.game_storage depends on the types defined in this module
+        from src.utils.game_storage import expand_board_fields
+        return expand_board_fields(data) if isinstance(data, dict) else data
+
 
 class GameCreate(GameBase):
     pass
@@ -34,3 +42,89 @@ class GameDocument(GameBase, Document):
 
     class Settings:
         name = 'games'
+        # Both storage formats are read, so the projection can't be derived from the fields alone
+        projection: Dict[str, int] = {
+            '_id': 1,
+            'revision_id': 1,
+            'matchup_id': 1,
+            'board': 1,
+            'board_code': 1,
+            'current_turn': 1,
+            'is_finished': 1,
+            'winner': 1,
+            'winning_triplet': 1,
+            'winning_line': 1,
+            'created_at': 1,
+            'updated_at': 1,
+        }
+        indexes = [
+            IndexModel(
+                [
+                    ('matchup_id', ASCENDING),
+                    ('created_at', DESCENDING),
+                    ('_id', DESCENDING),
+                    ('board_code', ASCENDING),
+                    ('is_finished', ASCENDING),
+                    ('winner', ASCENDING),
+                    ('winning_line', ASCENDING),
+                ],
+                name='matchup_id_created_at_id_history',
+            ),
+        ]
+
+
+class GameSummary(BaseModel):
+    """Projection of a game for the history view, in compact form whichever format it is stored in."""
+    id: PydanticObjectId = Field(alias='_id')
+    board_code: int
+    is_finished: bool
+    winner: PlayerIndex | None
+    winning_line: int | None = None
+    created_at: datetime
+
+    class Settings:
+        projection: Dict[str, int] = {
+            '_id': 1,
+            'board': 1,
+            'board_code': 1,
+            'is_finished': 1,
+            'winner': 1,
+            'winning_triplet': 1,
+            'winning_line': 1,
+            'created_at': 1,
+        }
+
+    @model_validator(mode='before')
+    @classmethod
+    def accept_array_board(cls, data: Any) -> Any:
+        from src.utils.game_storage import compact_board_fields
+        return compact_board_fields(data) if isinstance(data, dict) else data
+
+
+class GameCoveredSummary(GameSummary):
+    """GameSummary limited to fields held by the history index, so the read never fetches documents."""
+
+    class Settings:
+        projection: Dict[str, int] = {
+            '_id': 1,
+            'board_code': 1,
+            'is_finished': 1,
+            'winner': 1,
+            'winning_line': 1,
+            'created_at': 1,
+        }
+
+
+class GameHistoryItem(BaseModel):
+    """A past game with the board as a base-3 integer and the winning line as an index into WINNING_LINES."""
+    id: PydanticObjectId
+    board: int
+    is_finished: bool
+    winner: PlayerIndex | None
+    winning_line: int | None
+    created_at: datetime
+
+
+class GamesPage(BaseModel):
+    items: List[GameHistoryItem]
+    next_cursor: str | None = None
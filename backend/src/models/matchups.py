@@ -1,9 +1,11 @@
 from enum import Enum
 
 from beanie import Document, PydanticObjectId
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from datetime import datetime
+from typing import List
 
 
 class MatchMode(str, Enum):
@@ -11,6 +13,11 @@ class MatchMode(str, Enum):
     ai = 'ai'
 
 
+class AIEngine(str, Enum):
+    solver = 'solver'
+    gemini = 'gemini'
+
+
 class MatchupBase(BaseModel):
     user_id: PydanticObjectId
     player1_name: str
@@ -18,6 +25,7 @@ class MatchupBase(BaseModel):
     player2_name: str
     player2_score: int = 0
     mode: MatchMode
+    ai_engine: AIEngine | None = None
 
 
 class MatchupCreate(MatchupBase):
@@ -29,14 +37,32 @@ class MatchupUpdateName(BaseModel):
     player2_name: str | None = None
 
 
-class MatchupUpdateScore(BaseModel):
-    player1_score: int | None = None
-    player2_score: int | None = None
-
-
 class MatchupDocument(MatchupBase, Document):
+    # Newest game of the matchup, so loading it with its game needs no sort over games
+    active_game_id: PydanticObjectId | None = None
     created_at: datetime
     updated_at: datetime
 
     class Settings:
         name = 'matchups'
+        indexes = [
+            IndexModel([('user_id', ASCENDING), ('updated_at', DESCENDING), ('_id', DESCENDING)], name='user_id_updated_at_id'),
+        ]
+
+
+class MatchupSummary(BaseModel):
+    """Projection of a matchup with only the fields the matchups list shows."""
+    id: PydanticObjectId = Field(alias='_id')
+    user_id: PydanticObjectId
+    player1_name: str
+    player1_score: int
+    player2_name: str
+    player2_score: int
+    mode: MatchMode
+    created_at: datetime
+    updated_at: datetime
+
+
+class MatchupsPage(BaseModel):
+    items: List[MatchupSummary]
+    next_cursor: str | None = None
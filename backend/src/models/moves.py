@@ -0,0 +1,45 @@
+from typing import List
+
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel
+from pymongo import ASCENDING, IndexModel
+
+from datetime import datetime
+
+from src.models.games import BoardCell, CellIndex, PlayerIndex
+
+
+class MoveBase(BaseModel):
+    game_id: PydanticObjectId
+    ply: int
+    player: PlayerIndex
+    cell: CellIndex
+    # Base-3 board after this ply, stored every MOVE_SNAPSHOT_INTERVAL plies
+    snapshot: int | None = None
+
+
+class MoveCreate(MoveBase):
+    pass
+
+
+class MoveDocument(MoveBase, Document):
+    created_at: datetime
+
+    class Settings:
+        name = 'moves'
+        indexes = [
+            IndexModel([('game_id', ASCENDING), ('ply', ASCENDING)], name='game_id_ply', unique=True),
+        ]
+
+
+class MoveEntry(BaseModel):
+    ply: int
+    player: PlayerIndex
+    cell: CellIndex
+    created_at: datetime
+
+
+class GameReplay(BaseModel):
+    game_id: PydanticObjectId
+    ply: int
+    board: List[BoardCell]
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime
 
 from beanie import Document, Indexed
 from pydantic import BaseModel, EmailStr
@@ -18,7 +18,3 @@ class UserDocument(Document):
 
     class Settings:
         name = 'users'
-
-    async def touch(self) -> None:
-        self.updated_at = datetime.now(timezone.utc)
-        await self.save()
@@ -1,50 +1,119 @@
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Any, Dict
+import uuid
 
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 
-from src.config import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_EXPIRES_MINUTES
+from src.config import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_EXPIRES_MINUTES, JWT_REFRESH_EXPIRES_DAYS
+from src.constants.security import ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE
 from src.models.users import UserDocument
 from src.dal.users import UsersDAL
+from src.dependencies import get_users_cache, get_token_denylist
 from src.utils.logger import logger
 
 
 oauth2_scheme: OAuth2PasswordBearer = OAuth2PasswordBearer(tokenUrl='/api/auth/login')
 
 
+def _create_token(subject: str, token_type: str, expires_delta: timedelta) -> str:
+    expire: datetime = datetime.now(timezone.utc) + expires_delta
+    to_encode: Dict[str, str | datetime] = {
+        'sub': subject,
+        'exp': expire,
+        'jti': uuid.uuid4().hex,
+        'type': token_type,
+    }
+    encoded_jwt: str = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    return encoded_jwt
+
+
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     if expires_delta is None:
         expires_delta = timedelta(minutes=JWT_EXPIRES_MINUTES)
+    return _create_token(subject, ACCESS_TOKEN_TYPE, expires_delta)
 
-    expire: datetime = datetime.now(timezone.utc) + expires_delta
-    to_encode: Dict[str, str | datetime] = {'sub': subject, 'exp': expire}
-    encoded_jwt: str = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
 
+def create_refresh_token(subject: str, expires_delta: timedelta | None = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(days=JWT_REFRESH_EXPIRES_DAYS)
+    return _create_token(subject, REFRESH_TOKEN_TYPE, expires_delta)
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserDocument:
-    credentials_exception: HTTPException = HTTPException(
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail='Could not validate credentials',
         headers={'WWW-Authenticate': 'Bearer'},
     )
 
+
+def decode_token(token: str, token_type: str = ACCESS_TOKEN_TYPE) -> Dict[str, Any]:
+    """Validates signature, expiry, subject, type and revocation, and returns the token's claims."""
     try:
-        payload: Dict[str, str] = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        user_id: str | None = payload.get('sub')
-        if user_id is None:
-            logger.warning('JWT token missing subject (sub) claim')
-            raise credentials_exception
+        payload: Dict[str, Any] = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
     except JWTError as e:
         logger.warning(f'JWT validation failed: {str(e)}')
-        raise credentials_exception
+        raise _credentials_exception()
+
+    if payload.get('sub') is None:
+        logger.warning('JWT token missing subject (sub) claim')
+        raise _credentials_exception()
+    # Tokens issued before token types existed are access tokens
+    if payload.get('type', ACCESS_TOKEN_TYPE) != token_type:
+        logger.warning(f'JWT token has the wrong type: expected={token_type}, type={payload.get("type")}')
+        raise _credentials_exception()
+    jti: str | None = payload.get('jti')
+    if jti is not None and get_token_denylist().is_revoked(jti, payload['exp']):
+        logger.warning(f'Revoked JWT token used: sub={payload["sub"]}')
+        raise _credentials_exception()
+
+    return payload
+
+
+def decode_token_subject(token: str) -> str:
+    return decode_token(token)['sub']
+
+
+def revoke_token(claims: Dict[str, Any]) -> None:
+    """Denylists the token until it expires; tokens issued without a `jti` cannot be revoked."""
+    jti: str | None = claims.get('jti')
+    if jti is not None:
+        get_token_denylist().revoke(jti, claims['exp'])
+
+
+def consume_token(claims: Dict[str, Any]) -> bool:
+    """
+    Revokes a single-use token, returning False if it was already used. Checks and revokes in one
+    step, so concurrent requests with the same token cannot both pass the check.
+    """
+    jti: str | None = claims.get('jti')
+    return jti is not None and get_token_denylist().claim(jti, claims['exp'])
+
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> PydanticObjectId:
+    """
+    Claims-only authentication: trusts the signed token's subject without loading the user.
+    For routes that only need the id; a deleted user's token keeps working until it expires.
+    """
+    user_id: str = decode_token_subject(token)
+    try:
+        return PydanticObjectId(user_id)
+    except (InvalidId, TypeError):
+        logger.warning(f'JWT subject is not a user id: sub={user_id}')
+        raise _credentials_exception()
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserDocument:
+    user_id: str = decode_token_subject(token)
 
-    users_dal: UsersDAL = UsersDAL()
+    users_dal: UsersDAL = UsersDAL(cache=get_users_cache())
     user: UserDocument | None = await users_dal.get_user_by_id(user_id)
     if user is None:
         logger.warning(f'User not found for authenticated token: user_id={user_id}')
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
@@ -0,0 +1,236 @@
+from pathlib import Path
+from typing import Callable, Dict, List, Set, Tuple
+import asyncio
+import glob
+import heapq
+import os
+import struct
+import time
+
+from src.constants.security import TOKEN_DENYLIST_BUCKET_SECONDS
+from src.utils.logger import logger
+
+
+# File layout: header (magic, bucket seconds), then per bucket (index, token count) followed by
+# one 16-byte raw UUID per revoked token.
+_MAGIC: bytes = b'TDL1'
+_HEADER: struct.Struct = struct.Struct('<4sI')
+_BUCKET_HEADER: struct.Struct = struct.Struct('<qI')
+_JTI_BYTES: int = 16
+
+
+class TokenDenylist:
+    """
+    Revoked token ids (`jti`), grouped into buckets by the token's expiry.
+    A lookup only checks the bucket of the token's own `exp`, and since an expired token is
+    rejected anyway, each bucket is dropped whole once the last token it can hold has expired.
+    Token ids are 32-character hex UUIDs.
+    Each worker process keeps its own denylist and saves it to its own file; the others pick up
+    its revocations when they next merge the saved files, see `run_persistence`.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = TOKEN_DENYLIST_BUCKET_SECONDS,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError('Denylist bucket size must be positive')
+
+        self.bucket_seconds: int = bucket_seconds
+        self._clock: Callable[[], float] = clock
+        self._buckets: Dict[int, Set[str]] = {}
+        # Min-heap of bucket indexes, so expired buckets are found without scanning
+        self._bucket_heap: List[int] = []
+        # Set by revocations not yet written to disk
+        self.dirty: bool = False
+        # Saved files older than this are deleted when read; None keeps them
+        self.max_age_seconds: float | None = None
+        # Modification time of each saved file when it was last read
+        self._modified_at: Dict[Path, float] = {}
+
+    def __len__(self) -> int:
+        return sum(len(tokens) for tokens in self._buckets.values())
+
+    def _bucket(self, expires_at: float) -> int:
+        return int(expires_at // self.bucket_seconds)
+
+    def _prune(self) -> None:
+        now: float = self._clock()
+        while self._bucket_heap and (self._bucket_heap[0] + 1) * self.bucket_seconds <= now:
+            del self._buckets[heapq.heappop(self._bucket_heap)]
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self._prune()
+        if expires_at <= self._clock():
+            return
+
+        bucket: int = self._bucket(expires_at)
+        if bucket not in self._buckets:
+            self._buckets[bucket] = set()
+            heapq.heappush(self._bucket_heap, bucket)
+        self._buckets[bucket].add(jti)
+        self.dirty = True
+
+    def claim(self, jti: str, expires_at: float) -> bool:
+        """Revokes the token and returns True, or returns False if it already was revoked."""
+        if self.is_revoked(jti, expires_at):
+            return False
+        self.revoke(jti, expires_at)
+        return True
+
+    def is_revoked(self, jti: str, expires_at: float) -> bool:
+        self._prune()
+        tokens: Set[str] | None = self._buckets.get(self._bucket(expires_at))
+        return tokens is not None and jti in tokens
+
+    def dumps(self) -> bytes:
+        self._prune()
+        chunks: List[bytes] = [_HEADER.pack(_MAGIC, self.bucket_seconds)]
+        for bucket, tokens in self._buckets.items():
+            chunks.append(_BUCKET_HEADER.pack(bucket, len(tokens)))
+            chunks.extend(bytes.fromhex(jti) for jti in tokens)
+        return b''.join(chunks)
+
+    @classmethod
+    def loads(cls, data: bytes, clock: Callable[[], float] = time.time) -> 'TokenDenylist':
+        """Restores a denylist with the bucket size it was saved with; expired buckets are skipped."""
+        magic, bucket_seconds = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError('Not a token denylist file')
+
+        denylist: TokenDenylist = cls(bucket_seconds, clock)
+        offset: int = _HEADER.size
+        while offset < len(data):
+            bucket, count = _BUCKET_HEADER.unpack_from(data, offset)
+            offset += _BUCKET_HEADER.size
+            end: int = offset + count * _JTI_BYTES
+            if end > len(data):
+                raise ValueError('Truncated token denylist file')
+            tokens: Set[str] = {data[i:i + _JTI_BYTES].hex() for i in range(offset, end, _JTI_BYTES)}
+            offset = end
+            if not tokens:
+                continue
+            if bucket not in denylist._buckets:
+                denylist._buckets[bucket] = set()
+                heapq.heappush(denylist._bucket_heap, bucket)
+            denylist._buckets[bucket] |= tokens
+        denylist._prune()
+        return denylist
+
+    def merge(self, other: 'TokenDenylist') -> None:
+        if other.bucket_seconds != self.bucket_seconds:
+            raise ValueError(f'Token denylist bucket size differs: {other.bucket_seconds}s, expected {self.bucket_seconds}s')
+        for bucket, tokens in other._buckets.items():
+            if bucket not in self._buckets:
+                self._buckets[bucket] = set()
+                heapq.heappush(self._bucket_heap, bucket)
+            self._buckets[bucket] |= tokens
+        self._prune()
+
+    def save(self, path: str) -> None:
+        """Writes this worker's denylist to its own file next to `path`, see `worker_path`."""
+        self.dirty = False
+        _write_atomically(worker_path(path), self.dumps())
+
+    async def run_persistence(self, path: str, interval_seconds: float) -> None:
+        """
+        Every `interval_seconds`, writes the denylist next to `path` if it has unsaved revocations,
+        and merges the revocations other workers saved since the last round.
+        """
+        own_path: Path = Path(worker_path(path))
+        while True:
+            await asyncio.sleep(interval_seconds)
+            if self.dirty:
+                # Serialized on the loop so revocations cannot change the buckets mid-dump
+                data: bytes = self.dumps()
+                self.dirty = False
+                try:
+                    await asyncio.to_thread(_write_atomically, str(own_path), data)
+                except OSError as e:
+                    self.dirty = True
+                    logger.error(f'Token denylist could not be saved: path={own_path}', exception=e)
+            self._merge_saved(await asyncio.to_thread(self._read_saved, path, own_path))
+
+    def _read_saved(self, path: str, skip_path: Path | None = None) -> List[Tuple[Path, bytes]]:
+        """
+        Reads the saved files that changed since the last read. A file untouched for `max_age_seconds`
+        only holds tokens that have expired since, so it is deleted instead.
+        """
+        files: List[Tuple[Path, bytes]] = []
+        for file_path in saved_paths(path):
+            if file_path == skip_path:
+                continue
+            try:
+                modified_at: float = file_path.stat().st_mtime
+                if self.max_age_seconds is not None and modified_at + self.max_age_seconds < self._clock():
+                    file_path.unlink(missing_ok=True)
+                    self._modified_at.pop(file_path, None)
+                    continue
+                if self._modified_at.get(file_path) == modified_at:
+                    continue
+                files.append((file_path, file_path.read_bytes()))
+                self._modified_at[file_path] = modified_at
+            except OSError as e:
+                logger.error(f'Token denylist could not be read: path={file_path}', exception=e)
+        return files
+
+    def _merge_saved(self, files: List[Tuple[Path, bytes]]) -> None:
+        for file_path, data in files:
+            try:
+                self.merge(TokenDenylist.loads(data, self._clock))
+            except (ValueError, struct.error) as e:
+                logger.error(f'Token denylist could not be loaded: path={file_path}', exception=e)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        clock: Callable[[], float] = time.time,
+        max_age_seconds: float | None = None
+    ) -> 'TokenDenylist':
+        """
+        Starts a denylist with the revocations every worker saved next to `path`; missing or
+        unreadable files are skipped. Files older than `max_age_seconds` are deleted.
+        """
+        denylist: TokenDenylist = cls(clock=clock)
+        denylist.max_age_seconds = max_age_seconds
+        denylist._merge_saved(denylist._read_saved(path))
+        return denylist
+
+    def stats(self) -> Dict[str, int]:
+        self._prune()
+        return {
+            'revoked': len(self),
+            'buckets': len(self._buckets),
+            'bucket_seconds': self.bucket_seconds,
+        }
+
+
+def worker_path(path: str, pid: int | None = None) -> str:
+    """
+    File the worker process `pid`, by default this one, saves its denylist to. Workers never
+    write to the same file, so one saving cannot overwrite another's revocations.
+    """
+    file_path: Path = Path(path)
+    return str(file_path.with_name(f'{file_path.stem}.{os.getpid() if pid is None else pid}{file_path.suffix}'))
+
+
+def saved_paths(path: str) -> List[Path]:
+    """Every worker's file next to `path`, and `path` itself as saved before files were per worker."""
+    file_path: Path = Path(path)
+    paths: List[Path] = [file_path] if file_path.exists() else []
+    prefix: str = f'{file_path.stem}.'
+    for candidate in sorted(file_path.parent.glob(f'{glob.escape(prefix)}*{glob.escape(file_path.suffix)}')):
+        pid: str = candidate.name[len(prefix):len(candidate.name) - len(file_path.suffix)]
+        if pid.isdigit():
+            paths.append(candidate)
+    return paths
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    file_path: Path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path = file_path.with_suffix(file_path.suffix + '.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(file_path)
@@ -1,6 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+import asyncio
+
 from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
 
+from src.config import PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING
+from src.exceptions import PasswordHasherOverloadedError
+
+T = TypeVar('T')
+
 pwd_context: CryptContext = CryptContext(
     schemes=['bcrypt'],
     deprecated='auto'
@@ -16,3 +25,56 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
     except UnknownHashError:
         return False
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool so hashing never blocks the event loop.
+    At most `max_workers` hashes run at once; once `max_pending` calls are running or queued,
+    new ones are rejected with PasswordHasherOverloadedError instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING) -> None:
+        if max_workers <= 0 or max_pending < max_workers:
+            raise ValueError('Password hasher needs at least one worker and room to queue for each')
+
+        self.max_workers: int = max_workers
+        self.max_pending: int = max_pending
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bcrypt')
+        self.pending: int = 0
+        self.peak_pending: int = 0
+        self.completed: int = 0
+        self.rejected: int = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherOverloadedError(f'Password hashing queue is full: pending={self.pending}')
+
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'workers': self.max_workers,
+            'max_pending': self.max_pending,
+            'running': min(self.pending, self.max_workers),
+            'queued': max(0, self.pending - self.max_workers),
+            'peak_pending': self.peak_pending,
+            'completed': self.completed,
+            'rejected': self.rejected,
+        }
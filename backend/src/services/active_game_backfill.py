@@ -0,0 +1,76 @@
+from typing import Any, Dict, List, Type
+import asyncio
+
+from beanie import PydanticObjectId
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+from src.constants.migrations import ACTIVE_GAME_BACKFILL_BATCH_SIZE, ACTIVE_GAME_BACKFILL_PAUSE_SECONDS
+from src.models.games import GameDocument
+from src.models.matchups import MatchupDocument
+from src.utils.logger import logger
+
+
+class ActiveGameBackfill:
+    """
+    Sets `active_game_id` on matchups that predate it, in _id order, one batch at a time.
+    The newest game of each batch is found with one aggregation over the (matchup_id, created_at)
+    index, and each update only applies while the pointer is still unset, so a game created
+    mid-batch keeps the pointer its own create wrote.
+    """
+
+    def __init__(
+        self,
+        matchup_model: Type[MatchupDocument] = MatchupDocument,
+        game_model: Type[GameDocument] = GameDocument,
+        batch_size: int = ACTIVE_GAME_BACKFILL_BATCH_SIZE,
+        pause_seconds: float = ACTIVE_GAME_BACKFILL_PAUSE_SECONDS
+    ) -> None:
+        self.matchup_model: Type[MatchupDocument] = matchup_model
+        self.game_model: Type[GameDocument] = game_model
+        self.batch_size: int = batch_size
+        self.pause_seconds: float = pause_seconds
+        self.backfilled: int = 0
+        self.batches: int = 0
+
+    async def run(self) -> int:
+        logger.info(f'Active game backfill started: batch_size={self.batch_size}')
+        last_id: PydanticObjectId | None = None
+        while True:
+            filter_query: Dict[str, Any] = {'active_game_id': None}
+            if last_id is not None:
+                filter_query['_id'] = {'$gt': last_id}
+
+            matchups: List[Dict[str, Any]] = await self.matchup_model.get_motor_collection().find(
+                filter_query,
+                {'_id': 1},
+                sort=[('_id', ASCENDING)],
+                limit=self.batch_size,
+            ).to_list(length=self.batch_size)
+            if not matchups:
+                break
+
+            matchup_ids: List[PydanticObjectId] = [matchup['_id'] for matchup in matchups]
+            last_games: List[Dict[str, Any]] = await self.game_model.get_motor_collection().aggregate([
+                {'$match': {'matchup_id': {'$in': matchup_ids}}},
+                {'$sort': {'matchup_id': ASCENDING, 'created_at': DESCENDING, '_id': DESCENDING}},
+                {'$group': {'_id': '$matchup_id', 'game_id': {'$first': '$_id'}}},
+            ]).to_list(length=None)
+
+            if last_games:
+                await self.matchup_model.get_motor_collection().bulk_write(
+                    [
+                        UpdateOne(
+                            {'_id': last_game['_id'], 'active_game_id': None},
+                            {'$set': {'active_game_id': last_game['game_id']}},
+                        )
+                        for last_game in last_games
+                    ],
+                    ordered=False,
+                )
+            self.backfilled += len(last_games)
+            self.batches += 1
+            last_id = matchup_ids[-1]
+            await asyncio.sleep(self.pause_seconds)
+
+        logger.info(f'Active game backfill completed: backfilled={self.backfilled}, batches={self.batches}')
+        return self.backfilled
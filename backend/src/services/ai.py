@@ -1,13 +1,29 @@
-from typing import List
+from typing import Any, Dict, List, Tuple
+from time import monotonic
 import re
 
 from google import genai
 from google.genai.errors import APIError
 
-from src.config import GEMINI_API_KEY
-from src.constants.ai import GEMINI_MODEL, AI_RESPONSE_REGEX, AI_TIMEOUT_SECONDS
-from src.constants.game import WINNING_LINES
+from src.config import GEMINI_API_KEY, AI_MOVE_BUDGET_SECONDS
+from src.constants.ai import (
+    GEMINI_MODEL,
+    AI_RESPONSE_REGEX,
+    AI_TIMEOUT_MILLISECONDS,
+    AI_MOVE_CACHE_MAX_SIZE,
+    AI_BREAKER_FAILURE_RATE_THRESHOLD,
+    AI_BREAKER_MINIMUM_CALLS,
+    AI_BREAKER_WINDOW_SIZE,
+    AI_BREAKER_OPEN_SECONDS,
+    AI_BREAKER_HALF_OPEN_MAX_CALLS,
+    AI_RULES_PROMPT,
+)
 from src.exceptions import AIServiceError
+from src.utils.bitboard import Bitboard, to_bitboard
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.board_symmetry import canonicalize, to_canonical_cell, from_canonical_cell
+from src.utils.lru_cache import LRUCache
+from src.utils.single_flight import SingleFlight
 from src.utils.logger import logger
 
 
@@ -15,14 +31,24 @@ class AIService:
     def __init__(self) -> None:
         self.client: genai.Client | None = None
         self._initialized: bool = False
-        self._rules_cache_name: str | None = None
+        self._move_cache: LRUCache[Tuple[Bitboard, int], int] = LRUCache(AI_MOVE_CACHE_MAX_SIZE)
+        self._single_flight: SingleFlight[Tuple[Bitboard, int], int] = SingleFlight()
+        self.circuit_breaker: CircuitBreaker = CircuitBreaker(
+            name='gemini',
+            failure_rate_threshold=AI_BREAKER_FAILURE_RATE_THRESHOLD,
+            minimum_calls=AI_BREAKER_MINIMUM_CALLS,
+            window_size=AI_BREAKER_WINDOW_SIZE,
+            open_seconds=AI_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=AI_BREAKER_HALF_OPEN_MAX_CALLS,
+            slow_call_seconds=AI_MOVE_BUDGET_SECONDS,
+        )
 
     def init_client(self) -> None:
         if self._initialized and self.client is not None:
             return
 
         try:
-            self.client = genai.Client(api_key=GEMINI_API_KEY, http_options=genai.types.HttpOptions(timeout=AI_TIMEOUT_SECONDS))
+            self.client = genai.Client(api_key=GEMINI_API_KEY, http_options=genai.types.HttpOptions(timeout=AI_TIMEOUT_MILLISECONDS))
             self._initialized = True
             logger.info('Gemini Client initialized successfully')
         except Exception as e:
@@ -30,7 +56,57 @@ class AIService:
             self.client = None
             self._initialized = False
 
-    def get_next_move(self, board: List[int], ai_player_id: int, opponent_player_id: int) -> int:
+    async def get_next_move(self, board: List[int], ai_player_id: int, opponent_player_id: int) -> int:
+        canonical_board, transform = canonicalize(to_bitboard(board))
+        cache_key: Tuple[Bitboard, int] = (canonical_board, ai_player_id)
+
+        cached_move: int | None = self._move_cache.get(cache_key)
+        if cached_move is not None:
+            ai_cell_index: int = from_canonical_cell(cached_move, transform)
+            logger.info(f'AI move served from cache: cell_index={ai_cell_index}')
+            return ai_cell_index
+
+        canonical_move: int = await self._single_flight.do(
+            cache_key,
+            lambda: self._fetch_canonical_move(cache_key, board, ai_player_id, opponent_player_id, transform)
+        )
+        return from_canonical_cell(canonical_move, transform)
+
+    async def _fetch_canonical_move(
+        self,
+        cache_key: Tuple[Bitboard, int],
+        board: List[int],
+        ai_player_id: int,
+        opponent_player_id: int,
+        transform: int
+    ) -> int:
+        if not self.circuit_breaker.allow_request():
+            error_message: str = 'AI service circuit is open, skipping AI request'
+            logger.warning(error_message)
+            raise AIServiceError(error_message)
+
+        started_at: float = monotonic()
+        try:
+            ai_cell_index: int = await self._request_move(board, ai_player_id, opponent_player_id)
+        except BaseException:
+            self.circuit_breaker.record_failure(monotonic() - started_at)
+            raise
+        self.circuit_breaker.record_success(monotonic() - started_at)
+
+        canonical_move: int = to_canonical_cell(ai_cell_index, transform)
+        self._move_cache.put(cache_key, canonical_move)
+        return canonical_move
+
+    def cache_stats(self) -> Dict[str, int | float | None]:
+        return self._move_cache.stats()
+
+    def circuit_breaker_stats(self) -> Dict[str, Any]:
+        return self.circuit_breaker.snapshot()
+
+    def single_flight_stats(self) -> Dict[str, int]:
+        return self._single_flight.stats()
+
+    async def _request_move(self, board: List[int], ai_player_id: int, opponent_player_id: int) -> int:
         error_message: str
 
         logger.debug(
@@ -46,38 +122,13 @@ class AIService:
             logger.error(error_message)
             raise AIServiceError(error_message)
 
-        prompt: str = f"""
-        You are a fast Tic-Tac-Toe engine.
-
-        OUTPUT (CRITICAL):
-        - Respond with EXACTLY ONE digit between 0 and 8.
-        - No text, no explanation, no spaces, no punctuation.
-
-        GAME STATE:
-        - Board (0=empty, 1=X, 2=O): {board}
-        - You are player {ai_player_id}.
-        - Opponent: {opponent_player_id}.
-        - It is your turn.
-        - Winning lines: {WINNING_LINES}
-
-        RULES:
-        1. Choose a legal empty cell (value 0).
-        2. If you can win now, choose that cell.
-        3. Else if opponent can win next turn, block them.
-        4. Else choose the best move for you.
-        5. If only one empty cell remains, choose it.
-
-        RETURN:
-        Only the chosen cell index (0–8). ONE digit. Nothing else.
-        """
+        prompt: str = (
+            f'Board: {board}\n'
+            f'You are player {ai_player_id}. Opponent: {opponent_player_id}. It is your turn.'
+        )
 
         try:
-            result = self.client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt
-            )
-
-            response: str = getattr(result, 'text', '')
+            response: str = await self._generate(prompt)
             logger.debug(f'Raw Gemini result: {response!r}')
 
         except APIError as e:
@@ -93,7 +144,13 @@ class AIService:
         logger.info(f'AI selected cell index: {ai_cell_index}')
         return ai_cell_index
 
-
+    async def _generate(self, prompt: str) -> str:
+        result = await self.client.aio.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=prompt,
+            config=genai.types.GenerateContentConfig(system_instruction=AI_RULES_PROMPT)
+        )
+        return getattr(result, 'text', '') or ''
 
     def validate_response(self, response: str, board: List[int]) -> int:
         raw_text: str = response.strip()
@@ -0,0 +1,97 @@
+from typing import Awaitable, Callable, Dict, Tuple
+from time import monotonic
+import asyncio
+
+from src.constants.ai import AI_PREFETCH_MAX_PENDING, AI_PREFETCH_TTL_SECONDS
+from src.models.games import CellIndex, PlayerIndex
+from src.utils.bitboard import Bitboard
+from src.utils.logger import logger
+
+
+PrefetchKey = Tuple[Bitboard, PlayerIndex]
+
+
+class AIMovePrefetcher:
+    """
+    Holds AI replies computed in the background right after a human move,
+    keyed by game and by the exact position the reply was computed for.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = AI_PREFETCH_MAX_PENDING,
+        ttl_seconds: float = AI_PREFETCH_TTL_SECONDS
+    ) -> None:
+        self.max_pending: int = max_pending
+        self.ttl_seconds: float = ttl_seconds
+        self._pending: Dict[str, Tuple[PrefetchKey, float, asyncio.Task[CellIndex | None]]] = {}
+        self.scheduled: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.discarded: int = 0
+
+    def schedule(
+        self,
+        game_id: str,
+        board: Bitboard,
+        ai_player_id: PlayerIndex,
+        compute: Callable[[], Awaitable[CellIndex | None]]
+    ) -> None:
+        self._discard(game_id)
+        self._purge_expired()
+        while len(self._pending) >= self.max_pending:
+            self._discard(next(iter(self._pending)))
+
+        task: asyncio.Task[CellIndex | None] = asyncio.create_task(self._run(game_id, compute))
+        self._pending[game_id] = ((board, ai_player_id), monotonic(), task)
+        self.scheduled += 1
+
+    async def collect(self, game_id: str, board: Bitboard, ai_player_id: PlayerIndex) -> CellIndex | None:
+        entry: Tuple[PrefetchKey, float, asyncio.Task[CellIndex | None]] | None = self._pending.pop(game_id, None)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        key, _, task = entry
+        if key != (board, ai_player_id):
+            task.cancel()
+            self.discarded += 1
+            self.misses += 1
+            return None
+
+        move: CellIndex | None = await task
+        if move is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return move
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pending': len(self._pending),
+            'scheduled': self.scheduled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'discarded': self.discarded,
+        }
+
+    async def _run(self, game_id: str, compute: Callable[[], Awaitable[CellIndex | None]]) -> CellIndex | None:
+        try:
+            return await compute()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f'Speculative AI move failed: game_id={game_id}', exception=e)
+            return None
+
+    def _discard(self, game_id: str) -> None:
+        entry: Tuple[PrefetchKey, float, asyncio.Task[CellIndex | None]] | None = self._pending.pop(game_id, None)
+        if entry is not None:
+            entry[2].cancel()
+            self.discarded += 1
+
+    def _purge_expired(self) -> None:
+        now: float = monotonic()
+        expired = [game_id for game_id, (_, created_at, _) in self._pending.items() if now - created_at > self.ttl_seconds]
+        for game_id in expired:
+            self._discard(game_id)
@@ -1,15 +1,23 @@
-from typing import List
+from typing import List, Tuple
+from datetime import datetime, timezone
+import asyncio
+
 from beanie import PydanticObjectId
 from src.dal.matchups import MatchupsDAL
 from src.dal.games import GamesDAL
-from src.models.matchups import MatchupDocument
+from src.dal.moves import MovesDAL
+from src.config import AI_ENGINE, AI_MOVE_BUDGET_SECONDS
+from src.models.matchups import AIEngine, MatchMode, MatchupDocument, MatchupSummary, MatchupsPage
 from src.models.responses import UpdateResponse
-from src.models.games import GameDocument, PlayerIndex, CellIndex, BoardCell
+from src.models.moves import GameReplay, MoveCreate, MoveDocument, MoveEntry
+from src.models.games import GameDocument, GameHistoryItem, GameSummary, GamesPage, PlayerIndex, CellIndex, BoardCell
 from src.exceptions import (
     GameNotFoundError,
     MatchupNotFoundError,
     InvalidMoveError,
+    InvalidMatchupError,
     GameFinishedError,
+    MoveConflictError,
     AIServiceError
 )
 from src.utils.game import (
@@ -21,15 +29,31 @@ from src.utils.game import (
     ensure_valid_cell_index
     )
 from src.services.ai import AIService
-from src.utils.ai_fallback import get_fallback_move
+from src.services.ai_prefetch import AIMovePrefetcher
+from src.services.game_sessions import GameSession, GameSessionRegistry
+from src.utils.bitboard import Bitboard, count_plies, to_base3, to_bitboard, from_bitboard, place
+from src.utils.replay import is_snapshot_ply, replay_board
+from src.utils.ai_solver import get_perfect_move
+from src.utils.pagination import Cursor, encode_cursor, decode_cursor
 from src.utils.logger import logger
 
 
 class GameService:
-    def __init__(self, matchups_dal: MatchupsDAL, games_dal: GamesDAL, ai_service: AIService) -> None:
+    def __init__(
+        self,
+        matchups_dal: MatchupsDAL,
+        games_dal: GamesDAL,
+        ai_service: AIService,
+        ai_prefetcher: AIMovePrefetcher | None = None,
+        moves_dal: MovesDAL | None = None,
+        game_sessions: GameSessionRegistry | None = None
+    ) -> None:
         self.matchups_dal: MatchupsDAL = matchups_dal
         self.games_dal: GamesDAL = games_dal
         self.ai_service: AIService = ai_service
+        self.ai_prefetcher: AIMovePrefetcher | None = ai_prefetcher
+        self.moves_dal: MovesDAL = moves_dal or MovesDAL()
+        self.game_sessions: GameSessionRegistry | None = game_sessions
 
     async def create_new_game(self, matchup_id: PydanticObjectId, starting_player_raw: int) -> GameDocument:
         try:
@@ -41,6 +65,7 @@ class GameService:
             matchup_id=matchup_id,
             starting_player=starting_player
         )
+        await self.matchups_dal.set_active_game(matchup_id, game.id)
 
         return game
 
@@ -59,13 +84,25 @@ class GameService:
         player2_name: str,
         mode: str,
         starting_player_raw: int,
+        ai_engine: str | None = None,
     ) -> UpdateResponse:
-        logger.info(f'Creating new matchup: user_id={user_id}, player1={player1_name}, player2={player2_name}, mode={mode}')
+        logger.info(f'Creating new matchup: user_id={user_id}, player1={player1_name}, player2={player2_name}, mode={mode}, ai_engine={ai_engine}')
+        try:
+            engine: AIEngine | None = AIEngine(ai_engine) if ai_engine is not None else None
+        except ValueError:
+            raise InvalidMatchupError(f'Unknown AI engine: {ai_engine}')
+        # Checked before the matchup is written, so a bad request leaves no matchup without a game
+        try:
+            ensure_valid_player_index(starting_player_raw)
+        except ValueError as e:
+            raise InvalidMatchupError(str(e))
+
         matchup: MatchupDocument = await self.matchups_dal.create_matchup(
             user_id=user_id,
             player1_name=player1_name,
             player2_name=player2_name,
             mode=mode,
+            ai_engine=engine,
         )
 
         game: GameDocument = await self.create_new_game(
@@ -76,11 +113,69 @@ class GameService:
         logger.info(f'Matchup and game created: matchup_id={matchup.id}, game_id={game.id}')
         return UpdateResponse(matchup=matchup, game=game)
 
-    async def get_matchups_list_for_user(self, user_id: PydanticObjectId) -> List[MatchupDocument]:
-        return await self.matchups_dal.list_matchups_for_user(user_id)
+    async def get_matchups_page_for_user(
+        self,
+        user_id: PydanticObjectId,
+        limit: int,
+        cursor: str | None = None
+    ) -> MatchupsPage:
+        after: Cursor | None = decode_cursor(cursor) if cursor else None
+        items: List[MatchupSummary] = await self.matchups_dal.list_matchups_page_for_user(user_id, limit + 1, after)
+
+        next_cursor: str | None = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].updated_at, items[-1].id)
+
+        return MatchupsPage(items=items, next_cursor=next_cursor)
+
+    async def get_games_page_for_matchup(
+        self,
+        matchup_id: PydanticObjectId,
+        limit: int,
+        cursor: str | None = None
+    ) -> GamesPage:
+        after: Cursor | None = decode_cursor(cursor) if cursor else None
+        games: List[GameSummary] = await self.games_dal.list_games_page_for_matchup(matchup_id, limit + 1, after)
+
+        next_cursor: str | None = None
+        if len(games) > limit:
+            games = games[:limit]
+            next_cursor = encode_cursor(games[-1].created_at, games[-1].id)
+
+        items: List[GameHistoryItem] = [
+            GameHistoryItem(
+                id=game.id,
+                board=game.board_code,
+                is_finished=game.is_finished,
+                winner=game.winner,
+                winning_line=game.winning_line,
+                created_at=game.created_at,
+            )
+            for game in games
+        ]
+        return GamesPage(items=items, next_cursor=next_cursor)
 
     async def get_last_game_for_matchup(self, matchup_id: PydanticObjectId) -> GameDocument | None:
-        return await self.games_dal.get_last_game_for_matchup(matchup_id)
+        game: GameDocument | None = await self.games_dal.get_last_game_for_matchup(matchup_id)
+        if game is not None and self.game_sessions is not None:
+            return self.game_sessions.peek(str(game.id)) or game
+        return game
+
+    async def get_matchup_active_game(self, matchup_id: PydanticObjectId) -> UpdateResponse:
+        matchup, game = await self.matchups_dal.get_matchup_with_active_game(matchup_id)
+        if matchup is None:
+            warning_message: str = f'Matchup not found: matchup_id={matchup_id}'
+            logger.warning(warning_message)
+            raise MatchupNotFoundError(warning_message)
+
+        if matchup.active_game_id is None:
+            # Matchup created before active games were tracked and not backfilled yet
+            game = await self.games_dal.get_last_game_for_matchup(matchup_id)
+        if game is not None and self.game_sessions is not None:
+            game = self.game_sessions.peek(str(game.id)) or game
+
+        return UpdateResponse(matchup=matchup, game=game)
 
     async def update_player_name(
         self,
@@ -110,7 +205,41 @@ class GameService:
         self,
         game_id: str,
         player_id_raw: int,
-        cell_index_raw: int
+        cell_index_raw: int,
+        with_ai_reply: bool = False
+    ) -> UpdateResponse:
+        response: UpdateResponse = await self.apply_move(game_id, player_id_raw, cell_index_raw)
+        game: GameDocument | None = response.game
+        if game is None or game.is_finished:
+            return response
+
+        if with_ai_reply:
+            ai_move: CellIndex | None = await self.compute_ai_reply(game.matchup_id, game.board, game.current_turn)
+            if ai_move is None:
+                return response
+            reply: UpdateResponse = await self.apply_move(game_id, game.current_turn, ai_move, game)
+            return UpdateResponse(matchup=reply.matchup or response.matchup, game=reply.game)
+
+        if self.ai_prefetcher is not None:
+            matchup: MatchupDocument | None = await self.matchups_dal.get_matchup_by_id(game.matchup_id)
+            # Only AI matchups ever collect a reply, so friend games would compute one for nothing
+            if matchup is not None and matchup.mode == MatchMode.ai:
+                engine: AIEngine = self.resolve_ai_engine(matchup)
+                self.ai_prefetcher.schedule(
+                    game_id,
+                    to_bitboard(game.board),
+                    game.current_turn,
+                    lambda: self.compute_ai_move(game.board, game.current_turn, engine),
+                )
+
+        return response
+
+    async def apply_move(
+        self,
+        game_id: str,
+        player_id_raw: int,
+        cell_index_raw: int,
+        game: GameDocument | None = None
     ) -> UpdateResponse:
         try:
             player_id: PlayerIndex = ensure_valid_player_index(player_id_raw)
@@ -118,55 +247,146 @@ class GameService:
         except ValueError as e:
             raise InvalidMoveError(str(e))
 
-        game: GameDocument | None = await self.games_dal.get_game_by_id(game_id)
-        
-        await self.validate_move(game, player_id, cell_index)
-        
-        new_board: List[BoardCell] = game.board.copy()
-        new_board[cell_index] = player_id
+        if self.game_sessions is not None:
+            async with self.game_sessions.session(game_id) as session:
+                return await self.apply_move_in_session(session, player_id, cell_index)
+
+        if game is None:
+            game = await self.get_game_or_raise(game_id)
+
+        next_game, move = await self.play(game, player_id, cell_index)
+        updated_game: GameDocument | None = await self.games_dal.apply_move(
+            game,
+            board=next_game.board,
+            current_turn=next_game.current_turn,
+            is_finished=next_game.is_finished,
+            winner=next_game.winner,
+            winning_triplet=next_game.winning_triplet,
+        )
+        if updated_game is None:
+            warning_message: str = f'Game was changed by a concurrent move: game_id={game_id}'
+            logger.warning(warning_message)
+            raise MoveConflictError(warning_message)
+
+        updated_matchup: MatchupDocument | None = None
+        if next_game.winner is not None:
+            updated_matchup, _ = await asyncio.gather(
+                self.matchups_dal.increase_player_score_by_one(game.matchup_id, player_id),
+                self.log_move(move),
+            )
+        else:
+            await self.log_move(move)
+
+        return UpdateResponse(matchup=updated_matchup, game=updated_game)
+
+    async def apply_move_in_session(
+        self,
+        session: GameSession,
+        player_id: PlayerIndex,
+        cell_index: CellIndex
+    ) -> UpdateResponse:
+        """Applies the move in memory; only a finishing move waits for the write-behind flush."""
+        next_game, move = await self.play(session.game, player_id, cell_index)
+        session.record(next_game, move)
+
+        updated_matchup: MatchupDocument | None = None
+        if next_game.is_finished:
+            # The flush also scores the win; if it fails, the sweeper retries both together
+            updated_matchup = await self.game_sessions.flush(session)
+
+        return UpdateResponse(matchup=updated_matchup, game=session.game)
+
+    async def play(
+        self,
+        game: GameDocument,
+        player_id: PlayerIndex,
+        cell_index: CellIndex
+    ) -> Tuple[GameDocument, MoveCreate]:
+        """Validates the move and returns the game state after it, plus its move log entry."""
+        board: Bitboard = to_bitboard(game.board)
+        await self.validate_move(game, board, player_id, cell_index)
+
+        new_board: Bitboard = place(board, cell_index, player_id)
 
         winner_triplet: List[CellIndex] | None = check_game_winner_triplet(
             new_board,
             cell_index,
             player_id,
         )
-        updated_matchup: MatchupDocument | None = None
+        current_turn: PlayerIndex = game.current_turn
+        is_finished: bool = False
 
         if winner_triplet:
-            logger.info(f'Game finished with winner: game_id={game_id}, winner={player_id}')
-            game.winner = player_id
-            game.winning_triplet = winner_triplet
-            game.is_finished = True
-            updated_matchup = await self.matchups_dal.increase_player_score_by_one(
-                game.matchup_id,
-                player_id,
-            )
+            logger.info(f'Game finished with winner: game_id={game.id}, winner={player_id}')
+            is_finished = True
         elif is_board_full(new_board):
-            logger.info(f'Game finished with draw: game_id={game_id}')
-            game.is_finished = True
+            logger.info(f'Game finished with draw: game_id={game.id}')
+            is_finished = True
         else:
-            game.current_turn = get_next_turn(player_id)
-
-        updated_game: GameDocument = await self.games_dal.update_game_state(
-            game_id=game_id,
-            board=new_board,
-            current_turn=game.current_turn,
-            is_finished=game.is_finished,
-            winner=game.winner,
-            winning_triplet=game.winning_triplet,
+            current_turn = get_next_turn(player_id)
+
+        next_game: GameDocument = game.model_copy(update={
+            'board': from_bitboard(new_board),
+            'current_turn': current_turn,
+            'is_finished': is_finished,
+            'winner': player_id if winner_triplet else None,
+            'winning_triplet': winner_triplet,
+            'updated_at': datetime.now(timezone.utc),
+        })
+        ply: int = count_plies(new_board)
+        move: MoveCreate = MoveCreate(
+            game_id=game.id,
+            ply=ply,
+            player=player_id,
+            cell=cell_index,
+            snapshot=to_base3(new_board) if is_snapshot_ply(ply) else None,
         )
+        return next_game, move
 
-        return UpdateResponse(matchup=updated_matchup, game=updated_game)
-    
+    async def log_move(self, move: MoveCreate) -> None:
+        # The game document stays the source of truth, so a failed append must not fail the move
+        try:
+            await self.moves_dal.append_move(move)
+        except Exception as e:
+            logger.error(f'Failed to append move to log: game_id={move.game_id}, ply={move.ply}', exception=e)
+
+    async def get_game_moves(self, game_id: str) -> List[MoveEntry]:
+        if self.game_sessions is not None:
+            await self.game_sessions.flush_game(game_id)
+        game: GameDocument = await self.get_game_or_raise(game_id)
+        moves: List[MoveDocument] = await self.moves_dal.list_moves_for_game(game.id)
+        return [MoveEntry(ply=m.ply, player=m.player, cell=m.cell, created_at=m.created_at) for m in moves]
+
+    async def replay_game(self, game_id: str, ply: int | None = None) -> GameReplay:
+        if self.game_sessions is not None:
+            await self.game_sessions.flush_game(game_id)
+        game: GameDocument = await self.get_game_or_raise(game_id)
+        last_ply: int = count_plies(to_bitboard(game.board))
+        if ply is None:
+            ply = last_ply
+        if ply < 0 or ply > last_ply:
+            raise InvalidMoveError(f'Ply must be between 0 and {last_ply}: game_id={game_id}, ply={ply}')
 
-    async def validate_move(self, game: GameDocument, player_id: PlayerIndex, cell_index: CellIndex) -> None:
+        moves: List[MoveDocument] = await self.moves_dal.list_moves_since_snapshot(game.id, ply) if ply else []
+        # A failed append in log_move leaves the log short; replaying it would return a stale board
+        return GameReplay(game_id=game.id, ply=ply, board=from_bitboard(replay_board(moves, ply)))
+
+    async def get_game_or_raise(self, game_id: str) -> GameDocument:
+        game: GameDocument | None = await self.games_dal.get_game_by_id(game_id)
+        if game is None:
+            warning_message: str = f'Game not found: game_id={game_id}'
+            logger.warning(warning_message)
+            raise GameNotFoundError(warning_message)
+        return game
+
+    async def validate_move(self, game: GameDocument, board: Bitboard, player_id: PlayerIndex, cell_index: CellIndex) -> None:
         warning_message: str
         if game.is_finished:
             warning_message = f'Attempted move on finished game: game_id={game.id}'
             logger.warning(warning_message)
             raise GameFinishedError(warning_message)
 
-        if not validate_player_move(game.board, game.current_turn, player_id, cell_index):
+        if not validate_player_move(board, game.current_turn, player_id, cell_index):
             warning_message = f'Invalid move: game_id={game.id}, player_id={player_id}, cell_index={cell_index}'
             logger.warning(warning_message)
             raise InvalidMoveError(warning_message)
@@ -177,19 +397,73 @@ class GameService:
         ai_player_id: int
     ) -> UpdateResponse:
         logger.info(f'AI move requested: game_id={game_id}, ai_player_id={ai_player_id}')
-        game: GameDocument | None = await self.games_dal.get_game_by_id(game_id)
+        game: GameDocument | None = self.game_sessions.peek(game_id) if self.game_sessions is not None else None
+        if game is None:
+            game = await self.games_dal.get_game_by_id(game_id)
         if not game:
             warning_message: str = f'Game not found for AI move: game_id={game_id}'
             logger.warning(warning_message)
             raise GameNotFoundError(warning_message)
 
-        ai_move: int
+        ai_move: CellIndex | None = None
+        if self.ai_prefetcher is not None:
+            ai_move = await self.ai_prefetcher.collect(game_id, to_bitboard(game.board), ai_player_id)
+
+        if ai_move is None:
+            matchup: MatchupDocument | None = await self.matchups_dal.get_matchup_by_id(game.matchup_id)
+            ai_move = await self.compute_ai_move(game.board, ai_player_id, self.resolve_ai_engine(matchup))
+        else:
+            logger.info(f'AI move served from speculative precomputation: game_id={game_id}, cell_index={ai_move}')
+
+        return await self.apply_move(game_id, ai_player_id, ai_move, game)
+
+    async def compute_ai_reply(
+        self,
+        matchup_id: PydanticObjectId,
+        board: List[BoardCell],
+        ai_player_id: PlayerIndex
+    ) -> CellIndex | None:
+        matchup: MatchupDocument | None = await self.matchups_dal.get_matchup_by_id(matchup_id)
+        if matchup is None or matchup.mode != MatchMode.ai:
+            return None
+        return await self.compute_ai_move(board, ai_player_id, self.resolve_ai_engine(matchup))
+
+    async def compute_ai_move(
+        self,
+        board: List[BoardCell],
+        ai_player_id: PlayerIndex,
+        engine: AIEngine
+    ) -> CellIndex:
         opponent_player_id: PlayerIndex = 2 if ai_player_id == 1 else 1
+        if engine == AIEngine.solver:
+            return get_perfect_move(board, ai_player_id, opponent_player_id)
+        return await self.get_remote_ai_move(board, ai_player_id, opponent_player_id)
+
+    async def get_remote_ai_move(
+        self,
+        board: List[BoardCell],
+        ai_player_id: PlayerIndex,
+        opponent_player_id: PlayerIndex
+    ) -> CellIndex:
+        local_move: CellIndex = get_perfect_move(board, ai_player_id, opponent_player_id)
         try:
-            ai_move = self.ai_service.get_next_move(game.board, ai_player_id, opponent_player_id)
+            return await asyncio.wait_for(
+                self.ai_service.get_next_move(board, ai_player_id, opponent_player_id),
+                timeout=AI_MOVE_BUDGET_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f'AI move exceeded {AI_MOVE_BUDGET_SECONDS}s budget, using local engine move: {local_move}')
         except AIServiceError as e:
-            logger.warning(f'AI move failed, using deterministic fallback move: {str(e)}')
-            ai_move = get_fallback_move(game.board, ai_player_id, opponent_player_id)
+            logger.warning(f'AI move failed, using local engine move: {str(e)}')
+        return local_move
 
-        return await self.player_move(game_id, ai_player_id, ai_move)
+    def resolve_ai_engine(self, matchup: MatchupDocument | None) -> AIEngine:
+        if matchup is not None and matchup.ai_engine is not None:
+            return matchup.ai_engine
+
+        try:
+            return AIEngine(AI_ENGINE)
+        except ValueError:
+            logger.warning(f'Unknown AI_ENGINE configured: {AI_ENGINE}, using solver')
+            return AIEngine.solver
 
@@ -0,0 +1,226 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+import asyncio
+import time
+
+from src.constants.game_sessions import (
+    GAME_SESSION_FLUSH_SECONDS,
+    GAME_SESSION_IDLE_SECONDS,
+    GAME_SESSION_MAX_ACTIVE,
+)
+from src.dal.games import GamesDAL
+from src.dal.matchups import MatchupsDAL
+from src.dal.moves import MovesDAL
+from src.exceptions import GameNotFoundError, MoveConflictError
+from src.models.games import GameDocument, PlayerIndex
+from src.models.matchups import MatchupDocument
+from src.models.moves import MoveCreate
+from src.utils.logger import logger
+
+
+class GameSession:
+    """In-memory state of one active game. Holding `lock` is what serializes its moves."""
+
+    def __init__(self, game_id: str) -> None:
+        self.game_id: str = game_id
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.game: GameDocument | None = None
+        # Last state known to be in MongoDB; flushes are guarded on it
+        self.persisted: GameDocument | None = None
+        self.pending_moves: List[MoveCreate] = []
+        # Winner of a finished game already in MongoDB whose matchup score is not incremented yet
+        self.unscored_winner: PlayerIndex | None = None
+        self.last_used: float = time.monotonic()
+        self.closed: bool = False
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.pending_moves) or self.unscored_winner is not None
+
+    def record(self, game: GameDocument, move: MoveCreate) -> None:
+        self.game = game
+        self.pending_moves.append(move)
+
+
+class GameSessionRegistry:
+    """
+    Keeps active games in memory so moves skip the database, and persists them write-behind:
+    every `flush_seconds`, when a game finishes, before a session is evicted and on shutdown.
+    The flush that persists a win also increments the winner's score, so whichever flush lands
+    it, the score follows the game.
+    Only safe when each game is served by a single process; a flush that finds the stored game
+    changed underneath it drops the session instead of overwriting.
+    """
+
+    def __init__(
+        self,
+        games_dal: GamesDAL,
+        moves_dal: MovesDAL,
+        matchups_dal: MatchupsDAL,
+        flush_seconds: float = GAME_SESSION_FLUSH_SECONDS,
+        idle_seconds: float = GAME_SESSION_IDLE_SECONDS,
+        max_active: int = GAME_SESSION_MAX_ACTIVE
+    ) -> None:
+        self.games_dal: GamesDAL = games_dal
+        self.moves_dal: MovesDAL = moves_dal
+        self.matchups_dal: MatchupsDAL = matchups_dal
+        self.flush_seconds: float = flush_seconds
+        self.idle_seconds: float = idle_seconds
+        self.max_active: int = max_active
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+        self._sweeper: asyncio.Task[None] | None = None
+        self.hydrations: int = 0
+        self.flushes: int = 0
+        self.flushed_moves: int = 0
+        self.conflicts: int = 0
+        self.evictions: int = 0
+
+    @asynccontextmanager
+    async def session(self, game_id: str) -> AsyncIterator[GameSession]:
+        """Yields the game's session with its lock held, loading it from GamesDAL on a miss."""
+        while True:
+            session: GameSession | None = self._sessions.get(game_id)
+            if session is None:
+                session = GameSession(game_id)
+                self._sessions[game_id] = session
+            self._sessions.move_to_end(game_id)
+
+            async with session.lock:
+                if session.closed:
+                    continue
+                if session.game is None:
+                    await self._hydrate(session)
+                session.last_used = time.monotonic()
+                yield session
+                return
+
+    async def _hydrate(self, session: GameSession) -> None:
+        try:
+            game: GameDocument | None = await self.games_dal.get_game_by_id(session.game_id)
+        except BaseException:
+            self._close(session)
+            raise
+        if game is None:
+            self._close(session)
+            raise GameNotFoundError(f'Game not found: game_id={session.game_id}')
+        session.game = session.persisted = game
+        self.hydrations += 1
+
+    def peek(self, game_id: str) -> GameDocument | None:
+        """Latest in-memory state of a game, possibly ahead of MongoDB."""
+        session: GameSession | None = self._sessions.get(game_id)
+        return session.game if session is not None else None
+
+    async def flush(self, session: GameSession) -> MatchupDocument | None:
+        """
+        Persists a session's pending moves, then the score of a win they finished the game with, and
+        returns the updated matchup if it did. Must be called with the session lock held.
+        """
+        if session.pending_moves:
+            await self._flush_moves(session)
+        if session.unscored_winner is None:
+            return None
+
+        matchup: MatchupDocument = await self.matchups_dal.increase_player_score_by_one(
+            session.game.matchup_id,
+            session.unscored_winner,
+        )
+        session.unscored_winner = None
+        return matchup
+
+    async def _flush_moves(self, session: GameSession) -> None:
+        game: GameDocument = session.game
+        updated: GameDocument | None = await self.games_dal.apply_move(
+            session.persisted,
+            board=game.board,
+            current_turn=game.current_turn,
+            is_finished=game.is_finished,
+            winner=game.winner,
+            winning_triplet=game.winning_triplet,
+        )
+        if updated is None:
+            self.conflicts += 1
+            self._close(session)
+            raise MoveConflictError(f'Game was changed outside its session: game_id={session.game_id}')
+
+        moves: List[MoveCreate] = session.pending_moves
+        session.persisted = updated
+        session.pending_moves = []
+        if game.winner is not None:
+            session.unscored_winner = game.winner
+        self.flushes += 1
+        self.flushed_moves += len(moves)
+        try:
+            await self.moves_dal.append_moves(moves)
+        except Exception as e:
+            logger.error(f'Failed to append moves to log: game_id={session.game_id}, moves={len(moves)}', exception=e)
+
+    async def flush_game(self, game_id: str) -> None:
+        session: GameSession | None = self._sessions.get(game_id)
+        if session is None:
+            return
+        async with session.lock:
+            if not session.closed:
+                await self.flush(session)
+
+    async def sweep(self, evict_all: bool = False) -> None:
+        """
+        Flushes dirty sessions and evicts idle or finished ones, plus the least recently used beyond
+        `max_active`. Sessions busy with a move are skipped unless `evict_all` is set.
+        """
+        now: float = time.monotonic()
+        overflow: int = len(self._sessions) - self.max_active
+        for session in list(self._sessions.values()):
+            if session.lock.locked() and not evict_all:
+                continue
+            evict: bool = evict_all or overflow > 0 or now - session.last_used >= self.idle_seconds
+            async with session.lock:
+                if session.closed:
+                    continue
+                try:
+                    await self.flush(session)
+                except MoveConflictError as e:
+                    logger.error(str(e), exception=e)
+                    continue
+                except Exception as e:
+                    logger.error(f'Write-behind flush failed: game_id={session.game_id}', exception=e)
+                    continue
+                if evict or (session.game is not None and session.game.is_finished):
+                    self._close(session)
+                    self.evictions += 1
+                    overflow -= 1
+
+    def _close(self, session: GameSession) -> None:
+        session.closed = True
+        if self._sessions.get(session.game_id) is session:
+            del self._sessions[session.game_id]
+
+    async def _run_sweeper(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error('Game session sweep failed', exception=e)
+
+    def start(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._run_sweeper())
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        await self.sweep(evict_all=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'active': len(self._sessions),
+            'dirty': sum(1 for session in self._sessions.values() if session.dirty),
+            'hydrations': self.hydrations,
+            'flushes': self.flushes,
+            'flushed_moves': self.flushed_moves,
+            'conflicts': self.conflicts,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,84 @@
+from typing import Any, Dict, List, Type
+import asyncio
+
+from beanie import PydanticObjectId
+from pymongo import ASCENDING, UpdateOne
+
+from src.constants.migrations import GAME_STORAGE_MIGRATION_BATCH_SIZE, GAME_STORAGE_MIGRATION_PAUSE_SECONDS
+from src.models.games import GameDocument
+from src.utils.game_storage import ARRAY_BOARD_FIELDS, encode_board_fields, stale_board_fields
+from src.utils.logger import logger
+
+
+class GameStorageMigration:
+    """
+    Rewrites array-format games into the compact format in _id order, one batch at a time.
+    Each update is guarded on the board it read, so a move landing mid-batch is left for the
+    move itself to convert rather than overwritten.
+    """
+
+    def __init__(
+        self,
+        model: Type[GameDocument] = GameDocument,
+        batch_size: int = GAME_STORAGE_MIGRATION_BATCH_SIZE,
+        pause_seconds: float = GAME_STORAGE_MIGRATION_PAUSE_SECONDS
+    ) -> None:
+        self.model: Type[GameDocument] = model
+        self.batch_size: int = batch_size
+        self.pause_seconds: float = pause_seconds
+        self.migrated: int = 0
+        self.batches: int = 0
+        self.completed: bool = False
+
+    async def run(self) -> int:
+        logger.info(f'Game storage migration started: batch_size={self.batch_size}')
+        while True:
+            await self._migrate_pass()
+            # Games written in the array format behind the scan (e.g. by an older instance) need another pass
+            if await self.model.get_motor_collection().find_one({'board': {'$exists': True}}, {'_id': 1}) is None:
+                break
+
+        self.completed = True
+        logger.info(f'Game storage migration completed: migrated={self.migrated}, batches={self.batches}')
+        return self.migrated
+
+    async def _migrate_pass(self) -> None:
+        last_id: PydanticObjectId | None = None
+        while True:
+            filter_query: Dict[str, Any] = {'board': {'$exists': True}}
+            if last_id is not None:
+                filter_query['_id'] = {'$gt': last_id}
+
+            games: List[Dict[str, Any]] = await self.model.get_motor_collection().find(
+                filter_query,
+                {'_id': 1, **{field: 1 for field in ARRAY_BOARD_FIELDS}},
+                sort=[('_id', ASCENDING)],
+                limit=self.batch_size,
+            ).to_list(length=self.batch_size)
+            if not games:
+                return
+
+            await self.model.get_motor_collection().bulk_write(
+                [
+                    UpdateOne(
+                        {'_id': game['_id'], 'board': game['board']},
+                        {
+                            '$set': encode_board_fields(game['board'], game.get('winning_triplet'), compact=True),
+                            '$unset': stale_board_fields(compact=True),
+                        },
+                    )
+                    for game in games
+                ],
+                ordered=False,
+            )
+            self.migrated += len(games)
+            self.batches += 1
+            last_id = games[-1]['_id']
+            await asyncio.sleep(self.pause_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'migrated': self.migrated,
+            'batches': self.batches,
+            'completed': self.completed,
+        }
@@ -0,0 +1,80 @@
+from typing import Dict, List, Tuple
+
+from src.constants.game import BASE_CELLS_PRIORITY
+from src.exceptions import InvalidMoveError
+from src.models.games import BoardCell, CellIndex, PlayerIndex
+from src.utils.bitboard import (
+    Bitboard,
+    as_bitboard,
+    empty_mask,
+    has_winner,
+    place,
+    winning_line_index,
+)
+from src.utils.move_table import lookup_move
+
+
+Solution = Tuple[int, int | None]
+
+_solutions: Dict[Tuple[Bitboard, int], Solution] = {}
+
+
+def _solve(bitboard: Bitboard, player_id: PlayerIndex) -> Solution:
+    """
+    Negamax over the position with `player_id` to move.
+    Returns (score, best_move) from the mover's perspective: positive is a win
+    (faster wins score higher), zero is a draw, negative is a loss.
+    """
+    position: Tuple[Bitboard, int] = (bitboard, player_id)
+    cached: Solution | None = _solutions.get(position)
+    if cached is not None:
+        return cached
+
+    opponent_id: PlayerIndex = 2 if player_id == 1 else 1
+    empty: int = empty_mask(bitboard)
+    empty_cells: int = bin(empty).count('1')
+    best_score: int = -10
+    best_move: int | None = None
+
+    for idx in BASE_CELLS_PRIORITY:
+        if not empty >> idx & 1:
+            continue
+
+        next_bitboard: Bitboard = place(bitboard, idx, player_id)
+        if winning_line_index(next_bitboard, idx, player_id) is not None:
+            score = empty_cells
+        elif empty_cells == 1:
+            score = 0
+        else:
+            score = -_solve(next_bitboard, opponent_id)[0]
+
+        if score > best_score:
+            best_score, best_move = score, idx
+
+    solution: Solution = (best_score if best_move is not None else 0, best_move)
+    _solutions[position] = solution
+    return solution
+
+
+def solve_all_positions() -> int:
+    """Solve every position reachable from the empty board for both starting players."""
+    for starting_player in (1, 2):
+        _solve(0, starting_player)
+    return len(_solutions)
+
+
+def solve_best_move(bitboard: Bitboard, player_id: PlayerIndex) -> CellIndex | None:
+    """Best move straight from the solver, or None if the position is already decided."""
+    if has_winner(bitboard):
+        return None
+    return _solve(bitboard, player_id)[1]
+
+
+def get_perfect_move(board: List[BoardCell] | Bitboard, ai_player_id: PlayerIndex, opponent_player_id: PlayerIndex) -> CellIndex:
+    bitboard: Bitboard = as_bitboard(board)
+    move: CellIndex | None = lookup_move(bitboard, ai_player_id)
+    if move is None:
+        _, move = _solve(bitboard, ai_player_id)
+    if move is None:
+        raise InvalidMoveError('No empty cells available for perfect move')
+    return move
@@ -0,0 +1,115 @@
+from typing import List
+
+from src.constants.game import (
+    BOARD_SIZE,
+    FULL_BOARD_MASK,
+    WINNING_LINE_MASKS,
+    CELL_WINNING_LINES,
+)
+from src.models.games import BoardCell, CellIndex, PlayerIndex
+
+
+# Bits 0-8 hold player 1's cells and bits 9-17 hold player 2's cells.
+# A cell with both bits set is occupied but owned by neither player.
+Bitboard = int
+
+PLAYER_2_SHIFT: int = BOARD_SIZE
+BASE3_STATES: int = 3 ** BOARD_SIZE
+
+_BASE3_WEIGHTS: List[int] = [
+    sum(3 ** i for i in range(BOARD_SIZE) if mask >> i & 1)
+    for mask in range(FULL_BOARD_MASK + 1)
+]
+
+
+def to_bitboard(board: List[BoardCell]) -> Bitboard:
+    bitboard: Bitboard = 0
+    for cell_index, value in enumerate(board):
+        if value == 1:
+            bitboard |= 1 << cell_index
+        elif value == 2:
+            bitboard |= 1 << (cell_index + PLAYER_2_SHIFT)
+        elif value != 0:
+            bitboard |= (1 << cell_index) | (1 << (cell_index + PLAYER_2_SHIFT))
+    return bitboard
+
+
+def from_bitboard(bitboard: Bitboard) -> List[BoardCell]:
+    player1: int = player_mask(bitboard, 1)
+    player2: int = player_mask(bitboard, 2)
+    return [
+        1 if player1 >> i & 1 else 2 if player2 >> i & 1 else 0
+        for i in range(BOARD_SIZE)
+    ]
+
+
+def to_base3(bitboard: Bitboard) -> int:
+    return _BASE3_WEIGHTS[player_mask(bitboard, 1)] + 2 * _BASE3_WEIGHTS[player_mask(bitboard, 2)]
+
+
+def from_base3(code: int) -> Bitboard:
+    bitboard: Bitboard = 0
+    for cell_index in range(BOARD_SIZE):
+        code, value = divmod(code, 3)
+        if value:
+            bitboard = place(bitboard, cell_index, value)
+    return bitboard
+
+
+def as_bitboard(board: List[BoardCell] | Bitboard) -> Bitboard:
+    return board if isinstance(board, int) else to_bitboard(board)
+
+
+def player_mask(bitboard: Bitboard, player_id: PlayerIndex) -> int:
+    player1: int = bitboard & FULL_BOARD_MASK
+    player2: int = bitboard >> PLAYER_2_SHIFT
+    return player1 & ~player2 if player_id == 1 else player2 & ~player1
+
+
+def occupied_mask(bitboard: Bitboard) -> int:
+    return (bitboard | bitboard >> PLAYER_2_SHIFT) & FULL_BOARD_MASK
+
+
+def empty_mask(bitboard: Bitboard) -> int:
+    return ~occupied_mask(bitboard) & FULL_BOARD_MASK
+
+
+def is_cell_empty(bitboard: Bitboard, cell_index: CellIndex) -> bool:
+    return not occupied_mask(bitboard) >> cell_index & 1
+
+
+def place(bitboard: Bitboard, cell_index: CellIndex, player_id: PlayerIndex) -> Bitboard:
+    return bitboard | 1 << (cell_index if player_id == 1 else cell_index + PLAYER_2_SHIFT)
+
+
+def count_plies(bitboard: Bitboard) -> int:
+    return bin(occupied_mask(bitboard)).count('1')
+
+
+def is_full(bitboard: Bitboard) -> bool:
+    return occupied_mask(bitboard) == FULL_BOARD_MASK
+
+
+def winning_line_index(bitboard: Bitboard, cell_index: CellIndex, player_id: PlayerIndex) -> int | None:
+    mask: int = player_mask(bitboard, player_id)
+    for line_index in CELL_WINNING_LINES[cell_index]:
+        line_mask: int = WINNING_LINE_MASKS[line_index]
+        if mask & line_mask == line_mask:
+            return line_index
+    return None
+
+
+def has_winner(bitboard: Bitboard) -> bool:
+    player1: int = player_mask(bitboard, 1)
+    player2: int = player_mask(bitboard, 2)
+    return any(player1 & line_mask == line_mask or player2 & line_mask == line_mask for line_mask in WINNING_LINE_MASKS)
+
+
+def find_winning_cell(bitboard: Bitboard, player_id: PlayerIndex) -> CellIndex | None:
+    mask: int = player_mask(bitboard, player_id)
+    empty: int = empty_mask(bitboard)
+    for line_mask in WINNING_LINE_MASKS:
+        missing: int = line_mask & ~mask
+        if missing and missing & (missing - 1) == 0 and missing & empty:
+            return missing.bit_length() - 1
+    return None
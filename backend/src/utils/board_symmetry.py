@@ -0,0 +1,47 @@
+from typing import List, Tuple
+
+from src.constants.game import BOARD_SIZE, BOARD_SYMMETRIES, FULL_BOARD_MASK
+from src.models.games import CellIndex
+from src.utils.bitboard import Bitboard, PLAYER_2_SHIFT
+
+
+def _build_mask_table(symmetry: List[CellIndex]) -> List[int]:
+    table: List[int] = []
+    for mask in range(FULL_BOARD_MASK + 1):
+        transformed: int = 0
+        for cell_index in range(BOARD_SIZE):
+            if mask >> cell_index & 1:
+                transformed |= 1 << symmetry[cell_index]
+        table.append(transformed)
+    return table
+
+
+_MASK_TABLES: List[List[int]] = [_build_mask_table(symmetry) for symmetry in BOARD_SYMMETRIES]
+_INVERSE_SYMMETRIES: List[List[CellIndex]] = [
+    [symmetry.index(cell_index) for cell_index in range(BOARD_SIZE)]
+    for symmetry in BOARD_SYMMETRIES
+]
+
+
+def transform_bitboard(bitboard: Bitboard, transform: int) -> Bitboard:
+    table: List[int] = _MASK_TABLES[transform]
+    return table[bitboard & FULL_BOARD_MASK] | table[bitboard >> PLAYER_2_SHIFT] << PLAYER_2_SHIFT
+
+
+def canonicalize(bitboard: Bitboard) -> Tuple[Bitboard, int]:
+    """Return the smallest equivalent bitboard and the transform that produces it."""
+    canonical: Bitboard = bitboard
+    canonical_transform: int = 0
+    for transform in range(1, len(BOARD_SYMMETRIES)):
+        candidate: Bitboard = transform_bitboard(bitboard, transform)
+        if candidate < canonical:
+            canonical, canonical_transform = candidate, transform
+    return canonical, canonical_transform
+
+
+def to_canonical_cell(cell_index: CellIndex, transform: int) -> CellIndex:
+    return BOARD_SYMMETRIES[transform][cell_index]
+
+
+def from_canonical_cell(cell_index: CellIndex, transform: int) -> CellIndex:
+    return _INVERSE_SYMMETRIES[transform][cell_index]
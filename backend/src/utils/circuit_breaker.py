@@ -0,0 +1,136 @@
+from collections import deque
+from datetime import datetime, timezone
+from enum import Enum
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List
+
+from src.utils.logger import logger
+
+
+class CircuitState(str, Enum):
+    closed = 'closed'
+    open = 'open'
+    half_open = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker.
+    Opens once the failure rate over the last `window_size` calls reaches `failure_rate_threshold`
+    (calls slower than `slow_call_seconds` count as failures), rejects calls for `open_seconds`,
+    then lets `half_open_max_calls` probes through to decide whether to close again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 5,
+        window_size: int = 20,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        slow_call_seconds: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.name: str = name
+        self.failure_rate_threshold: float = failure_rate_threshold
+        self.minimum_calls: int = minimum_calls
+        self.open_seconds: float = open_seconds
+        self.half_open_max_calls: int = half_open_max_calls
+        self.slow_call_seconds: float | None = slow_call_seconds
+        self._clock: Callable[[], float] = clock
+
+        self.state: CircuitState = CircuitState.closed
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._opened_at: float = 0.0
+        self._probes_in_flight: int = 0
+        self.rejected_calls: int = 0
+        self.transitions: Deque[Dict[str, str]] = deque(maxlen=20)
+
+    def allow_request(self) -> bool:
+        if self.state == CircuitState.open:
+            if self._clock() - self._opened_at < self.open_seconds:
+                self.rejected_calls += 1
+                return False
+            self._transition(CircuitState.half_open, 'open period elapsed')
+
+        if self.state == CircuitState.half_open:
+            if self._probes_in_flight >= self.half_open_max_calls:
+                self.rejected_calls += 1
+                return False
+            self._probes_in_flight += 1
+
+        return True
+
+    def record_success(self, latency_seconds: float) -> None:
+        if self.slow_call_seconds is not None and latency_seconds > self.slow_call_seconds:
+            self._record(False, latency_seconds, f'slow call: {latency_seconds:.3f}s')
+        else:
+            self._record(True, latency_seconds, 'probe succeeded')
+
+    def record_failure(self, latency_seconds: float) -> None:
+        self._record(False, latency_seconds, 'call failed')
+
+    def _record(self, ok: bool, latency_seconds: float, reason: str) -> None:
+        self._latencies.append(latency_seconds)
+
+        if self.state == CircuitState.half_open:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if ok:
+                self._outcomes.clear()
+                self._transition(CircuitState.closed, reason)
+            else:
+                self._open(reason)
+            return
+
+        self._outcomes.append(ok)
+        if self.state == CircuitState.closed and len(self._outcomes) >= self.minimum_calls:
+            if self.failure_rate() >= self.failure_rate_threshold:
+                self._open(f'failure rate {self.failure_rate():.2f}')
+
+    def _open(self, reason: str) -> None:
+        self._opened_at = self._clock()
+        self._transition(CircuitState.open, reason)
+
+    def _transition(self, state: CircuitState, reason: str) -> None:
+        if state == self.state:
+            return
+
+        logger.warning(f'Circuit breaker {self.name}: {self.state.value} -> {state.value} ({reason})')
+        self.transitions.append({
+            'from': self.state.value,
+            'to': state.value,
+            'reason': reason,
+            'at': datetime.now(timezone.utc).isoformat(),
+        })
+        self.state = state
+        self._probes_in_flight = 0
+
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        if not self._latencies:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+        ordered: List[float] = sorted(self._latencies)
+        last: int = len(ordered) - 1
+        return {
+            'p50': ordered[round(last * 0.50)],
+            'p95': ordered[round(last * 0.95)],
+            'p99': ordered[round(last * 0.99)],
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'state': self.state.value,
+            'failure_rate': self.failure_rate(),
+            'window_calls': len(self._outcomes),
+            'rejected_calls': self.rejected_calls,
+            'latency_seconds': self.latency_percentiles(),
+            'transitions': list(self.transitions),
+        }
@@ -2,7 +2,15 @@ from typing import List
 import random
 from src.models.games import BoardCell, PlayerIndex, CellIndex
 
-from src.constants.game import WINNING_LINES
+from src.constants.game import WINNING_LINES, BOARD_SIZE
+from src.utils.bitboard import (
+    Bitboard,
+    as_bitboard,
+    empty_mask,
+    is_cell_empty,
+    is_full,
+    winning_line_index,
+)
 
 
 def ensure_valid_player_index(value: int) -> PlayerIndex:
@@ -18,7 +26,7 @@ def ensure_valid_cell_index(value: int) -> CellIndex:
 
 
 def validate_player_move(
-    board: List[BoardCell],
+    board: List[BoardCell] | Bitboard,
     current_turn: PlayerIndex,
     player_id: PlayerIndex,
     cell_index: CellIndex
@@ -26,7 +34,7 @@ def validate_player_move(
     if current_turn != player_id:
         return False
 
-    if board[cell_index] != 0:
+    if not is_cell_empty(as_bitboard(board), cell_index):
         return False
 
     return True
@@ -37,22 +45,27 @@ def get_next_turn(current_turn: PlayerIndex) -> PlayerIndex:
 
 
 def check_game_winner_triplet(
-    board: List[BoardCell],
+    board: List[BoardCell] | Bitboard,
     cell_index: CellIndex,
     player_id: PlayerIndex
 ) -> List[CellIndex] | None:
-    for line in WINNING_LINES:
-        if cell_index in line and all(board[i] == player_id for i in line):
-            return line
-    return None
+    line_index: int | None = winning_line_index(as_bitboard(board), cell_index, player_id)
+    return WINNING_LINES[line_index] if line_index is not None else None
 
 
-def is_board_full(board: List[BoardCell]) -> bool:
-    return all(cell != 0 for cell in board)
+def get_winning_line_index(winning_triplet: List[CellIndex] | None) -> int | None:
+    if not winning_triplet:
+        return None
+    return WINNING_LINES.index(sorted(winning_triplet))
 
 
-def get_random_empty_cell(board: List[BoardCell]) -> CellIndex:
-    empty_cells: List[CellIndex] = [i for i in range(len(board)) if board[i] == 0]
+def is_board_full(board: List[BoardCell] | Bitboard) -> bool:
+    return is_full(as_bitboard(board))
+
+
+def get_random_empty_cell(board: List[BoardCell] | Bitboard) -> CellIndex:
+    empty: int = empty_mask(as_bitboard(board))
+    empty_cells: List[CellIndex] = [i for i in range(BOARD_SIZE) if empty >> i & 1]
     if not empty_cells:
         raise ValueError('No empty cells available on the board')
     return random.choice(empty_cells)
@@ -0,0 +1,55 @@
+from typing import Any, Dict, List
+
+from src.constants.game import WINNING_LINES
+from src.models.games import BoardCell, CellIndex
+from src.utils.bitboard import from_base3, from_bitboard, to_base3, to_bitboard
+from src.utils.game import get_winning_line_index
+
+
+# Games are stored either with `board` / `winning_triplet` arrays or, in the compact format,
+# with `board_code` (the base-3 board) and `winning_line` (an index into WINNING_LINES).
+ARRAY_BOARD_FIELDS: List[str] = ['board', 'winning_triplet']
+COMPACT_BOARD_FIELDS: List[str] = ['board_code', 'winning_line']
+
+
+def to_board_code(board: List[BoardCell]) -> int:
+    return to_base3(to_bitboard(board))
+
+
+def from_board_code(board_code: int) -> List[BoardCell]:
+    return from_bitboard(from_base3(board_code))
+
+
+def encode_board_fields(
+    board: List[BoardCell],
+    winning_triplet: List[CellIndex] | None,
+    compact: bool
+) -> Dict[str, Any]:
+    if compact:
+        return {'board_code': to_board_code(board), 'winning_line': get_winning_line_index(winning_triplet)}
+    return {'board': board, 'winning_triplet': winning_triplet}
+
+
+def stale_board_fields(compact: bool) -> Dict[str, str]:
+    """$unset spec for the format that is not being written."""
+    return {field: '' for field in (ARRAY_BOARD_FIELDS if compact else COMPACT_BOARD_FIELDS)}
+
+
+def expand_board_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turns a compact stored game into the array shape the API exposes. Array-shaped input is returned as is."""
+    if 'board' in data or 'board_code' not in data:
+        return data
+    expanded: Dict[str, Any] = {k: v for k, v in data.items() if k not in COMPACT_BOARD_FIELDS}
+    winning_line: int | None = data.get('winning_line')
+    expanded['board'] = from_board_code(data['board_code'])
+    expanded['winning_triplet'] = WINNING_LINES[winning_line] if winning_line is not None else None
+    return expanded
+
+
+def compact_board_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turns an array-shaped stored game into the compact shape. Compact input is returned as is."""
+    if 'board_code' in data or 'board' not in data:
+        return data
+    compacted: Dict[str, Any] = {k: v for k, v in data.items() if k not in ARRAY_BOARD_FIELDS}
+    compacted.update(encode_board_fields(data['board'], data.get('winning_triplet'), compact=True))
+    return compacted
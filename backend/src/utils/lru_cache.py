@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Tuple, TypeVar
+import time
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """`ttl_seconds` is the default lifetime of an entry; None keeps entries until they are evicted."""
+        if max_size <= 0:
+            raise ValueError('Cache max size must be positive')
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError('Cache TTL must be positive')
+
+        self.max_size: int = max_size
+        self.ttl_seconds: float | None = ttl_seconds
+        self._clock: Callable[[], float] = clock
+        # Each value is stored with the clock time it expires at, or None if it never does
+        self._entries: OrderedDict[K, Tuple[V, float | None]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries and not self._is_expired(self._entries[key][1])
+
+    def _is_expired(self, expires_at: float | None) -> bool:
+        return expires_at is not None and self._clock() >= expires_at
+
+    def get(self, key: K) -> V | None:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        value, expires_at = self._entries[key]
+        if self._is_expired(expires_at):
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Stores `value`; `ttl_seconds` overrides the cache default for this entry."""
+        ttl: float | None = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (value, self._clock() + ttl if ttl is not None else None)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int | float | None]:
+        lookups: int = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
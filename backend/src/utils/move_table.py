@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import Callable
+import mmap
+import os
+
+from src.models.games import CellIndex, PlayerIndex
+from src.utils.bitboard import Bitboard, BASE3_STATES, PLAYER_2_SHIFT, from_base3, to_base3
+from src.utils.logger import logger
+
+
+# One byte per base-3 board index: the low nibble is the best move with player 1
+# to move and the high nibble the best move with player 2 to move.
+NO_MOVE: int = 0x0F
+
+_table: mmap.mmap | None = None
+
+
+def encode_move_table(best_move: Callable[[Bitboard, PlayerIndex], CellIndex | None]) -> bytes:
+    table: bytearray = bytearray(BASE3_STATES)
+    for code in range(BASE3_STATES):
+        bitboard: Bitboard = from_base3(code)
+        player1_move: CellIndex | None = best_move(bitboard, 1)
+        player2_move: CellIndex | None = best_move(bitboard, 2)
+        table[code] = (
+            (NO_MOVE if player1_move is None else player1_move)
+            | (NO_MOVE if player2_move is None else player2_move) << 4
+        )
+    return bytes(table)
+
+
+def decode_move(entry: int, player_id: PlayerIndex) -> CellIndex | None:
+    move: int = entry & NO_MOVE if player_id == 1 else entry >> 4
+    return None if move == NO_MOVE else move
+
+
+def write_move_table(path: str, table: bytes) -> None:
+    file_path: Path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path = file_path.with_suffix(file_path.suffix + '.tmp')
+    tmp_path.write_bytes(table)
+    tmp_path.replace(file_path)
+
+
+def load_move_table(path: str) -> bool:
+    global _table
+    file_path: Path = Path(path)
+    if not file_path.exists():
+        logger.warning(f'AI move table not found: path={path}')
+        return False
+
+    with open(file_path, 'rb') as f:
+        # Checked before mapping, since an empty file cannot be mapped at all
+        size: int = os.fstat(f.fileno()).st_size
+        if size != BASE3_STATES:
+            logger.error(f'AI move table has unexpected size: path={path}, size={size}')
+            return False
+        table: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if _table is not None:
+        _table.close()
+    _table = table
+    return True
+
+
+def unload_move_table() -> None:
+    global _table
+    if _table is not None:
+        _table.close()
+        _table = None
+
+
+def is_move_table_loaded() -> bool:
+    return _table is not None
+
+
+def lookup_move(bitboard: Bitboard, player_id: PlayerIndex) -> CellIndex | None:
+    if _table is None or bitboard & bitboard >> PLAYER_2_SHIFT:
+        return None
+    return decode_move(_table[to_base3(bitboard)], player_id)
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Tuple
+import base64
+import binascii
+import json
+
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+
+from src.exceptions import InvalidCursorError
+
+
+# Keyset position of the last item on a page: (timestamp, _id), both descending.
+Cursor = Tuple[datetime, PydanticObjectId]
+
+
+def encode_cursor(timestamp: datetime, item_id: PydanticObjectId) -> str:
+    payload: bytes = json.dumps([timestamp.isoformat(), str(item_id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        payload: bytes = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        timestamp_raw, item_id_raw = json.loads(payload)
+        return datetime.fromisoformat(timestamp_raw), PydanticObjectId(item_id_raw)
+    except (binascii.Error, ValueError, TypeError, InvalidId) as e:
+        raise InvalidCursorError(f'Invalid pagination cursor: {cursor}') from e
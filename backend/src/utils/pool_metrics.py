@@ -0,0 +1,115 @@
+from collections import deque
+from typing import Any, Deque, Dict, List
+import threading
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+)
+
+
+class PoolMetrics(ConnectionPoolListener):
+    """
+    Counts connection churn and how long operations wait to check a connection out of the pool.
+    PyMongo publishes these events from Motor's worker threads, hence the lock.
+    """
+
+    def __init__(self, sample_size: int = 1024) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        # Most recent checkout waits in seconds, for percentiles
+        self._waits: Deque[float] = deque(maxlen=sample_size)
+        self.created: int = 0
+        self.closed: int = 0
+        self.checked_out: int = 0
+        self.in_use: int = 0
+        self.checkout_failures: Dict[str, int] = {}
+        self.wait_total_seconds: float = 0.0
+        self.wait_max_seconds: float = 0.0
+        self.pool_clears: int = 0
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self.created += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self.closed += 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self.checked_out += 1
+            self.in_use += 1
+            self._record_wait(event.duration)
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self.checkout_failures[event.reason] = self.checkout_failures.get(event.reason, 0) + 1
+            self._record_wait(event.duration)
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        with self._lock:
+            self.pool_clears += 1
+
+    def _record_wait(self, duration: float | None) -> None:
+        if duration is None:
+            return
+        self._waits.append(duration)
+        self.wait_total_seconds += duration
+        self.wait_max_seconds = max(self.wait_max_seconds, duration)
+
+    # Events the metrics do not need
+    def pool_created(self, event: PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: PoolReadyEvent) -> None:
+        pass
+
+    def pool_closed(self, event: PoolClosedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_check_out_started(self, event: ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits: List[float] = sorted(self._waits)
+            attempts: int = self.checked_out + sum(self.checkout_failures.values())
+            return {
+                'connections_created': self.created,
+                'connections_closed': self.closed,
+                'connections_open': self.created - self.closed,
+                'connections_in_use': self.in_use,
+                'checkouts': self.checked_out,
+                'checkout_failures': dict(self.checkout_failures),
+                'pool_clears': self.pool_clears,
+                'checkout_wait_ms': {
+                    'mean': self.wait_total_seconds / attempts * 1000 if attempts else 0.0,
+                    'p50': _percentile(waits, 0.5) * 1000,
+                    'p95': _percentile(waits, 0.95) * 1000,
+                    'p99': _percentile(waits, 0.99) * 1000,
+                    'max': self.wait_max_seconds * 1000,
+                },
+            }
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
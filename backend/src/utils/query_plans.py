@@ -0,0 +1,33 @@
+from typing import Any, Dict, Iterator, List
+
+
+# Plan stages that mean a query is not served by an index.
+SLOW_PLAN_STAGES: Dict[str, str] = {
+    'COLLSCAN': 'collection scan',
+    'SORT': 'in-memory sort',
+}
+
+
+def iter_plan_stages(plan: Dict[str, Any]) -> Iterator[str]:
+    """Yields every stage name in a winning plan, covering classic, SBE and sharded explain output."""
+    if 'stage' in plan:
+        yield plan['stage']
+    if 'queryPlan' in plan:
+        yield from iter_plan_stages(plan['queryPlan'])
+    if 'winningPlan' in plan:
+        yield from iter_plan_stages(plan['winningPlan'])
+    if 'inputStage' in plan:
+        yield from iter_plan_stages(plan['inputStage'])
+    for child in plan.get('inputStages', []) + plan.get('shards', []):
+        yield from iter_plan_stages(child)
+
+
+def find_plan_problems(name: str, explain: Dict[str, Any], covered: bool = False) -> List[str]:
+    """Lists slow stages in the winning plan; with `covered`, fetching documents counts as one too."""
+    slow_stages: Dict[str, str] = {**SLOW_PLAN_STAGES, 'FETCH': 'document fetch'} if covered else SLOW_PLAN_STAGES
+    winning_plan: Dict[str, Any] = explain.get('queryPlanner', {}).get('winningPlan', {})
+    return [
+        f'{name}: {slow_stages[stage]} ({stage})'
+        for stage in iter_plan_stages(winning_plan)
+        if stage in slow_stages
+    ]
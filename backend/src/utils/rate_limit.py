@@ -1,34 +1,78 @@
-from collections import deque
-from time import monotonic
-from typing import Deque, Dict
+from math import ceil
+from typing import TYPE_CHECKING, Dict, List
 
 from fastapi import Request, HTTPException, status
 
-from src.constants.fastapi import RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS
+from src.config import RATE_LIMIT_BACKEND, RATE_LIMIT_SHARED_PATH, RATE_LIMIT_SHARED_SLOTS
+from src.constants.fastapi import (
+    AUTH_RATE_LIMIT_MAX_REQUESTS,
+    AUTH_RATE_LIMIT_WINDOW_SECONDS,
+    RATE_LIMIT_MAX_REQUESTS,
+    RATE_LIMIT_WINDOW_SECONDS,
+)
+from src.utils.sliding_window import SlidingWindowCounter
 from src.utils.logger import logger
 
+if TYPE_CHECKING:
+    from src.utils.shared_window import SharedWindowCounter, SharedWindowTable
 
 
-_requests_log: Dict[str, Deque[float]] = {}
+_shared_table: 'SharedWindowTable | None' = None
 
 
-async def rate_limiter(request: Request) -> None:
-  client_ip: str = request.client.host if request.client else 'unknown'
-  key: str = f'{client_ip}:{request.url.path}'
-  now: float = monotonic()
+def create_window_counter(
+    name: str,
+    max_requests: int,
+    window_seconds: float
+) -> 'SlidingWindowCounter | SharedWindowCounter':
+    """
+    Counter for the RATE_LIMIT_BACKEND: `memory` counts in this process only, `shared` counts in a
+    table every worker process on the host maps, so N workers still allow `max_requests` in total.
+    """
+    global _shared_table
+    if RATE_LIMIT_BACKEND == 'shared':
+        # Imported here because it needs fcntl, which only exists on POSIX systems
+        from src.utils.shared_window import SharedWindowCounter, SharedWindowTable
+        if _shared_table is None:
+            _shared_table = SharedWindowTable(RATE_LIMIT_SHARED_PATH, RATE_LIMIT_SHARED_SLOTS)
+        return SharedWindowCounter(_shared_table, name, max_requests, window_seconds)
+    if RATE_LIMIT_BACKEND != 'memory':
+        logger.warning(f'Unknown RATE_LIMIT_BACKEND configured: {RATE_LIMIT_BACKEND}, using memory')
+    return SlidingWindowCounter(max_requests, window_seconds)
 
-  bucket: Deque[float] = _requests_log.setdefault(key, deque())
 
-  while bucket and now - bucket[0] > RATE_LIMIT_WINDOW_SECONDS:
-    bucket.popleft()
+class RateLimiter:
+    """
+    FastAPI dependency allowing each client `max_requests` per path within any `window_seconds` span.
+    With `key_on_template`, requests are keyed on the route's path template instead, so
+    `/games/{game_id}` is one budget for all games and a client costs one counter per route.
+    """
 
-  if len(bucket) >= RATE_LIMIT_MAX_REQUESTS:
-    logger.warning(f'Rate limit exceeded: client_ip={client_ip}, path={request.url.path}, requests={len(bucket)}')
-    raise HTTPException(
-      status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-      detail='Too many requests, please slow down.'
-    )
+    def __init__(self, name: str, max_requests: int, window_seconds: float, key_on_template: bool = False) -> None:
+        self.name: str = name
+        self.key_on_template: bool = key_on_template
+        self.counter: 'SlidingWindowCounter | SharedWindowCounter' = create_window_counter(name, max_requests, window_seconds)
 
-  bucket.append(now)
+    async def __call__(self, request: Request) -> None:
+        client_ip: str = request.client.host if request.client else 'unknown'
+        route_path: str = request.url.path
+        if self.key_on_template:
+            route_path = getattr(request.scope.get('route'), 'path', route_path)
 
+        retry_after: float | None = self.counter.hit(f'{client_ip}:{route_path}')
+        if retry_after is not None:
+            logger.warning(f'Rate limit exceeded: limiter={self.name}, client_ip={client_ip}, path={route_path}')
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail='Too many requests, please slow down.',
+                headers={'Retry-After': str(max(1, ceil(retry_after)))}
+            )
 
+    def stats(self) -> Dict[str, int | float]:
+        return self.counter.stats()
+
+
+rate_limiter: RateLimiter = RateLimiter('default', RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS)
+# Stricter budget for the routes that run bcrypt
+auth_rate_limiter: RateLimiter = RateLimiter('auth', AUTH_RATE_LIMIT_MAX_REQUESTS, AUTH_RATE_LIMIT_WINDOW_SECONDS)
+rate_limiters: List[RateLimiter] = [rate_limiter, auth_rate_limiter]
@@ -0,0 +1,42 @@
+from typing import List
+
+from src.constants.game import MOVE_SNAPSHOT_INTERVAL
+from src.models.moves import MoveBase
+from src.utils.bitboard import Bitboard, from_base3, place
+
+
+def is_snapshot_ply(ply: int) -> bool:
+    return ply % MOVE_SNAPSHOT_INTERVAL == 0
+
+
+def replay_board(moves: List[MoveBase], up_to_ply: int | None = None) -> Bitboard:
+    """
+    Rebuilds the board after the last of `moves`. The moves must be consecutive plies that start
+    either at ply 1 or at a move carrying a snapshot and, if `up_to_ply` is given, end at it.
+    """
+    if not moves:
+        if up_to_ply:
+            raise ValueError(f'Move log is empty, expected moves up to ply {up_to_ply}')
+        return 0
+
+    first: MoveBase = moves[0]
+    if first.snapshot is not None:
+        board: Bitboard = from_base3(first.snapshot)
+        remaining: List[MoveBase] = moves[1:]
+        expected_ply: int = first.ply + 1
+    elif first.ply == 1:
+        board = 0
+        remaining = moves
+        expected_ply = 1
+    else:
+        raise ValueError(f'Move log has no snapshot or opening move before ply {first.ply}')
+
+    for move in remaining:
+        if move.ply != expected_ply:
+            raise ValueError(f'Move log has a gap: expected ply {expected_ply}, got {move.ply}')
+        board = place(board, move.cell, move.player)
+        expected_ply += 1
+
+    if up_to_ply is not None and moves[-1].ply != up_to_ply:
+        raise ValueError(f'Move log ends at ply {moves[-1].ply}, expected ply {up_to_ply}')
+    return board
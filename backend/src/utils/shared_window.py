@@ -0,0 +1,190 @@
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+
+from src.constants.fastapi import RATE_LIMIT_BUCKET_SLOTS
+from src.utils.sliding_window import sliding_window_retry_after
+
+
+# File layout: header (magic, slot count, slots per bucket), then fixed-size slots of (key hash,
+# window index, time the slot goes idle, previous window count, current window count).
+# A zero hash is an empty slot.
+_MAGIC: bytes = b'RLT1'
+_HEADER: struct.Struct = struct.Struct('<4sII')
+_SLOT: struct.Struct = struct.Struct('<QqdII')
+
+
+def layout_path(path: str, slots: int, bucket_slots: int) -> str:
+    """
+    File a table layout lives in. Processes configured with another layout, e.g. old and new
+    workers during a rolling restart, get their own file instead of resizing one that is mapped.
+    """
+    file_path: Path = Path(path)
+    return str(file_path.with_name(f'{file_path.stem}.{slots}x{bucket_slots}{file_path.suffix}'))
+
+
+def _key_hash(key: str) -> int:
+    # Stable across processes, unlike hash(), and never 0
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little') or 1
+
+
+class SharedWindowTable:
+    """
+    Fixed-size hash table of sliding-window counts in a memory-mapped file, shared by every process
+    that opens the same path. A key hashes to a bucket of `bucket_slots` slots, and an update holds an
+    fcntl record lock on that bucket's bytes only, so processes contend only on the same bucket.
+    Slots are never deleted: a slot idle for two of its windows is reused in place, and when a bucket
+    has none, the slot that went quiet first is evicted.
+    Record locks belong to the process, so one table must only be used from one thread.
+    """
+
+    def __init__(self, path: str, slots: int, bucket_slots: int = RATE_LIMIT_BUCKET_SLOTS) -> None:
+        """Maps the table for this layout next to `path`, see `layout_path`."""
+        if bucket_slots <= 0 or slots <= 0 or slots % bucket_slots:
+            raise ValueError('Rate limit table slots must be a positive multiple of the bucket size')
+
+        self.path: str = layout_path(path, slots, bucket_slots)
+        self.slots: int = slots
+        self.bucket_slots: int = bucket_slots
+        self._buckets: int = slots // bucket_slots
+        self._bucket_bytes: int = bucket_slots * _SLOT.size
+        self.evictions: int = 0
+
+        size: int = _HEADER.size + slots * _SLOT.size
+        header: bytes = _HEADER.pack(_MAGIC, slots, bucket_slots)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        # The header lock serializes processes that create the file at the same time
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER.size, 0)
+        try:
+            current_size: int = os.fstat(self._fd).st_size
+            if current_size == 0:
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, header, 0)
+            matches: bool = os.fstat(self._fd).st_size == size and os.pread(self._fd, _HEADER.size, 0) == header
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER.size, 0)
+        if not matches:
+            # Other processes may have the file mapped, so it is never resized in place
+            os.close(self._fd)
+            raise ValueError(f'Rate limit table file has another layout, remove it: path={self.path}, size={current_size}')
+        self._map: mmap.mmap = mmap.mmap(self._fd, size)
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    def _claim_slot(
+        self,
+        bucket_offset: int,
+        key_hash: int,
+        window: int,
+        now: float
+    ) -> Tuple[int, int, int]:
+        """Returns the key's slot offset with its (previous, current) counts rolled forward to `window`."""
+        free_offset: int | None = None
+        stalest_offset: int = bucket_offset
+        stalest_idle_at: float = float('inf')
+        for offset in range(bucket_offset, bucket_offset + self._bucket_bytes, _SLOT.size):
+            slot_hash, slot_window, idle_at, previous, current = _SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash:
+                if slot_window == window:
+                    return offset, previous, current
+                return offset, current if slot_window == window - 1 else 0, 0
+            if free_offset is None and (slot_hash == 0 or idle_at <= now):
+                free_offset = offset
+            elif idle_at < stalest_idle_at:
+                stalest_offset, stalest_idle_at = offset, idle_at
+
+        if free_offset is None:
+            self.evictions += 1
+            free_offset = stalest_offset
+        return free_offset, 0, 0
+
+    def hit(self, key: str, max_requests: int, window_seconds: float, now: float) -> float | None:
+        """Counts a request for `key` if it is within the limit and returns None, else the seconds to wait."""
+        key_hash: int = _key_hash(key)
+        bucket_offset: int = _HEADER.size + key_hash % self._buckets * self._bucket_bytes
+        window: int = int(now // window_seconds)
+
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self._bucket_bytes, bucket_offset)
+        try:
+            offset, previous, current = self._claim_slot(bucket_offset, key_hash, window, now)
+            retry_after: float | None = sliding_window_retry_after(
+                previous,
+                current,
+                now - window * window_seconds,
+                max_requests,
+                window_seconds,
+            )
+            if retry_after is None:
+                current += 1
+            _SLOT.pack_into(self._map, offset, key_hash, window, (window + 2) * window_seconds, previous, current)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self._bucket_bytes, bucket_offset)
+        return retry_after
+
+    def stats(self, now: float) -> Dict[str, int]:
+        """Slot usage read without locks, so it may be off by a few concurrent updates."""
+        active: int = sum(
+            1 for slot_hash, _, idle_at, _, _ in _SLOT.iter_unpack(self._map[_HEADER.size:])
+            if slot_hash and idle_at > now
+        )
+        return {'slots': self.slots, 'active_slots': active, 'evictions': self.evictions}
+
+
+class SharedWindowCounter:
+    """
+    Sliding-window counter for one rate limiter whose counts live in a SharedWindowTable, so all
+    worker processes on the host enforce one limit between them. Uses wall-clock time, which every
+    process, and the table file across restarts, agree on.
+    """
+
+    def __init__(
+        self,
+        table: SharedWindowTable,
+        namespace: str,
+        max_requests: int,
+        window_seconds: float,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        if max_requests <= 0:
+            raise ValueError('Rate limit max requests must be positive')
+        if window_seconds <= 0:
+            raise ValueError('Rate limit window must be positive')
+
+        self.table: SharedWindowTable = table
+        self.namespace: str = namespace
+        self.max_requests: int = max_requests
+        self.window_seconds: float = window_seconds
+        self._clock: Callable[[], float] = clock
+        # Decisions made by this process only
+        self.allowed: int = 0
+        self.rejected: int = 0
+
+    def hit(self, key: str) -> float | None:
+        retry_after: float | None = self.table.hit(
+            f'{self.namespace}:{key}',
+            self.max_requests,
+            self.window_seconds,
+            self._clock(),
+        )
+        if retry_after is None:
+            self.allowed += 1
+        else:
+            self.rejected += 1
+        return retry_after
+
+    def stats(self) -> Dict[str, int | float]:
+        return {
+            'max_requests': self.max_requests,
+            'window_seconds': self.window_seconds,
+            'allowed': self.allowed,
+            'rejected': self.rejected,
+            **{f'table_{name}': value for name, value in self.table.stats(self._clock()).items()},
+        }
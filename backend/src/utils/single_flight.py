@@ -0,0 +1,55 @@
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+import asyncio
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class _Call(Generic[V]):
+    def __init__(self, task: asyncio.Task[V]) -> None:
+        self.task: asyncio.Task[V] = task
+        self.waiters: int = 0
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Collapses concurrent calls with the same key into one in-flight computation.
+    The shared computation is cancelled only when every caller waiting on it is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[K, _Call[V]] = {}
+        self.calls: int = 0
+        self.deduplicated: int = 0
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        self.calls += 1
+        call: _Call[V] | None = self._in_flight.get(key)
+
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._in_flight[key] = call
+            call.task.add_done_callback(lambda _, c=call: self._forget(key, c))
+        else:
+            self.deduplicated += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: K, call: _Call[V]) -> None:
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'calls': self.calls,
+            'deduplicated': self.deduplicated,
+            'in_flight': len(self._in_flight),
+        }
@@ -0,0 +1,92 @@
+from time import monotonic
+from typing import Callable, Dict
+
+
+def sliding_window_retry_after(
+    previous: int,
+    current: int,
+    elapsed: float,
+    max_requests: int,
+    window_seconds: float
+) -> float | None:
+    """
+    Seconds until the sliding-window estimate `previous * (1 - elapsed / window) + current` drops
+    below `max_requests`, or None if it already is.
+    """
+    weight: float = 1 - elapsed / window_seconds
+    if previous * weight + current < max_requests:
+        return None
+    if current < max_requests:
+        # The previous window's share decays linearly until the estimate fits again
+        return window_seconds * (weight - (max_requests - current) / previous)
+    # Wait for this window to become the previous one, then for its share to decay enough
+    return window_seconds * (weight + 1 - max_requests / current)
+
+
+class SlidingWindowCounter:
+    """
+    Counts requests per key in fixed windows and estimates the count over the sliding window ending
+    now from the current and previous window counts, so each key costs one dict entry per window.
+    Counts are kept in one dict per window: when a window ends, the dict two windows old is dropped
+    whole, which sweeps every key idle since then without scanning for it.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        clock: Callable[[], float] = monotonic
+    ) -> None:
+        if max_requests <= 0:
+            raise ValueError('Rate limit max requests must be positive')
+        if window_seconds <= 0:
+            raise ValueError('Rate limit window must be positive')
+
+        self.max_requests: int = max_requests
+        self.window_seconds: float = window_seconds
+        self._clock: Callable[[], float] = clock
+        self._window: int = int(clock() // window_seconds)
+        self._current: Dict[str, int] = {}
+        self._previous: Dict[str, int] = {}
+        self.allowed: int = 0
+        self.rejected: int = 0
+
+    def _advance(self, window: int) -> None:
+        if window == self._window:
+            return
+
+        self._previous = self._current if window == self._window + 1 else {}
+        self._current = {}
+        self._window = window
+
+    def hit(self, key: str) -> float | None:
+        """Counts a request for `key` if it is within the limit and returns None, else the seconds to wait."""
+        now: float = self._clock()
+        self._advance(int(now // self.window_seconds))
+
+        current: int = self._current.get(key, 0)
+        retry_after: float | None = sliding_window_retry_after(
+            self._previous.get(key, 0),
+            current,
+            now - self._window * self.window_seconds,
+            self.max_requests,
+            self.window_seconds,
+        )
+        if retry_after is not None:
+            self.rejected += 1
+            return retry_after
+
+        self._current[key] = current + 1
+        self.allowed += 1
+        return None
+
+    def stats(self) -> Dict[str, int | float]:
+        self._advance(int(self._clock() // self.window_seconds))
+        return {
+            'max_requests': self.max_requests,
+            'window_seconds': self.window_seconds,
+            'current_window_keys': len(self._current),
+            'previous_window_keys': len(self._previous),
+            'allowed': self.allowed,
+            'rejected': self.rejected,
+        }
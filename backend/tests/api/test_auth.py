@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from typing import Dict, List, Type
+from beanie import PydanticObjectId
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Response
+from src.api.auth import router
+from src.dal.users import UsersDAL
+from src.dependencies import get_users_dal
+from src.models.users import UserDocument
+from src.security.auth import create_access_token, create_refresh_token, get_current_user
+from src.utils.lru_cache import LRUCache
+
+
+USER_ID: str = str(PydanticObjectId())
+
+
+class FakeUserModel:
+    users: Dict[str, UserDocument] = {}
+    lookups: List[str] = []
+
+    @classmethod
+    async def get(cls, user_id: str) -> UserDocument | None:
+        cls.lookups.append(user_id)
+        # Yields like a database read, so concurrent requests interleave here
+        await asyncio.sleep(0)
+        return cls.users.get(user_id)
+
+
+@pytest.fixture
+def user() -> UserDocument:
+    now: datetime = datetime.now(timezone.utc)
+    return UserDocument.model_construct(
+        id=PydanticObjectId(USER_ID),
+        email='user@example.com',
+        password='hash',
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def user_model(user: UserDocument) -> Type[FakeUserModel]:
+    FakeUserModel.users = {USER_ID: user}
+    FakeUserModel.lookups = []
+    return FakeUserModel
+
+
+@pytest.fixture
+def app(user: UserDocument, user_model: Type[FakeUserModel]) -> FastAPI:
+    users_cache: LRUCache[str, UserDocument] = LRUCache(10, ttl_seconds=60)
+    app: FastAPI = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_users_dal] = lambda: UsersDAL(user_model, users_cache)
+    app.dependency_overrides[get_current_user] = lambda: user
+    return app
+
+
+@pytest.fixture
+def client(app: FastAPI) -> TestClient:
+    return TestClient(app)
+
+
+class TestRefresh:
+    def test_rotates_refresh_token(self, client: TestClient, user_model: Type[FakeUserModel]) -> None:
+        refresh_token: str = create_refresh_token(USER_ID)
+
+        response: Response = client.post('/auth/refresh', json={'refreshToken': refresh_token})
+        assert response.status_code == status.HTTP_200_OK
+        rotated_token: str = response.json()['refreshToken']
+        assert rotated_token != refresh_token
+
+        assert client.post('/auth/refresh', json={'refreshToken': refresh_token}).status_code == status.HTTP_401_UNAUTHORIZED
+        assert client.post('/auth/refresh', json={'refreshToken': rotated_token}).status_code == status.HTTP_200_OK
+        assert user_model.lookups == [USER_ID]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_use_the_token_once(self, app: FastAPI) -> None:
+        refresh_token: str = create_refresh_token(USER_ID)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+            responses: List[Response] = await asyncio.gather(*[
+                client.post('/auth/refresh', json={'refreshToken': refresh_token}) for _ in range(2)
+            ])
+
+        assert sorted(response.status_code for response in responses) == [status.HTTP_200_OK, status.HTTP_401_UNAUTHORIZED]
+
+    def test_sad_unknown_user(self, client: TestClient) -> None:
+        response: Response = client.post('/auth/refresh', json={'refreshToken': create_refresh_token(str(PydanticObjectId()))})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_sad_access_token(self, client: TestClient) -> None:
+        response: Response = client.post('/auth/refresh', json={'refreshToken': create_access_token(USER_ID)})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestLogout:
+    def test_revokes_refresh_token(self, client: TestClient) -> None:
+        refresh_token: str = create_refresh_token(USER_ID)
+
+        response: Response = client.post(
+            '/auth/logout',
+            json={'refreshToken': refresh_token},
+            headers={'Authorization': f'Bearer {create_access_token(USER_ID)}'},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert client.post('/auth/refresh', json={'refreshToken': refresh_token}).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_keeps_other_users_refresh_token(self, client: TestClient, user: UserDocument, user_model: Type[FakeUserModel]) -> None:
+        other_id: str = str(PydanticObjectId())
+        user_model.users[other_id] = user
+        other_token: str = create_refresh_token(other_id)
+
+        client.post(
+            '/auth/logout',
+            json={'refreshToken': other_token},
+            headers={'Authorization': f'Bearer {create_access_token(USER_ID)}'},
+        )
+
+        assert client.post('/auth/refresh', json={'refreshToken': other_token}).status_code == status.HTTP_200_OK
@@ -1,9 +1,18 @@
 import pytest
 import tempfile
 import os
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
 from unittest.mock import Mock, patch
 
+from beanie import PydanticObjectId
+
+from src.models.games import GameDocument, PlayerIndex
+from src.models.matchups import MatchMode, MatchupDocument
+from src.models.moves import MoveCreate
+from src.services.game import GameService
+
 
 @pytest.fixture
 def temp_dir():
@@ -47,3 +56,173 @@ def sample_board_winner_diagonal():
     """Board with diagonal win for player 1."""
     return [1, 2, 0, 2, 1, 0, 0, 0, 1]
 
+
+class FakeClock:
+    """Settable stand-in for time.monotonic / time.time."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeGamesDAL:
+    """In-memory GamesDAL with the same conditional apply_move: it fails if the stored board changed."""
+
+    def __init__(self) -> None:
+        self.games: Dict[str, GameDocument] = {}
+        self.last_game: GameDocument | None = None
+        self.last_game_lookups: List[PydanticObjectId] = []
+        self.reads: int = 0
+        self.writes: int = 0
+
+    def add(self, game: GameDocument) -> GameDocument:
+        self.games[str(game.id)] = game
+        return game
+
+    async def get_game_by_id(self, game_id: str) -> GameDocument | None:
+        self.reads += 1
+        return self.games.get(str(game_id))
+
+    async def get_last_game_for_matchup(self, matchup_id: PydanticObjectId) -> GameDocument | None:
+        self.last_game_lookups.append(matchup_id)
+        return self.last_game
+
+    async def apply_move(self, game: GameDocument, **fields: Any) -> GameDocument | None:
+        stored: GameDocument = self.games[str(game.id)]
+        if stored.board != game.board:
+            return None
+        self.writes += 1
+        self.games[str(game.id)] = stored.model_copy(update=fields)
+        return self.games[str(game.id)]
+
+
+class FakeMovesDAL:
+    def __init__(self) -> None:
+        self.moves: List[MoveCreate] = []
+
+    async def append_move(self, move: MoveCreate) -> None:
+        self.moves.append(move)
+
+    async def append_moves(self, moves: List[MoveCreate]) -> None:
+        self.moves.extend(moves)
+
+    async def list_moves_since_snapshot(self, game_id: PydanticObjectId, up_to_ply: int) -> List[MoveCreate]:
+        moves: List[MoveCreate] = sorted(
+            (move for move in self.moves if move.game_id == game_id and move.ply <= up_to_ply),
+            key=lambda move: move.ply,
+        )
+        snapshots: List[int] = [index for index, move in enumerate(moves) if move.snapshot is not None]
+        return moves[snapshots[-1]:] if snapshots else moves
+
+
+class FakeMatchupsDAL:
+    """In-memory MatchupsDAL; joins active games from the games DAL it is given."""
+
+    def __init__(self, games_dal: FakeGamesDAL) -> None:
+        self.games_dal: FakeGamesDAL = games_dal
+        self.matchups: Dict[str, MatchupDocument] = {}
+        self.scored: List[PlayerIndex] = []
+        self.reads: int = 0
+
+    def add(self, matchup: MatchupDocument) -> MatchupDocument:
+        self.matchups[str(matchup.id)] = matchup
+        return matchup
+
+    async def get_matchup_by_id(self, matchup_id: str) -> MatchupDocument | None:
+        self.reads += 1
+        return self.matchups.get(str(matchup_id))
+
+    async def get_matchup_with_active_game(
+        self,
+        matchup_id: PydanticObjectId
+    ) -> Tuple[MatchupDocument | None, GameDocument | None]:
+        matchup: MatchupDocument | None = self.matchups.get(str(matchup_id))
+        if matchup is None or matchup.active_game_id is None:
+            return matchup, None
+        return matchup, self.games_dal.games.get(str(matchup.active_game_id))
+
+    async def increase_player_score_by_one(self, matchup_id: PydanticObjectId, player_id: PlayerIndex) -> None:
+        self.scored.append(player_id)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def make_game() -> Callable[..., GameDocument]:
+    """Builds an unsaved game: an empty board with player 1 to move, unless overridden."""
+    def factory(**fields: Any) -> GameDocument:
+        now: datetime = datetime.now(timezone.utc)
+        # model_construct skips Document.__init__, which needs an initialized Beanie collection
+        return GameDocument.model_construct(**{
+            'id': PydanticObjectId(),
+            'matchup_id': PydanticObjectId(),
+            'board': [0] * 9,
+            'current_turn': 1,
+            'is_finished': False,
+            'winner': None,
+            'winning_triplet': None,
+            'created_at': now,
+            'updated_at': now,
+            **fields,
+        })
+    return factory
+
+
+@pytest.fixture
+def make_matchup() -> Callable[..., MatchupDocument]:
+    """Builds an unsaved friend matchup with no active game, unless overridden."""
+    def factory(**fields: Any) -> MatchupDocument:
+        now: datetime = datetime.now(timezone.utc)
+        return MatchupDocument.model_construct(**{
+            'id': PydanticObjectId(),
+            'user_id': PydanticObjectId(),
+            'player1_name': 'a',
+            'player1_score': 0,
+            'player2_name': 'b',
+            'player2_score': 0,
+            'mode': MatchMode.friend,
+            'ai_engine': None,
+            'active_game_id': None,
+            'created_at': now,
+            'updated_at': now,
+            **fields,
+        })
+    return factory
+
+
+@pytest.fixture
+def games_dal() -> FakeGamesDAL:
+    return FakeGamesDAL()
+
+
+@pytest.fixture
+def moves_dal() -> FakeMovesDAL:
+    return FakeMovesDAL()
+
+
+@pytest.fixture
+def matchups_dal(games_dal: FakeGamesDAL) -> FakeMatchupsDAL:
+    return FakeMatchupsDAL(games_dal)
+
+
+@pytest.fixture
+def make_game_service(
+    matchups_dal: FakeMatchupsDAL,
+    games_dal: FakeGamesDAL,
+    moves_dal: FakeMovesDAL
+) -> Callable[..., GameService]:
+    """Builds a GameService over the fake DALs; keyword arguments override its dependencies."""
+    def factory(**dependencies: Any) -> GameService:
+        return GameService(**{
+            'matchups_dal': matchups_dal,
+            'games_dal': games_dal,
+            'ai_service': None,
+            'moves_dal': moves_dal,
+            **dependencies,
+        })
+    return factory
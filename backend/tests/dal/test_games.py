@@ -0,0 +1,107 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Type
+from beanie import PydanticObjectId
+from src.dal.games import GamesCache, GamesDAL
+from src.models.games import GameDocument
+
+
+class FakeGame:
+    games: Dict[str, 'FakeGame'] = {}
+    lookups: List[str] = []
+    queries: int = 0
+    # Only used to build query expressions, which the fake ignores
+    matchup_id: PydanticObjectId | None = None
+
+    def __init__(self, **fields: Any) -> None:
+        self.id: PydanticObjectId | None = None
+        self.__dict__.update(fields)
+
+    async def insert(self) -> None:
+        self.id = PydanticObjectId()
+        FakeGame.games[str(self.id)] = self
+
+    @classmethod
+    async def get(cls, game_id: str) -> 'FakeGame | None':
+        cls.lookups.append(str(game_id))
+        return cls.games.get(str(game_id))
+
+    @classmethod
+    def find(cls, *_: Any) -> 'FakeLastGameQuery':
+        return FakeLastGameQuery()
+
+
+class FakeLastGameQuery:
+    """Newest game of all, as the fakes only ever hold one matchup's games."""
+
+    def sort(self, *_: Any) -> 'FakeLastGameQuery':
+        return self
+
+    def limit(self, _: int) -> 'FakeLastGameQuery':
+        return self
+
+    async def first_or_none(self) -> FakeGame | None:
+        FakeGame.queries += 1
+        return max(FakeGame.games.values(), key=lambda game: game.created_at, default=None)
+
+
+@pytest.fixture
+def game_model() -> Type[FakeGame]:
+    FakeGame.games = {}
+    FakeGame.lookups = []
+    FakeGame.queries = 0
+    return FakeGame
+
+
+@pytest.fixture
+def games_dal(game_model: Type[FakeGame]) -> GamesDAL:
+    return GamesDAL(game_model, compact_board=False, cache=GamesCache())
+
+
+async def _add_game(matchup_id: PydanticObjectId, is_finished: bool, age_seconds: float = 0.0) -> FakeGame:
+    created_at: datetime = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    game: FakeGame = FakeGame(matchup_id=matchup_id, is_finished=is_finished, created_at=created_at)
+    await game.insert()
+    return game
+
+
+class TestGamesDALCache:
+    @pytest.mark.asyncio
+    async def test_finished_games_are_cached(self, games_dal: GamesDAL, game_model: Type[FakeGame]) -> None:
+        game: FakeGame = await _add_game(PydanticObjectId(), is_finished=True)
+
+        first: GameDocument | None = await games_dal.get_game_by_id(str(game.id))
+        second: GameDocument | None = await games_dal.get_game_by_id(str(game.id))
+
+        assert first is second is game
+        assert game_model.lookups == [str(game.id)]
+
+    @pytest.mark.asyncio
+    async def test_unfinished_games_are_not_cached(self, games_dal: GamesDAL, game_model: Type[FakeGame]) -> None:
+        game: FakeGame = await _add_game(PydanticObjectId(), is_finished=False)
+
+        await games_dal.get_game_by_id(str(game.id))
+        await games_dal.get_game_by_id(str(game.id))
+
+        assert game_model.lookups == [str(game.id), str(game.id)]
+        assert len(games_dal.cache.finished_games) == 0
+
+    @pytest.mark.asyncio
+    async def test_last_game_pointer_skips_the_query(self, games_dal: GamesDAL, game_model: Type[FakeGame]) -> None:
+        matchup_id: PydanticObjectId = PydanticObjectId()
+        game: FakeGame = await _add_game(matchup_id, is_finished=False)
+
+        assert await games_dal.get_last_game_for_matchup(matchup_id) is game
+        assert await games_dal.get_last_game_for_matchup(matchup_id) is game
+        assert game_model.queries == 1
+
+    @pytest.mark.asyncio
+    async def test_create_game_invalidates_last_game(self, games_dal: GamesDAL, game_model: Type[FakeGame]) -> None:
+        matchup_id: PydanticObjectId = PydanticObjectId()
+        await _add_game(matchup_id, is_finished=True, age_seconds=60.0)
+        await games_dal.get_last_game_for_matchup(matchup_id)
+
+        new_game: GameDocument = await games_dal.create_game(matchup_id, 2)
+
+        assert await games_dal.get_last_game_for_matchup(matchup_id) is new_game
+        assert game_model.queries == 2
@@ -0,0 +1,86 @@
+import pytest
+from datetime import datetime
+from typing import Dict, List, Type
+from src.dal.users import UsersDAL
+from src.models.users import UserDocument
+from src.utils.lru_cache import LRUCache
+
+
+class FakeUser:
+    def __init__(self, user_id: str) -> None:
+        self.id: str = user_id
+        self.email: str = 'user@example.com'
+        self.updated_at: datetime | None = None
+        self.saves: int = 0
+
+    async def save(self) -> None:
+        self.saves += 1
+
+
+class FakeUserModel:
+    users: Dict[str, FakeUser] = {}
+    lookups: List[str] = []
+
+    @classmethod
+    async def get(cls, user_id: str) -> FakeUser | None:
+        cls.lookups.append(user_id)
+        return cls.users.get(user_id)
+
+
+@pytest.fixture
+def user_model() -> Type[FakeUserModel]:
+    FakeUserModel.users = {'u1': FakeUser('u1')}
+    FakeUserModel.lookups = []
+    return FakeUserModel
+
+
+class TestUsersDALCache:
+    @pytest.mark.asyncio
+    async def test_resolved_users_are_cached(self, user_model: Type[FakeUserModel]) -> None:
+        users_dal: UsersDAL = UsersDAL(user_model, LRUCache(10, ttl_seconds=60))
+
+        first: UserDocument | None = await users_dal.get_user_by_id('u1')
+        second: UserDocument | None = await users_dal.get_user_by_id('u1')
+
+        assert first is second
+        assert user_model.lookups == ['u1']
+
+    @pytest.mark.asyncio
+    async def test_missing_users_are_not_cached(self, user_model: Type[FakeUserModel]) -> None:
+        users_dal: UsersDAL = UsersDAL(user_model, LRUCache(10, ttl_seconds=60))
+
+        assert await users_dal.get_user_by_id('missing') is None
+        assert await users_dal.get_user_by_id('missing') is None
+        assert user_model.lookups == ['missing', 'missing']
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates(self, user_model: Type[FakeUserModel]) -> None:
+        users_dal: UsersDAL = UsersDAL(user_model, LRUCache(10, ttl_seconds=60))
+        user: UserDocument | None = await users_dal.get_user_by_id('u1')
+
+        await users_dal.update_user(user, {'email': 'new@example.com'})
+        await users_dal.get_user_by_id('u1')
+
+        assert user.saves == 1
+        assert user_model.lookups == ['u1', 'u1']
+
+    @pytest.mark.asyncio
+    async def test_touch_invalidates(self, user_model: Type[FakeUserModel]) -> None:
+        users_dal: UsersDAL = UsersDAL(user_model, LRUCache(10, ttl_seconds=60))
+        user: UserDocument | None = await users_dal.get_user_by_id('u1')
+
+        await users_dal.touch_user(user)
+        await users_dal.get_user_by_id('u1')
+
+        assert user.updated_at is not None
+        assert user.saves == 1
+        assert user_model.lookups == ['u1', 'u1']
+
+    @pytest.mark.asyncio
+    async def test_no_cache(self, user_model: Type[FakeUserModel]) -> None:
+        users_dal: UsersDAL = UsersDAL(user_model)
+
+        await users_dal.get_user_by_id('u1')
+        await users_dal.get_user_by_id('u1')
+
+        assert user_model.lookups == ['u1', 'u1']
@@ -4,7 +4,15 @@ from typing import Dict
 from unittest.mock import Mock, patch, AsyncMock
 from jose import jwt
 from fastapi import HTTPException, status
-from src.security.auth import create_access_token, get_current_user
+from beanie import PydanticObjectId
+from src.security.auth import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    get_current_user,
+    get_current_user_id,
+    revoke_token,
+)
 from src.config import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_EXPIRES_MINUTES
 from src.models.users import UserDocument
 
@@ -84,3 +92,58 @@ class TestGetCurrentUser:
                 with pytest.raises(HTTPException) as exc_info:
                     await get_current_user(token)
                 assert exc_info.value.status_code == expected_status_code
+
+
+class TestGetCurrentUserId:
+    @pytest.mark.asyncio
+    async def test_get_current_user_id(self) -> None:
+        with patch('src.security.auth.UsersDAL') as mock_dal_class:
+            result: PydanticObjectId = await get_current_user_id(create_access_token('507f1f77bcf86cd799439011'))
+            assert result == PydanticObjectId('507f1f77bcf86cd799439011')
+            mock_dal_class.assert_not_called()
+
+    @pytest.mark.parametrize('subject', [
+        None,
+        'not_an_object_id',
+        '',
+    ], ids=['invalid_token', 'non_object_id_subject', 'empty_subject'])
+    @pytest.mark.asyncio
+    async def test_sad_get_current_user_id(self, subject: str | None) -> None:
+        # Built here rather than at collection, so the tokens use the secret the test run configures
+        token: str = 'invalid_token_string' if subject is None else create_access_token(subject)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_id(token)
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestTokenTypesAndRevocation:
+    def test_refresh_token_claims(self) -> None:
+        payload: Dict[str, str | int] = jwt.decode(create_refresh_token('user123'), JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        assert payload['sub'] == 'user123'
+        assert payload['type'] == 'refresh'
+        assert len(payload['jti']) == 32
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_is_not_an_access_token(self) -> None:
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_id(create_refresh_token('507f1f77bcf86cd799439011'))
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+        with pytest.raises(HTTPException):
+            decode_token(create_access_token('507f1f77bcf86cd799439011'), 'refresh')
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_is_rejected(self) -> None:
+        token: str = create_access_token('507f1f77bcf86cd799439011')
+        other_token: str = create_access_token('507f1f77bcf86cd799439011')
+        revoke_token(decode_token(token))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_id(token)
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert await get_current_user_id(other_token) == PydanticObjectId('507f1f77bcf86cd799439011')
+
+    def test_untyped_legacy_token_is_an_access_token(self) -> None:
+        expire: datetime = datetime.now(timezone.utc) + timedelta(minutes=5)
+        token: str = jwt.encode({'sub': 'user123', 'exp': expire}, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+        assert decode_token(token)['sub'] == 'user123'
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import pytest
+from typing import List
+import uuid
+from pathlib import Path
+from src.security.denylist import TokenDenylist, saved_paths, worker_path
+from tests.conftest import FakeClock
+
+
+@pytest.fixture
+def clock(clock: FakeClock) -> FakeClock:
+    clock.now = 1000.0
+    return clock
+
+
+def _jti() -> str:
+    return uuid.uuid4().hex
+
+
+class TestTokenDenylist:
+    def test_revoke(self, clock: FakeClock) -> None:
+        denylist: TokenDenylist = TokenDenylist(60, clock)
+        jti: str = _jti()
+        denylist.revoke(jti, 1500)
+
+        assert denylist.is_revoked(jti, 1500)
+        assert not denylist.is_revoked(_jti(), 1500)
+        assert len(denylist) == 1
+
+    def test_claim(self, clock: FakeClock) -> None:
+        denylist: TokenDenylist = TokenDenylist(60, clock)
+        jti: str = _jti()
+
+        assert denylist.claim(jti, 1500)
+        assert not denylist.claim(jti, 1500)
+        assert denylist.is_revoked(jti, 1500)
+
+    def test_drops_whole_buckets_once_expired(self, clock: FakeClock) -> None:
+        denylist: TokenDenylist = TokenDenylist(60, clock)
+        for expires_at in [1210, 1230, 1290]:
+            denylist.revoke(_jti(), expires_at)
+
+        clock.now = 1259
+        assert denylist.stats() == {'revoked': 3, 'buckets': 2, 'bucket_seconds': 60}
+        clock.now = 1260
+        assert denylist.stats() == {'revoked': 1, 'buckets': 1, 'bucket_seconds': 60}
+
+    def test_expired_tokens_are_not_stored(self, clock: FakeClock) -> None:
+        denylist: TokenDenylist = TokenDenylist(60, clock)
+        denylist.revoke(_jti(), 999)
+
+        assert len(denylist) == 0
+        assert not denylist.dirty
+
+    def test_round_trip(self, clock: FakeClock) -> None:
+        denylist: TokenDenylist = TokenDenylist(30, clock)
+        jtis: List[str] = [_jti() for _ in range(5)]
+        for index, jti in enumerate(jtis):
+            denylist.revoke(jti, 1100 + index * 40)
+
+        data: bytes = denylist.dumps()
+        assert len(data) == 8 + 5 * (12 + 16)
+
+        clock.now = 1150
+        restored: TokenDenylist = TokenDenylist.loads(data, clock)
+        assert restored.bucket_seconds == 30
+        assert [restored.is_revoked(jti, 1100 + index * 40) for index, jti in enumerate(jtis)] == [False, True, True, True, True]
+
+    @pytest.mark.parametrize('data, message', [
+        (b'NOPE\x3c\x00\x00\x00', 'Not a token denylist file'),
+        (b'TDL1\x3c\x00\x00\x00' + b'\x00' * 8 + b'\x02\x00\x00\x00' + b'\x00' * 16, 'Truncated token denylist file'),
+    ], ids=['bad_magic', 'truncated'])
+    def test_sad_loads(self, data: bytes, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            TokenDenylist.loads(data)
+
+    def test_save_and_load(self, clock: FakeClock, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'denylist.bin')
+        denylist: TokenDenylist = TokenDenylist(60, clock)
+        jti: str = _jti()
+        denylist.revoke(jti, 2000)
+        denylist.save(path)
+
+        assert not denylist.dirty
+        assert TokenDenylist.load(path, clock).is_revoked(jti, 2000)
+
+    def test_load_missing_or_corrupt(self, tmp_path: Path) -> None:
+        corrupt_path: Path = tmp_path / 'corrupt.bin'
+        corrupt_path.write_bytes(b'garbage')
+
+        assert len(TokenDenylist.load(str(tmp_path / 'missing.bin'))) == 0
+        assert len(TokenDenylist.load(str(corrupt_path))) == 0
+
+
+class TestTokenDenylistWorkers:
+    def test_save_writes_own_worker_file(self, clock: FakeClock, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'denylist.bin')
+        denylist: TokenDenylist = TokenDenylist(60, clock)
+        denylist.revoke(_jti(), 2000)
+        denylist.save(path)
+
+        assert saved_paths(path) == [tmp_path / f'denylist.{os.getpid()}.bin']
+
+    def test_load_merges_every_worker(self, clock: FakeClock, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'denylist.bin')
+        jtis: List[str] = [_jti() for _ in range(3)]
+        for pid, jti in zip([101, 102], jtis):
+            denylist: TokenDenylist = TokenDenylist(60, clock)
+            denylist.revoke(jti, 2000)
+            Path(worker_path(path, pid)).write_bytes(denylist.dumps())
+        legacy: TokenDenylist = TokenDenylist(60, clock)
+        legacy.revoke(jtis[2], 2000)
+        Path(path).write_bytes(legacy.dumps())
+
+        loaded: TokenDenylist = TokenDenylist.load(path, clock)
+
+        assert all(loaded.is_revoked(jti, 2000) for jti in jtis)
+        assert not loaded.dirty
+
+    def test_load_deletes_files_past_max_age(self, clock: FakeClock, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'denylist.bin')
+        old_path: Path = Path(worker_path(path, 101))
+        old_path.write_bytes(TokenDenylist(60, clock).dumps())
+        os.utime(old_path, (0, 0))
+
+        TokenDenylist.load(path, clock, max_age_seconds=100)
+
+        assert not old_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_persistence_saves_and_merges_peers(self, clock: FakeClock, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'denylist.bin')
+        denylist: TokenDenylist = TokenDenylist.load(path, clock)
+        own_jti: str = _jti()
+        denylist.revoke(own_jti, 2000)
+        peer: TokenDenylist = TokenDenylist(60, clock)
+        peer_jti: str = _jti()
+        peer.revoke(peer_jti, 2000)
+        Path(worker_path(path, 101)).write_bytes(peer.dumps())
+
+        task: asyncio.Task[None] = asyncio.create_task(denylist.run_persistence(path, 0.01))
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        assert denylist.is_revoked(peer_jti, 2000)
+        assert TokenDenylist.loads(Path(worker_path(path)).read_bytes(), clock).is_revoked(own_jti, 2000)
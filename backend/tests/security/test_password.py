@@ -1,5 +1,8 @@
+import asyncio
 import pytest
-from src.security.password import hash_password, verify_password
+from typing import List
+from src.exceptions import PasswordHasherOverloadedError
+from src.security.password import PasswordHasher, hash_password, verify_password
 
 
 class TestHashPassword:
@@ -41,3 +44,38 @@ class TestVerifyPassword:
             hashed: str = hash_password(password)
             result: bool = verify_password(verify_password_input, hashed)
         assert result == expected_result
+
+
+class TestPasswordHasher:
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self) -> None:
+        hasher: PasswordHasher = PasswordHasher(max_workers=1, max_pending=2)
+        hashed: str = await hasher.hash('test_password_123')
+
+        assert await hasher.verify('test_password_123', hashed)
+        assert not await hasher.verify('wrong_password', hashed)
+        assert not await hasher.verify('test_password_123', 'not_a_valid_bcrypt_hash')
+        assert hasher.stats()['completed'] == 4
+        assert hasher.stats()['queued'] == 0
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self) -> None:
+        hasher: PasswordHasher = PasswordHasher(max_workers=1, max_pending=2)
+        results: List[str | BaseException] = await asyncio.gather(
+            *(hasher.hash('test_password_123') for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert sum(isinstance(result, PasswordHasherOverloadedError) for result in results) == 1
+        assert hasher.stats()['peak_pending'] == 2
+        assert hasher.stats()['rejected'] == 1
+        hasher.shutdown()
+
+    @pytest.mark.parametrize('max_workers, max_pending', [
+        (0, 4),
+        (2, 1),
+    ], ids=['no_workers', 'pending_below_workers'])
+    def test_sad_limits(self, max_workers: int, max_pending: int) -> None:
+        with pytest.raises(ValueError, match='Password hasher needs at least one worker'):
+            PasswordHasher(max_workers, max_pending)
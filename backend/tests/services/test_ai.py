@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from google.genai.errors import APIError
+from src.exceptions import AIServiceError
+from src.services.ai import AIService
+from src.constants.ai import AI_RULES_PROMPT
+
+
+def _api_error(code: int) -> APIError:
+    return APIError(code, {'error': {'code': code, 'message': 'error', 'status': 'ERROR'}})
+
+
+class FakeModels:
+    def __init__(self, responses: List[str | Exception]) -> None:
+        self.responses: List[str | Exception] = responses
+        self.calls: List[Dict[str, Any]] = []
+
+    async def generate_content(self, *, model: str, contents: str, config: Any) -> SimpleNamespace:
+        self.calls.append({'contents': contents, 'config': config})
+        response: str | Exception = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return SimpleNamespace(text=response)
+
+
+class FakeClient:
+    def __init__(self, responses: List[str | Exception]) -> None:
+        self.aio: SimpleNamespace = SimpleNamespace(models=FakeModels(responses))
+
+
+def _service(client: FakeClient) -> AIService:
+    service: AIService = AIService()
+    service.client = client
+    service._initialized = True
+    return service
+
+
+class TestAIServiceRequest:
+    @pytest.mark.asyncio
+    async def test_rules_sent_as_system_instruction(self) -> None:
+        client: FakeClient = FakeClient(['4'])
+        service: AIService = _service(client)
+
+        assert await service.get_next_move([0] * 9, 1, 2) == 4
+
+        call: Dict[str, Any] = client.aio.models.calls[0]
+        assert call['config'].system_instruction == AI_RULES_PROMPT
+        assert call['contents'] == 'Board: [0, 0, 0, 0, 0, 0, 0, 0, 0]\nYou are player 1. Opponent: 2. It is your turn.'
+
+    @pytest.mark.asyncio
+    async def test_sad_api_error(self) -> None:
+        service: AIService = _service(FakeClient([_api_error(503)]))
+
+        with pytest.raises(AIServiceError):
+            await service.get_next_move([0] * 9, 1, 2)
+
+
+class TestAIServiceSingleFlight:
+    @pytest.mark.asyncio
+    async def test_symmetric_concurrent_requests_share_one_call(self) -> None:
+        client: FakeClient = FakeClient(['8'])
+        service: AIService = _service(client)
+
+        results = await asyncio.gather(
+            service.get_next_move([1, 0, 0, 0, 0, 0, 0, 0, 0], 2, 1),
+            service.get_next_move([0, 0, 1, 0, 0, 0, 0, 0, 0], 2, 1),
+        )
+
+        assert results == [8, 6]
+        assert len(client.aio.models.calls) == 1
+        assert service.single_flight_stats()['deduplicated'] == 1
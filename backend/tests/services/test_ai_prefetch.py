@@ -0,0 +1,59 @@
+import asyncio
+import pytest
+from src.services.ai_prefetch import AIMovePrefetcher
+
+
+async def _move(value: int | None, delay: float = 0.0) -> int | None:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail() -> int | None:
+    raise RuntimeError('boom')
+
+
+class TestAIMovePrefetcher:
+    @pytest.mark.asyncio
+    async def test_collect_prefetched_move(self) -> None:
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+        prefetcher.schedule('game', 0b1, 2, lambda: _move(4))
+
+        assert await prefetcher.collect('game', 0b1, 2) == 4
+        assert prefetcher.stats()['hits'] == 1
+        assert prefetcher.stats()['pending'] == 0
+
+    @pytest.mark.asyncio
+    async def test_collect_waits_for_running_computation(self) -> None:
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+        prefetcher.schedule('game', 0b1, 2, lambda: _move(4, delay=0.01))
+
+        assert await prefetcher.collect('game', 0b1, 2) == 4
+
+    @pytest.mark.parametrize('board, ai_player_id', [
+        (0b11, 2),
+        (0b1, 1),
+    ], ids=['different_board', 'different_player'])
+    @pytest.mark.asyncio
+    async def test_stale_prefetch_is_discarded(self, board: int, ai_player_id: int) -> None:
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+        prefetcher.schedule('game', 0b1, 2, lambda: _move(4, delay=1.0))
+
+        assert await prefetcher.collect('game', board, ai_player_id) is None
+        assert prefetcher.stats()['discarded'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_computation_is_a_miss(self) -> None:
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+        prefetcher.schedule('game', 0b1, 2, _fail)
+
+        assert await prefetcher.collect('game', 0b1, 2) is None
+        assert prefetcher.stats()['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_pending(self) -> None:
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher(max_pending=2)
+        for game_id in ('a', 'b', 'c'):
+            prefetcher.schedule(game_id, 0, 1, lambda: _move(4, delay=1.0))
+
+        assert prefetcher.stats()['pending'] == 2
+        assert await prefetcher.collect('a', 0, 1) is None
@@ -0,0 +1,219 @@
+import asyncio
+import time
+import pytest
+from typing import Callable, List
+from beanie import PydanticObjectId
+from src.exceptions import AIServiceError, InvalidMatchupError, MatchupNotFoundError
+from src.models.games import BoardCell, CellIndex, GameDocument, PlayerIndex
+from src.models.matchups import AIEngine, MatchMode, MatchupDocument
+from src.models.moves import GameReplay
+from src.models.responses import UpdateResponse
+from src.services.ai_prefetch import AIMovePrefetcher
+from src.services.game import GameService
+from tests.conftest import FakeGamesDAL, FakeMatchupsDAL, FakeMovesDAL
+
+
+class TestGetMatchupActiveGame:
+    @pytest.mark.asyncio
+    async def test_joined_game_needs_no_games_query(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument],
+        make_matchup: Callable[..., MatchupDocument]
+    ) -> None:
+        game: GameDocument = games_dal.add(make_game())
+        matchup: MatchupDocument = matchups_dal.add(make_matchup(active_game_id=game.id))
+
+        response: UpdateResponse = await make_game_service().get_matchup_active_game(matchup.id)
+
+        assert response.matchup is matchup
+        assert response.game is game
+        assert games_dal.last_game_lookups == []
+
+    @pytest.mark.asyncio
+    async def test_falls_back_before_backfill(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument],
+        make_matchup: Callable[..., MatchupDocument]
+    ) -> None:
+        games_dal.last_game = make_game()
+        matchup: MatchupDocument = matchups_dal.add(make_matchup())
+
+        response: UpdateResponse = await make_game_service().get_matchup_active_game(matchup.id)
+
+        assert response.game is games_dal.last_game
+        assert games_dal.last_game_lookups == [matchup.id]
+
+    @pytest.mark.asyncio
+    async def test_sad_missing_matchup(self, make_game_service: Callable[..., GameService]) -> None:
+        with pytest.raises(MatchupNotFoundError):
+            await make_game_service().get_matchup_active_game(PydanticObjectId())
+
+
+class TestCreateNewMatchup:
+    @pytest.mark.parametrize('starting_player, ai_engine, message', [
+        (1, 'gpt', 'Unknown AI engine'),
+        (3, None, 'Player index'),
+    ], ids=['unknown_engine', 'invalid_starting_player'])
+    @pytest.mark.asyncio
+    async def test_sad_create_new_matchup(
+        self,
+        make_game_service: Callable[..., GameService],
+        matchups_dal: FakeMatchupsDAL,
+        starting_player: int,
+        ai_engine: str | None,
+        message: str
+    ) -> None:
+        with pytest.raises(InvalidMatchupError, match=message):
+            await make_game_service().create_new_matchup(PydanticObjectId(), 'a', 'b', 'ai', starting_player, ai_engine)
+
+        assert matchups_dal.matchups == {}
+
+
+class TestReplayGame:
+    @pytest.mark.asyncio
+    async def test_replays_logged_moves(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+        service: GameService = make_game_service()
+        for player_id, cell_index in [(1, 4), (2, 0), (1, 8), (2, 2)]:
+            await service.apply_move(game_id, player_id, cell_index)
+
+        replay: GameReplay = await service.replay_game(game_id, 3)
+
+        assert replay.board == [2, 0, 0, 0, 1, 0, 0, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_sad_log_missing_last_move(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        moves_dal: FakeMovesDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+        service: GameService = make_game_service()
+        for player_id, cell_index in [(1, 4), (2, 0)]:
+            await service.apply_move(game_id, player_id, cell_index)
+        # A failed append, which log_move only logs
+        moves_dal.moves.pop()
+
+        with pytest.raises(ValueError, match='ends at ply 1'):
+            await service.replay_game(game_id)
+
+
+class TestPlayerMove:
+    @pytest.mark.asyncio
+    async def test_ai_matchup_prefetches_reply(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument],
+        make_matchup: Callable[..., MatchupDocument]
+    ) -> None:
+        matchup: MatchupDocument = matchups_dal.add(make_matchup(mode=MatchMode.ai, ai_engine=AIEngine.solver))
+        game_id: str = str(games_dal.add(make_game(matchup_id=matchup.id)).id)
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+        service: GameService = make_game_service(ai_prefetcher=prefetcher)
+
+        await service.player_move(game_id, 1, 4)
+        response: UpdateResponse = await service.ai_move(game_id, 2)
+
+        assert prefetcher.stats()['hits'] == 1
+        assert response.game.board.count(2) == 1
+
+    @pytest.mark.asyncio
+    async def test_friend_matchup_does_not_prefetch(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument],
+        make_matchup: Callable[..., MatchupDocument]
+    ) -> None:
+        matchup: MatchupDocument = matchups_dal.add(make_matchup())
+        game_id: str = str(games_dal.add(make_game(matchup_id=matchup.id)).id)
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+
+        await make_game_service(ai_prefetcher=prefetcher).player_move(game_id, 1, 4)
+
+        assert prefetcher.stats()['scheduled'] == 0
+
+    @pytest.mark.parametrize('mode, marks', [
+        (MatchMode.ai, 2),
+        (MatchMode.friend, 1),
+    ], ids=['ai_replies', 'friend_does_not_reply'])
+    @pytest.mark.asyncio
+    async def test_with_ai_reply(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument],
+        make_matchup: Callable[..., MatchupDocument],
+        mode: MatchMode,
+        marks: int
+    ) -> None:
+        matchup: MatchupDocument = matchups_dal.add(make_matchup(mode=mode, ai_engine=AIEngine.solver))
+        game_id: str = str(games_dal.add(make_game(matchup_id=matchup.id)).id)
+        prefetcher: AIMovePrefetcher = AIMovePrefetcher()
+
+        response: UpdateResponse = await make_game_service(ai_prefetcher=prefetcher).player_move(game_id, 1, 4, with_ai_reply=True)
+
+        assert sum(1 for cell in response.game.board if cell) == marks
+        assert prefetcher.stats()['scheduled'] == 0
+
+
+class FakeAIService:
+    """Answers cell 8 after `delay` seconds, or raises instead when `error` is set."""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None) -> None:
+        self.delay: float = delay
+        self.error: Exception | None = error
+
+    async def get_next_move(self, board: List[BoardCell], ai_player_id: PlayerIndex, opponent_player_id: PlayerIndex) -> CellIndex:
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return 8
+
+
+class TestGetRemoteAIMove:
+    # Player 2 wins at 5, which the remote fake never answers
+    BOARD: List[BoardCell] = [1, 1, 0, 2, 2, 0, 0, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_remote_move_within_budget(self, make_game_service: Callable[..., GameService]) -> None:
+        service: GameService = make_game_service(ai_service=FakeAIService())
+
+        assert await service.get_remote_ai_move(self.BOARD, 2, 1) == 8
+
+    @pytest.mark.parametrize('ai_service', [
+        FakeAIService(delay=10.0),
+        FakeAIService(error=AIServiceError('quota exceeded')),
+    ], ids=['slow', 'failing'])
+    @pytest.mark.asyncio
+    async def test_falls_back_to_solver_within_budget(
+        self,
+        make_game_service: Callable[..., GameService],
+        monkeypatch: pytest.MonkeyPatch,
+        ai_service: FakeAIService
+    ) -> None:
+        monkeypatch.setattr('src.services.game.AI_MOVE_BUDGET_SECONDS', 0.05)
+        service: GameService = make_game_service(ai_service=ai_service)
+
+        started_at: float = time.monotonic()
+        move: CellIndex = await service.get_remote_ai_move(self.BOARD, 2, 1)
+
+        assert move == 5
+        assert time.monotonic() - started_at < 1.0
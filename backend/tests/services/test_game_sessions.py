@@ -0,0 +1,218 @@
+import pytest
+from typing import Any, Callable, List, Tuple
+from beanie import PydanticObjectId
+from src.exceptions import GameNotFoundError, MoveConflictError
+from src.models.games import GameDocument, PlayerIndex
+from src.models.responses import UpdateResponse
+from src.services.game import GameService
+from src.services.game_sessions import GameSessionRegistry
+from tests.conftest import FakeGamesDAL, FakeMatchupsDAL, FakeMovesDAL
+
+
+WINNING_MOVES: List[Tuple[int, int]] = [(1, 0), (2, 3), (1, 1), (2, 4), (1, 2)]
+
+
+class FlakyGamesDAL(FakeGamesDAL):
+    """Fails the first write that finishes a game, as a transient database error would."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures: int = 1
+
+    async def apply_move(self, game: GameDocument, **fields: Any) -> GameDocument | None:
+        if fields.get('is_finished') and self.failures:
+            self.failures -= 1
+            raise ConnectionError('transient')
+        return await super().apply_move(game, **fields)
+
+
+class FlakyMatchupsDAL(FakeMatchupsDAL):
+    def __init__(self, games_dal: FakeGamesDAL) -> None:
+        super().__init__(games_dal)
+        self.failures: int = 1
+
+    async def increase_player_score_by_one(self, matchup_id: PydanticObjectId, player_id: PlayerIndex) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('transient')
+        await super().increase_player_score_by_one(matchup_id, player_id)
+
+
+@pytest.fixture
+def registry(games_dal: FakeGamesDAL, moves_dal: FakeMovesDAL, matchups_dal: FakeMatchupsDAL) -> GameSessionRegistry:
+    return GameSessionRegistry(games_dal, moves_dal, matchups_dal)
+
+
+@pytest.fixture
+def service(make_game_service: Callable[..., GameService], registry: GameSessionRegistry) -> GameService:
+    return make_game_service(game_sessions=registry)
+
+
+class TestGameSessionRegistry:
+    @pytest.mark.asyncio
+    async def test_moves_stay_in_memory_until_flush(
+        self,
+        service: GameService,
+        registry: GameSessionRegistry,
+        games_dal: FakeGamesDAL,
+        moves_dal: FakeMovesDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+
+        await service.apply_move(game_id, 1, 0)
+        response: UpdateResponse = await service.apply_move(game_id, 2, 4)
+
+        assert response.game.board == [1, 0, 0, 0, 2, 0, 0, 0, 0]
+        assert games_dal.reads == 1
+        assert games_dal.writes == 0
+        assert games_dal.games[game_id].board == [0] * 9
+        assert registry.peek(game_id).board == response.game.board
+
+        await registry.sweep()
+
+        assert games_dal.writes == 1
+        assert games_dal.games[game_id].board == response.game.board
+        assert [move.ply for move in moves_dal.moves] == [1, 2]
+        assert registry.peek(game_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_finishing_move_flushes_and_closes(
+        self,
+        service: GameService,
+        registry: GameSessionRegistry,
+        games_dal: FakeGamesDAL,
+        moves_dal: FakeMovesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+
+        for player_id, cell_index in WINNING_MOVES:
+            response: UpdateResponse = await service.apply_move(game_id, player_id, cell_index)
+
+        assert response.game.is_finished
+        assert games_dal.writes == 1
+        assert games_dal.games[game_id].winning_triplet == [0, 1, 2]
+        assert len(moves_dal.moves) == 5
+        assert matchups_dal.scored == [1]
+
+        await registry.sweep()
+        assert registry.peek(game_id) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_finishing_flush_still_scores(
+        self,
+        make_game_service: Callable[..., GameService],
+        moves_dal: FakeMovesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        games_dal: FlakyGamesDAL = FlakyGamesDAL()
+        game_id: str = str(games_dal.add(make_game()).id)
+        registry: GameSessionRegistry = GameSessionRegistry(games_dal, moves_dal, matchups_dal)
+        service: GameService = make_game_service(games_dal=games_dal, game_sessions=registry)
+
+        for player_id, cell_index in WINNING_MOVES[:-1]:
+            await service.apply_move(game_id, player_id, cell_index)
+        with pytest.raises(ConnectionError):
+            await service.apply_move(game_id, *WINNING_MOVES[-1])
+        assert matchups_dal.scored == []
+
+        await registry.sweep()
+
+        assert games_dal.games[game_id].winner == 1
+        assert matchups_dal.scored == [1]
+        assert registry.peek(game_id) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_score_is_retried(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        moves_dal: FakeMovesDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+        matchups_dal: FlakyMatchupsDAL = FlakyMatchupsDAL(games_dal)
+        registry: GameSessionRegistry = GameSessionRegistry(games_dal, moves_dal, matchups_dal)
+        service: GameService = make_game_service(matchups_dal=matchups_dal, game_sessions=registry)
+
+        for player_id, cell_index in WINNING_MOVES[:-1]:
+            await service.apply_move(game_id, player_id, cell_index)
+        with pytest.raises(ConnectionError):
+            await service.apply_move(game_id, *WINNING_MOVES[-1])
+        assert games_dal.games[game_id].is_finished
+
+        await registry.sweep()
+
+        assert games_dal.writes == 1
+        assert matchups_dal.scored == [1]
+        assert registry.peek(game_id) is None
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_are_evicted(
+        self,
+        make_game_service: Callable[..., GameService],
+        games_dal: FakeGamesDAL,
+        moves_dal: FakeMovesDAL,
+        matchups_dal: FakeMatchupsDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+        registry: GameSessionRegistry = GameSessionRegistry(games_dal, moves_dal, matchups_dal, idle_seconds=0)
+        service: GameService = make_game_service(game_sessions=registry)
+
+        await service.apply_move(game_id, 1, 0)
+        await registry.sweep()
+
+        assert registry.peek(game_id) is None
+        assert games_dal.games[game_id].board[0] == 1
+        assert registry.stats()['evictions'] == 1
+
+    @pytest.mark.asyncio
+    async def test_conflict_drops_session(
+        self,
+        service: GameService,
+        registry: GameSessionRegistry,
+        games_dal: FakeGamesDAL,
+        moves_dal: FakeMovesDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_id: str = str(games_dal.add(make_game()).id)
+
+        await service.apply_move(game_id, 1, 0)
+        games_dal.games[game_id] = games_dal.games[game_id].model_copy(update={'board': [0, 0, 0, 0, 1, 0, 0, 0, 0]})
+
+        with pytest.raises(MoveConflictError):
+            await registry.flush_game(game_id)
+
+        assert registry.peek(game_id) is None
+        assert moves_dal.moves == []
+        assert registry.stats()['conflicts'] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_everything(
+        self,
+        service: GameService,
+        registry: GameSessionRegistry,
+        games_dal: FakeGamesDAL,
+        make_game: Callable[..., GameDocument]
+    ) -> None:
+        game_ids: List[str] = [str(games_dal.add(make_game()).id) for _ in range(2)]
+
+        for game_id in game_ids:
+            await service.apply_move(game_id, 1, 8)
+        await registry.close()
+
+        assert games_dal.writes == 2
+        assert registry.stats()['active'] == 0
+        assert all(games_dal.games[game_id].board[8] == 1 for game_id in game_ids)
+
+    @pytest.mark.asyncio
+    async def test_missing_game_is_not_cached(self, registry: GameSessionRegistry) -> None:
+        with pytest.raises(GameNotFoundError):
+            async with registry.session(str(PydanticObjectId())):
+                pass
+
+        assert registry.stats()['active'] == 0
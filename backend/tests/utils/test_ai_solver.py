@@ -0,0 +1,70 @@
+import pytest
+from typing import List
+from src.utils.ai_solver import get_perfect_move, solve_all_positions
+from src.utils.game import check_game_winner_triplet, is_board_full
+from src.exceptions import InvalidMoveError
+from src.models.games import BoardCell, PlayerIndex
+
+
+def _solver_loses(board: List[BoardCell], to_move: PlayerIndex, ai_player_id: PlayerIndex) -> bool:
+    opponent_player_id: PlayerIndex = 2 if ai_player_id == 1 else 1
+    if to_move == ai_player_id:
+        moves: List[int] = [get_perfect_move(board, ai_player_id, opponent_player_id)]
+    else:
+        moves = [i for i in range(9) if board[i] == 0]
+
+    for move in moves:
+        next_board: List[BoardCell] = board.copy()
+        next_board[move] = to_move
+        if check_game_winner_triplet(next_board, move, to_move):
+            if to_move == opponent_player_id:
+                return True
+            continue
+        if is_board_full(next_board):
+            continue
+        if _solver_loses(next_board, opponent_player_id if to_move == ai_player_id else ai_player_id, ai_player_id):
+            return True
+    return False
+
+
+class TestSolveAllPositions:
+    def test_solve_all_positions(self) -> None:
+        assert solve_all_positions() > 5000
+
+
+class TestGetPerfectMove:
+    @pytest.mark.parametrize('board, ai_player_id, opponent_player_id, expected_move', [
+        ([1, 1, 0, 2, 2, 0, 0, 0, 0], 1, 2, 2),
+        ([2, 2, 0, 0, 0, 0, 1, 0, 0], 1, 2, 2),
+        ([1, 1, 0, 0, 0, 0, 0, 2, 0], 2, 1, 2),
+        ([0] * 9, 1, 2, 4),
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 2, 1, 4),
+    ], ids=['win_over_block', 'block', 'block_player_2', 'empty_board_center', 'corner_opening_reply'])
+    def test_happy_get_perfect_move(
+        self,
+        board: List[BoardCell],
+        ai_player_id: PlayerIndex,
+        opponent_player_id: PlayerIndex,
+        expected_move: int
+    ) -> None:
+        result: int = get_perfect_move(board, ai_player_id, opponent_player_id)
+        assert result == expected_move
+        assert board[result] == 0
+
+    def test_sets_up_fork_instead_of_greedy_move(self) -> None:
+        board: List[BoardCell] = [2, 0, 0, 0, 1, 0, 0, 0, 2]
+        result: int = get_perfect_move(board, 1, 2)
+        assert result in (1, 3, 5, 7)
+
+    @pytest.mark.parametrize('ai_player_id, starting_player', [
+        (1, 1),
+        (1, 2),
+        (2, 1),
+        (2, 2),
+    ], ids=['ai_1_starts', 'ai_1_second', 'ai_2_second', 'ai_2_starts'])
+    def test_never_loses(self, ai_player_id: PlayerIndex, starting_player: PlayerIndex) -> None:
+        assert not _solver_loses([0] * 9, starting_player, ai_player_id)
+
+    def test_sad_get_perfect_move_full_board(self) -> None:
+        with pytest.raises(InvalidMoveError, match='No empty cells available for perfect move'):
+            get_perfect_move([1, 2, 1, 2, 1, 2, 2, 1, 2], 1, 2)
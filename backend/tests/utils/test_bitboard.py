@@ -0,0 +1,105 @@
+import pytest
+from typing import List
+from src.utils.bitboard import (
+    Bitboard,
+    to_bitboard,
+    from_bitboard,
+    player_mask,
+    occupied_mask,
+    is_cell_empty,
+    place,
+    is_full,
+    count_plies,
+    winning_line_index,
+    find_winning_cell,
+    to_base3,
+    from_base3,
+)
+from src.models.games import BoardCell, CellIndex, PlayerIndex
+
+
+class TestBitboardConversion:
+    @pytest.mark.parametrize('board, expected_result', [
+        ([0] * 9, 0),
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 0b1),
+        ([2, 0, 0, 0, 0, 0, 0, 0, 0], 0b1 << 9),
+        ([1, 0, 2, 0, 1, 0, 0, 0, 2], 0b10001 | (0b100000100 << 9)),
+    ], ids=['empty', 'player_1', 'player_2', 'partial'])
+    def test_to_bitboard(self, board: List[BoardCell], expected_result: Bitboard) -> None:
+        assert to_bitboard(board) == expected_result
+
+    @pytest.mark.parametrize('board', [
+        [0] * 9,
+        [1, 0, 2, 0, 1, 0, 0, 0, 2],
+        [1, 2, 1, 2, 1, 2, 2, 1, 2],
+    ], ids=['empty', 'partial', 'full'])
+    def test_round_trip(self, board: List[BoardCell]) -> None:
+        assert from_bitboard(to_bitboard(board)) == board
+
+    def test_unknown_values_are_occupied_but_unowned(self) -> None:
+        bitboard: Bitboard = to_bitboard([6, 0, 0, 0, 0, 0, 0, 0, 0])
+        assert not is_cell_empty(bitboard, 0)
+        assert player_mask(bitboard, 1) == 0
+        assert player_mask(bitboard, 2) == 0
+
+
+class TestBitboardOperations:
+    def test_place(self) -> None:
+        bitboard: Bitboard = place(place(0, 4, 1), 0, 2)
+        assert from_bitboard(bitboard) == [2, 0, 0, 0, 1, 0, 0, 0, 0]
+        assert occupied_mask(bitboard) == 0b10001
+
+    @pytest.mark.parametrize('board, expected_result', [
+        ([0] * 9, False),
+        ([1, 2, 1, 2, 1, 2, 2, 1, 0], False),
+        ([1, 2, 1, 2, 1, 2, 2, 1, 2], True),
+    ], ids=['empty', 'almost_full', 'full'])
+    def test_is_full(self, board: List[BoardCell], expected_result: bool) -> None:
+        assert is_full(to_bitboard(board)) == expected_result
+
+    @pytest.mark.parametrize('board, expected_result', [
+        ([0] * 9, 0),
+        ([1, 0, 2, 0, 1, 0, 0, 0, 0], 3),
+        ([1, 2, 1, 2, 1, 2, 2, 1, 2], 9),
+    ], ids=['empty', 'partial', 'full'])
+    def test_count_plies(self, board: List[BoardCell], expected_result: int) -> None:
+        assert count_plies(to_bitboard(board)) == expected_result
+
+    @pytest.mark.parametrize('board, cell_index, player_id, expected_result', [
+        ([1, 1, 1, 2, 0, 2, 0, 0, 0], 1, 1, 0),
+        ([0, 0, 1, 0, 1, 0, 1, 0, 0], 4, 1, 7),
+        ([2, 1, 0, 2, 1, 0, 2, 0, 0], 6, 2, 3),
+        ([1, 1, 1, 2, 0, 2, 0, 0, 0], 3, 1, None),
+    ], ids=['top_row', 'anti_diagonal', 'left_column', 'cell_not_in_line'])
+    def test_winning_line_index(self, board: List[BoardCell], cell_index: CellIndex, player_id: PlayerIndex, expected_result: int | None) -> None:
+        assert winning_line_index(to_bitboard(board), cell_index, player_id) == expected_result
+
+    @pytest.mark.parametrize('board, player_id, expected_result', [
+        ([1, 1, 0, 2, 0, 2, 0, 0, 0], 1, 2),
+        ([1, 1, 0, 2, 0, 2, 0, 0, 0], 2, 4),
+        ([1, 1, 2, 0, 0, 0, 0, 0, 0], 1, None),
+        ([0] * 9, 1, None),
+    ], ids=['player_1', 'player_2', 'blocked', 'empty'])
+    def test_find_winning_cell(self, board: List[BoardCell], player_id: PlayerIndex, expected_result: CellIndex | None) -> None:
+        assert find_winning_cell(to_bitboard(board), player_id) == expected_result
+
+
+class TestBase3Encoding:
+    @pytest.mark.parametrize('board, expected_result', [
+        ([0] * 9, 0),
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 1),
+        ([2, 0, 0, 0, 0, 0, 0, 0, 0], 2),
+        ([0, 1, 0, 0, 0, 0, 0, 0, 0], 3),
+        ([0, 0, 0, 0, 0, 0, 0, 0, 2], 2 * 3 ** 8),
+        ([2] * 9, 3 ** 9 - 1),
+    ], ids=['empty', 'player_1_cell_0', 'player_2_cell_0', 'player_1_cell_1', 'player_2_cell_8', 'all_player_2'])
+    def test_to_base3(self, board: List[BoardCell], expected_result: int) -> None:
+        assert to_base3(to_bitboard(board)) == expected_result
+
+    @pytest.mark.parametrize('board', [
+        [0] * 9,
+        [1, 0, 2, 0, 1, 0, 0, 0, 2],
+        [1, 2, 1, 2, 1, 2, 2, 1, 2],
+    ], ids=['empty', 'partial', 'full'])
+    def test_round_trip(self, board: List[BoardCell]) -> None:
+        assert from_bitboard(from_base3(to_base3(to_bitboard(board)))) == board
@@ -0,0 +1,46 @@
+import pytest
+from typing import List
+from src.utils.board_symmetry import (
+    transform_bitboard,
+    canonicalize,
+    to_canonical_cell,
+    from_canonical_cell,
+)
+from src.utils.bitboard import Bitboard, to_bitboard, from_bitboard, place
+from src.models.games import BoardCell
+
+
+class TestTransformBitboard:
+    @pytest.mark.parametrize('board, transform, expected_result', [
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 0, [1, 0, 0, 0, 0, 0, 0, 0, 0]),
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 1, [0, 0, 1, 0, 0, 0, 0, 0, 0]),
+        ([1, 2, 0, 0, 0, 0, 0, 0, 0], 2, [0, 0, 0, 0, 0, 0, 0, 2, 1]),
+        ([1, 2, 0, 0, 0, 0, 0, 0, 0], 4, [0, 2, 1, 0, 0, 0, 0, 0, 0]),
+        ([0, 2, 0, 0, 0, 0, 0, 0, 1], 6, [0, 0, 0, 2, 0, 0, 0, 0, 1]),
+    ], ids=['identity', 'rotate_90', 'rotate_180', 'mirror_left_right', 'mirror_diagonal'])
+    def test_transform_bitboard(self, board: List[BoardCell], transform: int, expected_result: List[BoardCell]) -> None:
+        assert from_bitboard(transform_bitboard(to_bitboard(board), transform)) == expected_result
+
+
+class TestCanonicalize:
+    @pytest.mark.parametrize('board', [
+        [1, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 0, 2, 0, 1, 0, 0, 0, 2],
+        [0, 1, 0, 2, 1, 0, 0, 0, 0],
+    ], ids=['corner', 'partial', 'edges'])
+    def test_equivalent_boards_share_canonical_form(self, board: List[BoardCell]) -> None:
+        bitboard: Bitboard = to_bitboard(board)
+        canonical_boards = {canonicalize(transform_bitboard(bitboard, t))[0] for t in range(8)}
+        assert len(canonical_boards) == 1
+
+    @pytest.mark.parametrize('board, cell_index', [
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 5),
+        ([0, 0, 0, 0, 0, 0, 0, 2, 1], 0),
+        ([0, 1, 0, 2, 1, 0, 0, 0, 0], 7),
+    ], ids=['corner', 'bottom_row', 'edges'])
+    def test_move_maps_back_through_inverse_transform(self, board: List[BoardCell], cell_index: int) -> None:
+        canonical, transform = canonicalize(to_bitboard(board))
+        canonical_cell: int = to_canonical_cell(cell_index, transform)
+
+        assert from_canonical_cell(canonical_cell, transform) == cell_index
+        assert transform_bitboard(place(to_bitboard(board), cell_index, 2), transform) == place(canonical, canonical_cell, 2)
@@ -0,0 +1,77 @@
+import pytest
+from typing import List
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState
+from tests.conftest import FakeClock
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        name='test',
+        failure_rate_threshold=0.5,
+        minimum_calls=4,
+        window_size=10,
+        open_seconds=30.0,
+        half_open_max_calls=1,
+        slow_call_seconds=1.0,
+        clock=clock,
+    )
+
+
+class TestCircuitBreaker:
+    @pytest.mark.parametrize('outcomes, expected_state', [
+        ([True, True, True, True], CircuitState.closed),
+        ([False, False, False], CircuitState.closed),
+        ([True, False, True, False], CircuitState.open),
+        ([False, False, False, False], CircuitState.open),
+    ], ids=['all_success', 'below_minimum_calls', 'threshold_reached', 'all_failures'])
+    def test_opens_on_failure_rate(self, breaker: CircuitBreaker, outcomes: List[bool], expected_state: CircuitState) -> None:
+        for ok in outcomes:
+            assert breaker.allow_request()
+            if ok:
+                breaker.record_success(0.1)
+            else:
+                breaker.record_failure(0.1)
+        assert breaker.state == expected_state
+
+    def test_slow_calls_count_as_failures(self, breaker: CircuitBreaker) -> None:
+        for _ in range(4):
+            breaker.record_success(2.0)
+        assert breaker.state == CircuitState.open
+
+    def test_open_rejects_until_half_open_probe(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        for _ in range(4):
+            breaker.record_failure(0.1)
+
+        assert not breaker.allow_request()
+        assert breaker.rejected_calls == 1
+
+        clock.now = 31.0
+        assert breaker.allow_request()
+        assert breaker.state == CircuitState.half_open
+        assert not breaker.allow_request()
+
+    @pytest.mark.parametrize('probe_ok, expected_state', [
+        (True, CircuitState.closed),
+        (False, CircuitState.open),
+    ], ids=['probe_success', 'probe_failure'])
+    def test_half_open_probe_result(self, breaker: CircuitBreaker, clock: FakeClock, probe_ok: bool, expected_state: CircuitState) -> None:
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        clock.now = 31.0
+        assert breaker.allow_request()
+
+        if probe_ok:
+            breaker.record_success(0.1)
+        else:
+            breaker.record_failure(0.1)
+
+        assert breaker.state == expected_state
+        assert [t['to'] for t in breaker.snapshot()['transitions']] == ['open', 'half_open', expected_state.value]
+
+    def test_latency_percentiles(self, breaker: CircuitBreaker) -> None:
+        for latency in [0.1, 0.2, 0.3, 0.4, 0.5]:
+            breaker.record_success(latency)
+        percentiles = breaker.latency_percentiles()
+        assert percentiles['p50'] == 0.3
+        assert percentiles['p99'] == 0.5
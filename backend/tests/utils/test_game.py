@@ -6,6 +6,7 @@ from src.utils.game import (
     validate_player_move,
     get_next_turn,
     check_game_winner_triplet,
+    get_winning_line_index,
     is_board_full,
     get_random_empty_cell
 )
@@ -97,6 +98,17 @@ class TestCheckGameWinnerTriplet:
         assert result == expected_result
 
 
+class TestGetWinningLineIndex:
+    @pytest.mark.parametrize('winning_triplet, expected_result', [
+        ([0, 1, 2], 0),
+        ([2, 5, 8], 5),
+        ([6, 4, 2], 7),
+        (None, None),
+    ], ids=['top_row', 'right_column', 'unsorted_anti_diagonal', 'no_winner'])
+    def test_get_winning_line_index(self, winning_triplet: List[CellIndex] | None, expected_result: int | None) -> None:
+        assert get_winning_line_index(winning_triplet) == expected_result
+
+
 class TestIsBoardFull:   
     @pytest.mark.parametrize('board, expected_result', [
         ([0] * 9, False),
@@ -0,0 +1,86 @@
+import pytest
+from typing import Any, Dict, List
+from beanie import PydanticObjectId
+from src.models.games import BoardCell, CellIndex, GameBase, GameSummary
+from src.utils.game_storage import (
+    to_board_code,
+    from_board_code,
+    encode_board_fields,
+    stale_board_fields,
+    expand_board_fields,
+    compact_board_fields,
+)
+
+
+WON_BOARD: List[BoardCell] = [1, 1, 1, 2, 2, 0, 0, 0, 0]
+WON_BOARD_CODE: int = 1 + 3 + 9 + 2 * 27 + 2 * 81
+
+
+class TestBoardCode:
+    @pytest.mark.parametrize('board, expected_result', [
+        ([0] * 9, 0),
+        (WON_BOARD, WON_BOARD_CODE),
+        ([2] * 9, 3 ** 9 - 1),
+    ], ids=['empty', 'won', 'all_player_2'])
+    def test_round_trip(self, board: List[BoardCell], expected_result: int) -> None:
+        assert to_board_code(board) == expected_result
+        assert from_board_code(expected_result) == board
+
+
+class TestEncodeBoardFields:
+    @pytest.mark.parametrize('winning_triplet, compact, expected_result', [
+        ([0, 1, 2], True, {'board_code': WON_BOARD_CODE, 'winning_line': 0}),
+        (None, True, {'board_code': WON_BOARD_CODE, 'winning_line': None}),
+        ([0, 1, 2], False, {'board': WON_BOARD, 'winning_triplet': [0, 1, 2]}),
+    ], ids=['compact', 'compact_no_winner', 'array'])
+    def test_encode_board_fields(self, winning_triplet: List[CellIndex] | None, compact: bool, expected_result: Dict[str, Any]) -> None:
+        assert encode_board_fields(WON_BOARD, winning_triplet, compact) == expected_result
+
+    @pytest.mark.parametrize('compact, expected_result', [
+        (True, {'board': '', 'winning_triplet': ''}),
+        (False, {'board_code': '', 'winning_line': ''}),
+    ], ids=['compact', 'array'])
+    def test_stale_board_fields(self, compact: bool, expected_result: Dict[str, str]) -> None:
+        assert stale_board_fields(compact) == expected_result
+
+
+class TestStorageFormats:
+    def test_expand_compact(self) -> None:
+        data: Dict[str, Any] = {'winner': 1, 'board_code': WON_BOARD_CODE, 'winning_line': 0}
+        assert expand_board_fields(data) == {'winner': 1, 'board': WON_BOARD, 'winning_triplet': [0, 1, 2]}
+
+    def test_compact_array(self) -> None:
+        data: Dict[str, Any] = {'winner': 1, 'board': WON_BOARD, 'winning_triplet': [0, 1, 2]}
+        assert compact_board_fields(data) == {'winner': 1, 'board_code': WON_BOARD_CODE, 'winning_line': 0}
+
+    @pytest.mark.parametrize('data', [
+        {'board': WON_BOARD, 'winning_triplet': None},
+        {'winner': None},
+    ], ids=['array', 'no_board'])
+    def test_expand_leaves_other_shapes(self, data: Dict[str, Any]) -> None:
+        assert expand_board_fields(data) is data
+
+    @pytest.mark.parametrize('stored', [
+        {'board': WON_BOARD, 'winning_triplet': [0, 1, 2]},
+        {'board_code': WON_BOARD_CODE, 'winning_line': 0},
+    ], ids=['array', 'compact'])
+    def test_models_read_both_formats(self, stored: Dict[str, Any]) -> None:
+        game: GameBase = GameBase.model_validate({
+            'matchup_id': PydanticObjectId(),
+            'current_turn': 2,
+            'is_finished': True,
+            'winner': 1,
+            **stored,
+        })
+        assert game.board == WON_BOARD
+        assert game.winning_triplet == [0, 1, 2]
+
+        summary: GameSummary = GameSummary.model_validate({
+            '_id': PydanticObjectId(),
+            'is_finished': True,
+            'winner': 1,
+            'created_at': '2025-01-01T00:00:00',
+            **stored,
+        })
+        assert summary.board_code == WON_BOARD_CODE
+        assert summary.winning_line == 0
@@ -0,0 +1,74 @@
+import pytest
+from src.utils.lru_cache import LRUCache
+from tests.conftest import FakeClock
+
+
+class TestLRUCache:
+    def test_get_and_put(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        assert cache.get('a') is None
+        cache.put('a', 1)
+        assert cache.get('a') == 1
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.stats()['evictions'] == 1
+
+    def test_invalidate(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put('a', 1)
+        cache.invalidate('a')
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize('max_size', [0, -1], ids=['zero', 'negative'])
+    def test_sad_max_size(self, max_size: int) -> None:
+        with pytest.raises(ValueError, match='Cache max size must be positive'):
+            LRUCache(max_size)
+
+
+class TestLRUCacheTTL:
+    def test_entries_expire(self, clock: FakeClock) -> None:
+        cache: LRUCache[str, int] = LRUCache(2, ttl_seconds=10, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 9.9
+        assert cache.get('a') == 1
+        clock.now = 10
+        assert cache.get('a') is None
+        assert 'a' not in cache
+        assert cache.stats()['expirations'] == 1
+        assert cache.stats()['misses'] == 1
+
+    @pytest.mark.parametrize('ttl_seconds, expected_result', [
+        (None, None),
+        (100, 1),
+    ], ids=['default_ttl', 'longer_ttl'])
+    def test_put_overrides_ttl(self, clock: FakeClock, ttl_seconds: float | None, expected_result: int | None) -> None:
+        cache: LRUCache[str, int] = LRUCache(2, ttl_seconds=10, clock=clock)
+        cache.put('a', 1, ttl_seconds=ttl_seconds)
+
+        clock.now = 50
+        assert cache.get('a') == expected_result
+
+    def test_no_ttl_never_expires(self, clock: FakeClock) -> None:
+        cache: LRUCache[str, int] = LRUCache(2, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 1e9
+        assert cache.get('a') == 1
+
+    @pytest.mark.parametrize('ttl_seconds', [0, -1], ids=['zero', 'negative'])
+    def test_sad_ttl(self, ttl_seconds: float) -> None:
+        with pytest.raises(ValueError, match='Cache TTL must be positive'):
+            LRUCache(2, ttl_seconds=ttl_seconds)
@@ -0,0 +1,67 @@
+import pytest
+import os
+from typing import List
+from src.utils.move_table import (
+    NO_MOVE,
+    encode_move_table,
+    decode_move,
+    write_move_table,
+    load_move_table,
+    unload_move_table,
+    lookup_move,
+)
+from src.utils.ai_solver import solve_best_move, get_perfect_move
+from src.utils.bitboard import BASE3_STATES, to_bitboard
+from src.models.games import BoardCell
+
+
+@pytest.fixture
+def move_table_path(temp_dir: str):
+    path: str = os.path.join(temp_dir, 'move_table.bin')
+    write_move_table(path, encode_move_table(solve_best_move))
+    yield path
+    unload_move_table()
+
+
+class TestEncodeMoveTable:
+    def test_entries_pack_both_players(self) -> None:
+        table: bytes = encode_move_table(lambda bitboard, player_id: 3 if player_id == 1 else None)
+        assert len(table) == BASE3_STATES
+        assert all(entry == (3 | NO_MOVE << 4) for entry in table)
+
+    @pytest.mark.parametrize('entry, player_id, expected_result', [
+        (0x54, 1, 4),
+        (0x54, 2, 5),
+        (0xF4, 2, None),
+        (0x4F, 1, None),
+    ], ids=['player_1', 'player_2', 'player_2_no_move', 'player_1_no_move'])
+    def test_decode_move(self, entry: int, player_id: int, expected_result: int | None) -> None:
+        assert decode_move(entry, player_id) == expected_result
+
+
+class TestLoadMoveTable:
+    @pytest.mark.parametrize('board, player_id', [
+        ([0] * 9, 1),
+        ([1, 0, 0, 0, 0, 0, 0, 0, 0], 2),
+        ([2, 0, 0, 0, 1, 0, 0, 0, 2], 1),
+        ([1, 1, 0, 2, 2, 0, 0, 0, 0], 2),
+    ], ids=['empty', 'corner_opening', 'fork_defence', 'win_now'])
+    def test_lookup_matches_solver(self, move_table_path: str, board: List[BoardCell], player_id: int) -> None:
+        assert load_move_table(move_table_path)
+        opponent_player_id: int = 2 if player_id == 1 else 1
+        assert lookup_move(to_bitboard(board), player_id) == solve_best_move(to_bitboard(board), player_id)
+        assert get_perfect_move(board, player_id, opponent_player_id) == lookup_move(to_bitboard(board), player_id)
+
+    def test_decided_position_has_no_move(self, move_table_path: str) -> None:
+        assert load_move_table(move_table_path)
+        assert lookup_move(to_bitboard([1, 1, 1, 2, 2, 0, 0, 0, 0]), 2) is None
+
+    def test_missing_file(self, temp_dir: str) -> None:
+        assert not load_move_table(os.path.join(temp_dir, 'missing.bin'))
+
+    @pytest.mark.parametrize('table', [b'', b'\x00' * 10], ids=['empty', 'short'])
+    def test_malformed_file(self, temp_dir: str, table: bytes) -> None:
+        path: str = os.path.join(temp_dir, 'malformed.bin')
+        write_move_table(path, table)
+        assert not load_move_table(path)
+        assert lookup_move(0, 1) is None
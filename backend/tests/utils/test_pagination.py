@@ -0,0 +1,29 @@
+import pytest
+from datetime import datetime, timezone
+from beanie import PydanticObjectId
+from src.exceptions import InvalidCursorError
+from src.utils.pagination import encode_cursor, decode_cursor
+
+
+class TestCursor:
+    @pytest.mark.parametrize('updated_at', [
+        datetime(2025, 1, 2, 3, 4, 5, 678000),
+        datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    ], ids=['naive', 'aware'])
+    def test_round_trip(self, updated_at: datetime) -> None:
+        item_id: PydanticObjectId = PydanticObjectId()
+        assert decode_cursor(encode_cursor(updated_at, item_id)) == (updated_at, item_id)
+
+    def test_cursor_is_url_safe(self) -> None:
+        cursor: str = encode_cursor(datetime(2025, 1, 1), PydanticObjectId())
+        assert all(c.isalnum() or c in '-_' for c in cursor)
+
+    @pytest.mark.parametrize('cursor', [
+        'not-a-cursor',
+        encode_cursor(datetime(2025, 1, 1), PydanticObjectId())[:-4],
+        'WyJub3QtYS1kYXRlIiwgIjEyMyJd',
+        'eyJhIjogMX0',
+    ], ids=['garbage', 'truncated', 'bad_values', 'wrong_shape'])
+    def test_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
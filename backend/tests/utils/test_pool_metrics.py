@@ -0,0 +1,50 @@
+from typing import Any, Dict, Tuple
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+)
+from src.utils.pool_metrics import PoolMetrics
+
+
+ADDRESS: Tuple[str, int] = ('localhost', 27017)
+
+
+class TestPoolMetrics:
+    def test_checkout_waits(self) -> None:
+        metrics: PoolMetrics = PoolMetrics()
+        for connection_id, duration in enumerate([0.001, 0.002, 0.003, 0.1]):
+            metrics.connection_checked_out(ConnectionCheckedOutEvent(ADDRESS, connection_id, duration))
+        metrics.connection_checked_in(ConnectionCheckedInEvent(ADDRESS, 0))
+
+        stats: Dict[str, Any] = metrics.stats()
+        assert stats['checkouts'] == 4
+        assert stats['connections_in_use'] == 3
+        assert stats['checkout_wait_ms']['max'] == 100
+        assert stats['checkout_wait_ms']['p50'] == 3
+        assert round(stats['checkout_wait_ms']['mean'], 6) == 26.5
+
+    def test_connection_churn(self) -> None:
+        metrics: PoolMetrics = PoolMetrics()
+        for connection_id in range(3):
+            metrics.connection_created(ConnectionCreatedEvent(ADDRESS, connection_id))
+        metrics.connection_closed(ConnectionClosedEvent(ADDRESS, 0, 'idle'))
+
+        stats: Dict[str, Any] = metrics.stats()
+        assert stats['connections_created'] == 3
+        assert stats['connections_closed'] == 1
+        assert stats['connections_open'] == 2
+
+    def test_checkout_failures(self) -> None:
+        metrics: PoolMetrics = PoolMetrics()
+        metrics.connection_check_out_failed(ConnectionCheckOutFailedEvent(ADDRESS, 'timeout', 5.0))
+
+        stats: Dict[str, Any] = metrics.stats()
+        assert stats['checkout_failures'] == {'timeout': 1}
+        assert stats['checkout_wait_ms']['max'] == 5000
+        assert stats['checkouts'] == 0
+
+    def test_empty(self) -> None:
+        assert PoolMetrics().stats()['checkout_wait_ms'] == {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
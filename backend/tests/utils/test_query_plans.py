@@ -0,0 +1,66 @@
+import pytest
+from typing import Any, Dict, List
+from src.utils.query_plans import iter_plan_stages, find_plan_problems
+
+
+INDEXED_PLAN: Dict[str, Any] = {
+    'stage': 'LIMIT',
+    'inputStage': {
+        'stage': 'FETCH',
+        'inputStage': {'stage': 'IXSCAN', 'indexName': 'matchup_id_created_at'},
+    },
+}
+
+COLLSCAN_SORT_PLAN: Dict[str, Any] = {
+    'stage': 'SORT',
+    'inputStage': {'stage': 'COLLSCAN'},
+}
+
+SBE_PLAN: Dict[str, Any] = {
+    'queryPlan': {'stage': 'SORT', 'inputStage': {'stage': 'COLLSCAN'}},
+    'slotBasedPlan': {'stages': '...'},
+}
+
+SHARDED_PLAN: Dict[str, Any] = {
+    'stage': 'SHARD_MERGE',
+    'shards': [
+        {'shardName': 'a', 'winningPlan': {'stage': 'IXSCAN'}},
+        {'shardName': 'b', 'winningPlan': {'stage': 'COLLSCAN'}},
+    ],
+}
+
+OR_PLAN: Dict[str, Any] = {
+    'stage': 'FETCH',
+    'inputStage': {'stage': 'OR', 'inputStages': [{'stage': 'IXSCAN'}, {'stage': 'IXSCAN'}]},
+}
+
+
+class TestIterPlanStages:
+    @pytest.mark.parametrize('plan, expected_result', [
+        (INDEXED_PLAN, ['LIMIT', 'FETCH', 'IXSCAN']),
+        (SBE_PLAN, ['SORT', 'COLLSCAN']),
+        (SHARDED_PLAN, ['SHARD_MERGE', 'IXSCAN', 'COLLSCAN']),
+        (OR_PLAN, ['FETCH', 'OR', 'IXSCAN', 'IXSCAN']),
+    ], ids=['classic', 'sbe', 'sharded', 'input_stages'])
+    def test_iter_plan_stages(self, plan: Dict[str, Any], expected_result: List[str]) -> None:
+        assert list(iter_plan_stages(plan)) == expected_result
+
+
+class TestFindPlanProblems:
+    @pytest.mark.parametrize('plan, expected_result', [
+        (INDEXED_PLAN, []),
+        (COLLSCAN_SORT_PLAN, ['q: in-memory sort (SORT)', 'q: collection scan (COLLSCAN)']),
+        (SHARDED_PLAN, ['q: collection scan (COLLSCAN)']),
+    ], ids=['indexed', 'collscan_and_sort', 'sharded'])
+    def test_find_plan_problems(self, plan: Dict[str, Any], expected_result: List[str]) -> None:
+        assert find_plan_problems('q', {'queryPlanner': {'winningPlan': plan}}) == expected_result
+
+    @pytest.mark.parametrize('plan, expected_result', [
+        ({'stage': 'PROJECTION_COVERED', 'inputStage': {'stage': 'IXSCAN'}}, []),
+        (INDEXED_PLAN, ['q: document fetch (FETCH)']),
+    ], ids=['covered', 'fetch'])
+    def test_find_plan_problems_covered(self, plan: Dict[str, Any], expected_result: List[str]) -> None:
+        assert find_plan_problems('q', {'queryPlanner': {'winningPlan': plan}}, covered=True) == expected_result
+
+    def test_missing_query_planner(self) -> None:
+        assert find_plan_problems('q', {}) == []
@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import HTTPException, Request
+
+from src.utils.rate_limit import RateLimiter
+from src.utils.sliding_window import SlidingWindowCounter, sliding_window_retry_after
+from tests.conftest import FakeClock
+
+
+def make_request(client_ip: str, path: str, route_path: str | None = None) -> Request:
+    scope: Dict[str, Any] = {
+        'type': 'http',
+        'method': 'GET',
+        'path': path,
+        'query_string': b'',
+        'headers': [],
+        'client': (client_ip, 12345),
+        'server': ('testserver', 80),
+        'scheme': 'http',
+    }
+    if route_path is not None:
+        scope['route'] = SimpleNamespace(path=route_path)
+    return Request(scope)
+
+
+class TestSlidingWindowRetryAfter:
+    @pytest.mark.parametrize(
+        'previous,current,elapsed,expected',
+        [
+            (0, 9, 0.0, None),
+            (10, 0, 30.0, None),
+            (10, 5, 30.0, 0.0),
+            (10, 5, 15.0, 15.0),
+            (0, 10, 15.0, 45.0),
+            (0, 20, 15.0, 75.0),
+        ],
+        ids=['under_limit', 'previous_half_decayed', 'exactly_at_limit', 'previous_decaying', 'current_full', 'current_over']
+    )
+    def test_retry_after(self, previous: int, current: int, elapsed: float, expected: float | None) -> None:
+        assert sliding_window_retry_after(previous, current, elapsed, 10, 60.0) == expected
+
+
+class TestSlidingWindowCounter:
+    def test_rejects_over_limit(self, clock: FakeClock) -> None:
+        counter: SlidingWindowCounter = SlidingWindowCounter(3, 60.0, clock)
+
+        results: List[float | None] = [counter.hit('a') for _ in range(4)]
+
+        assert results[:3] == [None, None, None]
+        assert results[3] == 60.0
+        assert counter.hit('b') is None
+        assert counter.stats()['allowed'] == 4
+        assert counter.stats()['rejected'] == 1
+
+    def test_previous_window_decays(self, clock: FakeClock) -> None:
+        counter: SlidingWindowCounter = SlidingWindowCounter(4, 60.0, clock)
+        for _ in range(4):
+            counter.hit('a')
+
+        clock.now = 60.0
+        assert counter.hit('a') is not None
+
+        clock.now = 90.0
+        assert counter.hit('a') is None
+        assert counter.hit('a') is None
+        assert counter.hit('a') is not None
+
+    def test_idle_keys_are_swept(self, clock: FakeClock) -> None:
+        counter: SlidingWindowCounter = SlidingWindowCounter(4, 60.0, clock)
+        for key in ['a', 'b', 'c']:
+            counter.hit(key)
+
+        clock.now = 60.0
+        counter.hit('a')
+        assert counter.stats()['current_window_keys'] == 1
+        assert counter.stats()['previous_window_keys'] == 3
+
+        clock.now = 120.0
+        assert counter.stats()['current_window_keys'] == 0
+        assert counter.stats()['previous_window_keys'] == 1
+
+        clock.now = 300.0
+        assert counter.stats()['previous_window_keys'] == 0
+
+    @pytest.mark.parametrize('max_requests,window_seconds', [(0, 60.0), (10, 0.0)], ids=['no_requests', 'no_window'])
+    def test_invalid_limits(self, max_requests: int, window_seconds: float) -> None:
+        with pytest.raises(ValueError):
+            SlidingWindowCounter(max_requests, window_seconds)
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_keys_on_url_path_by_default(self) -> None:
+        limiter: RateLimiter = RateLimiter('test', 1, 60.0)
+
+        await limiter(make_request('1.1.1.1', '/games/a', '/games/{game_id}'))
+        await limiter(make_request('1.1.1.1', '/games/b', '/games/{game_id}'))
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(make_request('1.1.1.1', '/games/a', '/games/{game_id}'))
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_keys_on_route_template(self) -> None:
+        limiter: RateLimiter = RateLimiter('test', 2, 60.0, key_on_template=True)
+
+        await limiter(make_request('1.1.1.1', '/games/a', '/games/{game_id}'))
+        await limiter(make_request('1.1.1.1', '/games/b', '/games/{game_id}'))
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(make_request('1.1.1.1', '/games/c', '/games/{game_id}'))
+
+        assert exc_info.value.status_code == 429
+        assert int(exc_info.value.headers['Retry-After']) >= 1
+        await limiter(make_request('2.2.2.2', '/games/c', '/games/{game_id}'))
+        await limiter(make_request('1.1.1.1', '/matchups/list', '/matchups/list'))
+
+    @pytest.mark.asyncio
+    async def test_template_falls_back_to_url_path(self) -> None:
+        limiter: RateLimiter = RateLimiter('test', 1, 60.0, key_on_template=True)
+
+        await limiter(make_request('1.1.1.1', '/a'))
+        await limiter(make_request('1.1.1.1', '/b'))
+        with pytest.raises(HTTPException):
+            await limiter(make_request('1.1.1.1', '/a'))
@@ -0,0 +1,74 @@
+import pytest
+from typing import List
+from beanie import PydanticObjectId
+from src.models.games import BoardCell
+from src.models.moves import MoveBase
+from src.utils.bitboard import from_bitboard, to_base3, to_bitboard
+from src.utils.replay import is_snapshot_ply, replay_board
+
+
+GAME_ID: PydanticObjectId = PydanticObjectId()
+
+
+def move(ply: int, player: int, cell: int, snapshot: List[BoardCell] | None = None) -> MoveBase:
+    return MoveBase(
+        game_id=GAME_ID,
+        ply=ply,
+        player=player,
+        cell=cell,
+        snapshot=to_base3(to_bitboard(snapshot)) if snapshot is not None else None,
+    )
+
+
+class TestIsSnapshotPly:
+    @pytest.mark.parametrize('ply, expected_result', [
+        (1, False),
+        (3, True),
+        (6, True),
+        (8, False),
+    ], ids=['first', 'third', 'sixth', 'eighth'])
+    def test_is_snapshot_ply(self, ply: int, expected_result: bool) -> None:
+        assert is_snapshot_ply(ply) == expected_result
+
+
+class TestReplayBoard:
+    def test_empty(self) -> None:
+        assert replay_board([]) == 0
+
+    def test_from_opening_move(self) -> None:
+        moves: List[MoveBase] = [move(1, 1, 4), move(2, 2, 0), move(3, 1, 8)]
+        assert from_bitboard(replay_board(moves)) == [2, 0, 0, 0, 1, 0, 0, 0, 1]
+
+    def test_from_snapshot(self) -> None:
+        moves: List[MoveBase] = [
+            move(3, 1, 8, snapshot=[2, 0, 0, 0, 1, 0, 0, 0, 1]),
+            move(4, 2, 2),
+            move(5, 1, 1),
+        ]
+        assert from_bitboard(replay_board(moves)) == [2, 1, 2, 0, 1, 0, 0, 0, 1]
+
+    def test_snapshot_only(self) -> None:
+        moves: List[MoveBase] = [move(3, 1, 8, snapshot=[2, 0, 0, 0, 1, 0, 0, 0, 1])]
+        assert from_bitboard(replay_board(moves)) == [2, 0, 0, 0, 1, 0, 0, 0, 1]
+
+    def test_up_to_ply(self) -> None:
+        moves: List[MoveBase] = [move(1, 1, 4), move(2, 2, 0)]
+        assert from_bitboard(replay_board(moves, 2)) == [2, 0, 0, 0, 1, 0, 0, 0, 0]
+
+    @pytest.mark.parametrize('moves', [
+        [move(2, 2, 0), move(3, 1, 8)],
+        [move(1, 1, 4), move(3, 1, 8)],
+        [move(3, 1, 8, snapshot=[2, 0, 0, 0, 1, 0, 0, 0, 1]), move(5, 1, 1)],
+    ], ids=['no_start', 'gap', 'gap_after_snapshot'])
+    def test_sad_replay_board(self, moves: List[MoveBase]) -> None:
+        with pytest.raises(ValueError, match='no snapshot|gap'):
+            replay_board(moves)
+
+    @pytest.mark.parametrize('moves, up_to_ply', [
+        ([move(1, 1, 4), move(2, 2, 0)], 3),
+        ([move(3, 1, 8, snapshot=[2, 0, 0, 0, 1, 0, 0, 0, 1])], 4),
+        ([], 2),
+    ], ids=['missing_last_move', 'missing_move_after_snapshot', 'empty_log'])
+    def test_sad_replay_board_short_log(self, moves: List[MoveBase], up_to_ply: int) -> None:
+        with pytest.raises(ValueError, match='expected'):
+            replay_board(moves, up_to_ply)
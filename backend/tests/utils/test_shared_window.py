@@ -0,0 +1,115 @@
+from pathlib import Path
+from typing import List
+import multiprocessing
+
+import pytest
+
+from src.utils.shared_window import SharedWindowCounter, SharedWindowTable, layout_path
+from tests.conftest import FakeClock
+
+
+def hit_from_worker(path: str, hits: int) -> int:
+    table: SharedWindowTable = SharedWindowTable(path, 64)
+    counter: SharedWindowCounter = SharedWindowCounter(table, 'test', 100, 3600.0)
+    for _ in range(hits):
+        counter.hit('1.1.1.1:/games/{game_id}')
+    table.close()
+    return counter.allowed
+
+
+class TestSharedWindowTable:
+    def test_rejects_over_limit(self, tmp_path: Path) -> None:
+        table: SharedWindowTable = SharedWindowTable(str(tmp_path / 'limits.bin'), 64)
+
+        results: List[float | None] = [table.hit('a', 3, 60.0, 0.0) for _ in range(4)]
+
+        assert results[:3] == [None, None, None]
+        assert results[3] == 60.0
+        assert table.hit('b', 3, 60.0, 0.0) is None
+
+    def test_previous_window_decays(self, tmp_path: Path) -> None:
+        table: SharedWindowTable = SharedWindowTable(str(tmp_path / 'limits.bin'), 64)
+        for _ in range(4):
+            table.hit('a', 4, 60.0, 0.0)
+
+        assert table.hit('a', 4, 60.0, 60.0) is not None
+        assert table.hit('a', 4, 60.0, 90.0) is None
+        assert table.hit('a', 4, 60.0, 90.0) is None
+        assert table.hit('a', 4, 60.0, 90.0) is not None
+        assert table.hit('a', 4, 60.0, 180.0) is None
+
+    def test_tables_on_one_path_share_counts(self, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'limits.bin')
+        first: SharedWindowTable = SharedWindowTable(path, 64)
+        second: SharedWindowTable = SharedWindowTable(path, 64)
+
+        first.hit('a', 2, 60.0, 0.0)
+        second.hit('a', 2, 60.0, 0.0)
+
+        assert first.hit('a', 2, 60.0, 0.0) is not None
+
+    def test_processes_share_one_limit(self, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'limits.bin')
+        SharedWindowTable(path, 64).close()
+
+        with multiprocessing.get_context('fork').Pool(4) as pool:
+            allowed: List[int] = pool.starmap(hit_from_worker, [(path, 50)] * 4)
+
+        assert sum(allowed) == 100
+
+    def test_idle_slots_are_reused(self, tmp_path: Path) -> None:
+        table: SharedWindowTable = SharedWindowTable(str(tmp_path / 'limits.bin'), 8, bucket_slots=8)
+        for key in range(8):
+            table.hit(f'old-{key}', 10, 60.0, 0.0)
+
+        for key in range(8):
+            table.hit(f'new-{key}', 10, 60.0, 120.0)
+
+        assert table.stats(120.0) == {'slots': 8, 'active_slots': 8, 'evictions': 0}
+
+    def test_full_bucket_evicts(self, tmp_path: Path) -> None:
+        table: SharedWindowTable = SharedWindowTable(str(tmp_path / 'limits.bin'), 8, bucket_slots=8)
+        for key in range(9):
+            table.hit(f'key-{key}', 10, 60.0, float(key))
+
+        assert table.stats(10.0)['evictions'] == 1
+
+    def test_other_layout_gets_own_file(self, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'limits.bin')
+        old: SharedWindowTable = SharedWindowTable(path, 64)
+        old.hit('a', 1, 60.0, 0.0)
+
+        new: SharedWindowTable = SharedWindowTable(path, 128)
+
+        assert new.path != old.path
+        assert new.hit('a', 1, 60.0, 0.0) is None
+        assert old.hit('a', 1, 60.0, 0.0) is not None
+
+    def test_sad_refuses_foreign_file(self, tmp_path: Path) -> None:
+        path: str = str(tmp_path / 'limits.bin')
+        layout_file: Path = Path(layout_path(path, 64, 8))
+        layout_file.write_bytes(b'garbage')
+
+        with pytest.raises(ValueError, match='another layout'):
+            SharedWindowTable(path, 64, 8)
+        assert layout_file.read_bytes() == b'garbage'
+
+    @pytest.mark.parametrize('slots,bucket_slots', [(0, 8), (12, 8), (8, 0)], ids=['no_slots', 'partial_bucket', 'no_bucket'])
+    def test_invalid_layout(self, tmp_path: Path, slots: int, bucket_slots: int) -> None:
+        with pytest.raises(ValueError):
+            SharedWindowTable(str(tmp_path / 'limits.bin'), slots, bucket_slots)
+
+
+class TestSharedWindowCounter:
+    def test_namespaces_limiters(self, clock: FakeClock, tmp_path: Path) -> None:
+        table: SharedWindowTable = SharedWindowTable(str(tmp_path / 'limits.bin'), 64)
+        default: SharedWindowCounter = SharedWindowCounter(table, 'default', 1, 60.0, clock)
+        auth: SharedWindowCounter = SharedWindowCounter(table, 'auth', 1, 60.0, clock)
+
+        assert default.hit('1.1.1.1:/auth/login') is None
+        assert auth.hit('1.1.1.1:/auth/login') is None
+        assert default.hit('1.1.1.1:/auth/login') is not None
+
+        assert default.stats()['allowed'] == 1
+        assert default.stats()['rejected'] == 1
+        assert default.stats()['table_active_slots'] == 2
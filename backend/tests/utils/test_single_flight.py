@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from typing import List
+from src.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_computation(self) -> None:
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        executions: List[int] = []
+
+        async def compute() -> int:
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        results: List[int] = await asyncio.gather(*[single_flight.do('key', compute) for _ in range(5)])
+
+        assert results == [42] * 5
+        assert len(executions) == 1
+        assert single_flight.stats() == {'calls': 5, 'deduplicated': 4, 'in_flight': 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_shared(self) -> None:
+        single_flight: SingleFlight[str, str] = SingleFlight()
+
+        async def compute(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        results: List[str] = await asyncio.gather(
+            single_flight.do('a', lambda: compute('a')),
+            single_flight.do('b', lambda: compute('b')),
+        )
+
+        assert results == ['a', 'b']
+        assert single_flight.stats()['deduplicated'] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self) -> None:
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        async def compute() -> int:
+            await asyncio.sleep(0)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(*[single_flight.do('key', compute) for _ in range(3)], return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_only_when_all_callers_cancel(self) -> None:
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        started: asyncio.Event = asyncio.Event()
+        release: asyncio.Event = asyncio.Event()
+
+        async def compute() -> int:
+            started.set()
+            await release.wait()
+            return 7
+
+        first: asyncio.Task[int] = asyncio.create_task(single_flight.do('key', compute))
+        second: asyncio.Task[int] = asyncio.create_task(single_flight.do('key', compute))
+        await started.wait()
+
+        first.cancel()
+        release.set()
+
+        assert await second == 7
+        assert first.cancelled()
@@ -20,10 +20,11 @@ export const authApi = createApi({
         body
       })
     }),
-    logout: builder.mutation<LogoutResponse, void>({
-      query: () => ({
+    logout: builder.mutation<LogoutResponse, string | null>({
+      query: refreshToken => ({
         url: '/auth/logout',
-        method: 'POST'
+        method: 'POST',
+        body: { refreshToken }
       })
     })
   })
@@ -2,9 +2,10 @@ import { fetchBaseQuery } from '@reduxjs/toolkit/query/react'
 import type { FetchBaseQueryError } from '@reduxjs/toolkit/query'
 import { API_BASE_URL } from '../constants/api'
 import type { RootState } from '../store'
-import { logout } from '../store/authSlice'
+import { logout, setTokens } from '../store/authSlice'
 import { clearMatchup } from '../store/matchupSlice'
 import { clearGame } from '../store/gameSlice'
+import type { RefreshResponse } from '../types/auth'
 
 const baseQuery = fetchBaseQuery({
   baseUrl: API_BASE_URL,
@@ -18,18 +19,61 @@ const baseQuery = fetchBaseQuery({
   }
 })
 
-export const baseQueryWithReauth = async (args: any, api: any, extraOptions: any) => {
+const REQUEST_TIMEOUT_MS = 15_000
+
+const baseQueryWithTimeout = async (args: any, api: any, extraOptions: any) => {
   const controller = new AbortController()
-  const timeoutId = setTimeout(() => controller.abort(), 15_000)
+  const timeoutId = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS)
 
-  let result
   try {
-    result = await baseQuery(args, api, { ...extraOptions, signal: controller.signal })
+    return await baseQuery(args, api, { ...extraOptions, signal: controller.signal })
   } finally {
     clearTimeout(timeoutId)
   }
-  
-  if (result.error && (result.error as FetchBaseQueryError).status === 401) {
+}
+
+const isUnauthorized = (result: { error?: unknown }): boolean =>
+  !!result.error && (result.error as FetchBaseQueryError).status === 401
+
+// Requests that must not trigger a token refresh when they fail with 401
+const isAuthRequest = (args: any): boolean =>
+  typeof args === 'object' && ['/auth/login', '/auth/register', '/auth/refresh'].includes(args.url)
+
+// Shared by every request that hits a 401 at the same time, so the refresh token is only used once
+let refreshInFlight: Promise<boolean> | null = null
+
+const refreshTokens = async (api: any, extraOptions: any): Promise<boolean> => {
+  const refreshToken = (api.getState() as RootState).auth.refreshToken
+  if (!refreshToken) {
+    return false
+  }
+
+  const result = await baseQueryWithTimeout(
+    { url: '/auth/refresh', method: 'POST', body: { refreshToken } },
+    api,
+    extraOptions
+  )
+  if (result.error || !result.data) {
+    return false
+  }
+
+  api.dispatch(setTokens(result.data as RefreshResponse))
+  return true
+}
+
+export const baseQueryWithReauth = async (args: any, api: any, extraOptions: any) => {
+  let result = await baseQueryWithTimeout(args, api, extraOptions)
+
+  if (isUnauthorized(result) && !isAuthRequest(args)) {
+    refreshInFlight ??= refreshTokens(api, extraOptions).finally(() => {
+      refreshInFlight = null
+    })
+    if (await refreshInFlight) {
+      result = await baseQueryWithTimeout(args, api, extraOptions)
+    }
+  }
+
+  if (isUnauthorized(result)) {
     api.dispatch(clearMatchup())
     api.dispatch(clearGame())
     api.dispatch(logout())
@@ -37,7 +81,6 @@ export const baseQueryWithReauth = async (args: any, api: any, extraOptions: any
       window.location.href = '/login'
     }
   }
-  
+
   return result
 }
-
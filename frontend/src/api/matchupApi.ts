@@ -1,9 +1,9 @@
 import { createApi } from '@reduxjs/toolkit/query/react'
 import type { UpdateResponse, MatchupMode } from '../types/matchup'
 import type { PlayerID } from '../types/players'
-import { normalizeResponse, normalizeMatchup } from '../utils/apiMappers'
+import { normalizeResponse, normalizeMatchupsPage } from '../utils/apiMappers'
 import { baseQueryWithReauth } from './baseQuery'
-import type { Matchup } from '../types/matchup'
+import type { MatchupsPage } from '../types/matchup'
 
 export const matchupApi = createApi({
   reducerPath: 'matchupApi',
@@ -47,9 +47,12 @@ export const matchupApi = createApi({
       transformResponse: (response: any): UpdateResponse => (normalizeResponse(response)),
       invalidatesTags: (_result, _error, arg) => [{ type: 'Matchup', id: arg.matchupId }]
     }),
-    getMatchupsList: builder.query<Matchup[], void>({
-      query: () => '/matchups/list',
-      transformResponse: (response: any): Matchup[] => (response.map((m: any) => normalizeMatchup(m))),
+    getMatchupsList: builder.query<MatchupsPage, { limit: number; cursor: string | null }>({
+      query: ({ limit, cursor }) => ({
+        url: '/matchups/list',
+        params: cursor ? { limit, cursor } : { limit }
+      }),
+      transformResponse: (response: any): MatchupsPage => (normalizeMatchupsPage(response)),
       providesTags: ['Matchup']
     })
   })
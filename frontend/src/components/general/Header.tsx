@@ -3,17 +3,19 @@ import MeetingRoomIcon from '@mui/icons-material/MeetingRoom'
 import HomeIcon from '@mui/icons-material/Home'
 import { useLocation, useNavigate, type Location, type NavigateFunction } from 'react-router-dom'
 import { useLogoutMutation } from '../../api/authApi'
+import { useAppSelector } from '../../store/hooks'
 
 const Header = () => {
     const location: Location = useLocation()
     const navigate: NavigateFunction = useNavigate()
     const [logout] = useLogoutMutation()
+    const refreshToken: string | null = useAppSelector(state => state.auth.refreshToken)
 
     const isLoginPage: boolean = location.pathname === '/login'
 
     const handleLogout = async () => {
         try {
-            await logout().unwrap()
+            await logout(refreshToken).unwrap()
         } catch (error) {
             console.error('Logout error:', error)
         }
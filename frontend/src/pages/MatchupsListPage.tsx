@@ -2,7 +2,7 @@ import React, { useState } from 'react'
 import { useGetMatchupsListQuery } from '../api/matchupApi'
 import { useLazyGetLastGameForMatchupQuery } from '../api/gameApi'
 import { Box, Typography, IconButton, type SvgIconProps } from '@mui/material'
-import { DataGrid, type GridColDef } from '@mui/x-data-grid'
+import { DataGrid, type GridColDef, type GridPaginationModel } from '@mui/x-data-grid'
 import type { Matchup } from '../types/matchup'
 import { DATE_TIME_FORMAT, DATE_TIME_FORMAT_OPTIONS } from '../constants/dateTime'
 import PeopleIcon from '@mui/icons-material/People'
@@ -16,13 +16,31 @@ import SnackbarAlert from '../components/general/SnackBarAlert'
 import { setMatchup } from '../store/matchupSlice'
 
 const MatchupsListPage: React.FC = () => {
-  const { data: matchupsList, isLoading, error } = useGetMatchupsListQuery()
+  const [paginationModel, setPaginationModel] = useState<GridPaginationModel>({ page: 0, pageSize: 9 })
+  // cursors[i] is the keyset cursor that loads page i; page 0 has none
+  const [cursors, setCursors] = useState<(string | null)[]>([null])
+  const { data: matchupsPage, isFetching, error } = useGetMatchupsListQuery({
+    limit: paginationModel.pageSize,
+    cursor: cursors[paginationModel.page] ?? null
+  })
   const [loadLastGame] = useLazyGetLastGameForMatchupQuery()
   const dispatch = useAppDispatch()
   const navigate = useNavigate()
 
   const [reloadError, setReloadError] = useState<string | null>(null)
 
+  const handlePaginationModelChange = (model: GridPaginationModel) => {
+    if (model.pageSize !== paginationModel.pageSize) {
+      setCursors([null])
+      setPaginationModel({ page: 0, pageSize: model.pageSize })
+      return
+    }
+    if (model.page > paginationModel.page && matchupsPage?.nextCursor) {
+      const nextCursor: string = matchupsPage.nextCursor
+      setCursors(prev => [...prev.slice(0, model.page), nextCursor])
+    }
+    setPaginationModel(model)
+  }
 
   const handleReloadMatchup = async (matchup: Matchup) => {
     try {
@@ -162,16 +180,16 @@ const MatchupsListPage: React.FC = () => {
 
       <Typography variant='h4' sx={{ mb: 2, textAlign: 'center' }}>Matchups List</Typography>
       <DataGrid
-        rows={matchupsList || []}
+        rows={matchupsPage?.items || []}
         columns={columns}
-        loading={isLoading}
+        loading={isFetching}
         getRowId={(row) => row.id}
         pageSizeOptions={[6, 9, 15, 24]}
-        initialState={{
-          pagination: {
-            paginationModel: { pageSize: 9 }
-          }
-        }}
+        paginationMode='server'
+        rowCount={-1}
+        paginationMeta={{ hasNextPage: Boolean(matchupsPage?.nextCursor) }}
+        paginationModel={paginationModel}
+        onPaginationModelChange={handlePaginationModelChange}
         sx={{ 
           '& .MuiDataGrid-cell:hover': { cursor: 'pointer' },
           width: '100%',
@@ -1,6 +1,6 @@
 import { createSlice, createAsyncThunk } from '@reduxjs/toolkit'
 import type { PayloadAction } from '@reduxjs/toolkit'
-import type { User, AuthResponse } from '../types/auth'
+import type { User, AuthResponse, RefreshResponse } from '../types/auth'
 import { authApi } from '../api/authApi'
 import { clearMatchup } from './matchupSlice'
 import { clearGame } from './gameSlice'
@@ -9,6 +9,7 @@ export interface AuthState {
   user: User | null
   isAuthenticated: boolean
   accessToken: string | null
+  refreshToken: string | null
 }
 
 const AUTH_STORAGE_KEY = 'auth'
@@ -18,7 +19,8 @@ const getInitialState = (): AuthState => {
     return {
       user: null,
       isAuthenticated: false,
-      accessToken: null
+      accessToken: null,
+      refreshToken: null
     }
   }
 
@@ -28,7 +30,8 @@ const getInitialState = (): AuthState => {
       return {
         user: null,
         isAuthenticated: false,
-        accessToken: null
+        accessToken: null,
+        refreshToken: null
       }
     }
 
@@ -37,13 +40,15 @@ const getInitialState = (): AuthState => {
     return {
       user: parsed.user ?? null,
       isAuthenticated: !!parsed.user,
-      accessToken: parsed.accessToken ?? null
+      accessToken: parsed.accessToken ?? null,
+      refreshToken: parsed.refreshToken ?? null
     }
   } catch {
     return {
       user: null,
       isAuthenticated: false,
-      accessToken: null
+      accessToken: null,
+      refreshToken: null
     }
   }
 }
@@ -59,22 +64,27 @@ export const logoutAndClearAll = createAsyncThunk(
   }
 )
 
-const applyAuth = (state: AuthState, payload: AuthResponse) => {
-  state.user = payload.user
-  state.isAuthenticated = true
-  state.accessToken = payload.accessToken ?? null
-
+const persistAuth = (state: AuthState) => {
   if (typeof window !== 'undefined') {
     window.localStorage.setItem(
       AUTH_STORAGE_KEY,
       JSON.stringify({
         user: state.user,
-        accessToken: state.accessToken
+        accessToken: state.accessToken,
+        refreshToken: state.refreshToken
       })
     )
   }
 }
 
+const applyAuth = (state: AuthState, payload: AuthResponse) => {
+  state.user = payload.user
+  state.isAuthenticated = true
+  state.accessToken = payload.accessToken ?? null
+  state.refreshToken = payload.refreshToken ?? null
+  persistAuth(state)
+}
+
 const authSlice = createSlice({
   name: 'auth',
   initialState,
@@ -83,6 +93,7 @@ const authSlice = createSlice({
       state.user = null
       state.isAuthenticated = false
       state.accessToken = null
+      state.refreshToken = null
 
       if (typeof window !== 'undefined') {
         window.localStorage.removeItem(AUTH_STORAGE_KEY)
@@ -91,6 +102,11 @@ const authSlice = createSlice({
     },
     setAuth: (state, action: PayloadAction<AuthResponse>) => {
       applyAuth(state, action.payload)
+    },
+    setTokens: (state, action: PayloadAction<RefreshResponse>) => {
+      state.accessToken = action.payload.accessToken
+      state.refreshToken = action.payload.refreshToken
+      persistAuth(state)
     }
   },
   extraReducers: builder => {
@@ -114,6 +130,7 @@ const authSlice = createSlice({
         state.user = null
         state.isAuthenticated = false
         state.accessToken = null
+        state.refreshToken = null
 
         if (typeof window !== 'undefined') {
           window.localStorage.removeItem(AUTH_STORAGE_KEY)
@@ -124,6 +141,6 @@ const authSlice = createSlice({
   }
 })
 
-export const { logout, setAuth } = authSlice.actions
+export const { logout, setAuth, setTokens } = authSlice.actions
 
 export default authSlice.reducer
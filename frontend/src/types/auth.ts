@@ -15,6 +15,13 @@ export interface User {
   export interface AuthResponse {
     user: User
     accessToken: string
+    refreshToken: string
+    tokenType: string
+  }
+
+  export interface RefreshResponse {
+    accessToken: string
+    refreshToken: string
     tokenType: string
   }
 
@@ -13,6 +13,11 @@ export interface Matchup {
     updatedAt: string
   }
 
+export interface MatchupsPage {
+    items: Matchup[]
+    nextCursor: string | null
+}
+
 export interface UpdateResponse {
     matchup: Matchup | null
     game: Game | null
@@ -1,6 +1,6 @@
 import { describe, it, expect } from 'vitest'
-import { normalizeResponse, normalizeGame, normalizeMatchup } from '../apiMappers'
-import type { UpdateResponse, Matchup } from '../../types/matchup'
+import { normalizeResponse, normalizeGame, normalizeMatchup, normalizeMatchupsPage } from '../apiMappers'
+import type { UpdateResponse, Matchup, MatchupsPage } from '../../types/matchup'
 import type { Game } from '../../types/game'
 
 
@@ -210,3 +210,47 @@ describe('normalizeResponse', () => {
   })
 })
 
+
+describe('normalizeMatchupsPage', () => {
+  it.each<[any, MatchupsPage]>([
+    [
+      {
+        items: [
+          {
+            _id: 'matchup123',
+            user_id: 'user123',
+            mode: 'friend',
+            player1_name: 'Player 1',
+            player1_score: 1,
+            player2_name: 'Player 2',
+            player2_score: 0,
+            created_at: '2024-01-01T00:00:00Z',
+            updated_at: '2024-01-02T00:00:00Z'
+          }
+        ],
+        next_cursor: 'abc'
+      },
+      {
+        items: [
+          {
+            id: 'matchup123',
+            userId: 'user123',
+            mode: 'friend',
+            player1: { id: 1, name: 'Player 1', score: 1 },
+            player2: { id: 2, name: 'Player 2', score: 0 },
+            createdAt: '2024-01-01T00:00:00Z',
+            updatedAt: '2024-01-02T00:00:00Z'
+          }
+        ],
+        nextCursor: 'abc'
+      }
+    ],
+    [
+      { items: [], next_cursor: null },
+      { items: [], nextCursor: null }
+    ],
+  ])('should normalize matchups page', (input: any, expected: MatchupsPage) => {
+    const result: MatchupsPage = normalizeMatchupsPage(input)
+    expect(result).toEqual(expected)
+  })
+})
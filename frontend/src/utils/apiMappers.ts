@@ -1,4 +1,4 @@
-import type { Matchup, UpdateResponse } from '../types/matchup'
+import type { Matchup, MatchupsPage, UpdateResponse } from '../types/matchup'
 import type { Game } from '../types/game'
 
 export const normalizeResponse = (response: any): UpdateResponse => ({
@@ -27,3 +27,8 @@ export const normalizeMatchup = (m: any): Matchup => ({
     createdAt: m.created_at,
     updatedAt: m.updated_at
 })
+
+export const normalizeMatchupsPage = (p: any): MatchupsPage => ({
+    items: p.items.map((m: any) => normalizeMatchup(m)),
+    nextCursor: p.next_cursor ?? null
+})